@@ -8,22 +8,30 @@ Created on Mon Jan 29 13:14:20 2024
 
 import csv
 import json
-import sqlite3
 import logging
-import codecs
+import gc
+import mmap
 import subprocess
 import os
 
-from dataclasses import asdict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, IO
 import jsonpickle
-from pymongo import MongoClient
 from tqdm import tqdm
 
 from .classesASTERIX import classcategory21
 from .classesASTERIX import classcategory48
 from .classesASTERIX import classmodes
 from .classesASTERIX import meteotool
+from .classesASTERIX import columns
+from .classesASTERIX import scanner
+from .classesASTERIX import index
+from .classesASTERIX import mongo
+from .classesASTERIX.scanner import fspec_mask
+from .classesASTERIX.cache import DecodeCache
+from .classesASTERIX.sqlite import SQLiteSink
+from .classesASTERIX.serialize import to_dict, to_row
+from .classesASTERIX.octets import to_octets
 
 
 
@@ -143,6 +151,189 @@ def ast_to_hex(filename: str, message_list: [], save_file: bool = False):
             print(f"\nError reading the file: {e}\n")
 
 
+##############################################################################
+# Decode .ast file (binary) record by record, without hexadecimal conversion.
+
+#########################################
+###  [1.1] Stream .ast file decoding  ###
+#########################################
+
+def iter_ast_file(filename: str, categories: [] = (21, 48), lazy: bool = False,
+                  items: [] = None):
+    """
+    Generator that memory-maps a binary .ast file and yields its messages
+    decoded, one at a time. Messages are framed by their CAT/LEN header (as
+    in ast_to_hex) and decoded directly from the octets, so memory use does
+    not grow with the file size and the file is read in a single pass.
+    Messages that cannot be decoded are written to the error log and skipped.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the .ast file to read.
+    categories : list (optional)
+        Categories to decode, the rest are skipped. Default = (21, 48)
+    lazy : bool (optional)
+        Decode the items of each record only when they are first read (see 
+        decode_message). Default = False
+    items : list (optional)
+        Names of the items to decode (e.g. ['item130', 'item145']); the rest 
+        are skipped by their length, without decoding them. Default = None (all)
+
+    Yields
+    ------
+    message_asterix : AsterixMessage object
+        ASTERIX decoded message. Its content depends on the category.
+
+    """
+    message_classes = {21: classcategory21.AsterixMessage,
+                       48: classcategory48.AsterixMessage}
+    try:
+        with open(filename, 'rb') as file1:
+            if os.fstat(file1.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(file1.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                size = len(data)
+                offset = 0
+                while offset + 3 <= size:
+                    cat = data[offset]
+                    length = int.from_bytes(data[offset+1:offset+3], 'big')
+                    if length < 3 or offset + length > size:
+                        logging.error(f'Corrupted or truncated message at octet {offset}\n')
+                        break
+
+                    if cat in categories and cat in message_classes:
+                        record = data[offset:offset+length]
+                        message_asterix = message_classes[cat](cat, length, record, 3, lazy, items)
+                        try:
+                            message_asterix.add_blocks()
+                        except (ValueError, TypeError) as e:
+                            logging.error(f'Message decoded with error: {record.hex().upper()}\n')
+                            logging.error(f'Error: {e}\n')
+                        else:
+                            yield message_asterix
+                    else:
+                        logging.error(f'Message not decoded: {data[offset:offset+length].hex().upper()}\n')
+
+                    offset += length
+
+    except FileNotFoundError:
+        print(f"\nFile {filename} not found.\n")
+
+
+##############################################################################
+# Scan a recording (.ast or hex) with the CAT, LEN and FSPEC only.
+
+##################################
+###  [1.2] Header-only scan  ###
+##################################
+
+def scan_file(filename: str, categories: [] = (21, 48), binary: bool = None):
+    """
+    Walk a recording using only the CAT octet, the LEN field and the FSPEC of
+    its records, without decoding any item: the length of each record is
+    found from the lengths of the items its FSPEC announces. Useful to know
+    what is in a file (counts, categories, items present) before decoding it.
+    Data blocks that cannot be scanned (and lines that are not hexadecimal)
+    are written to the error log.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file: binary .ast or hexadecimal messages (one per line).
+    categories : list (optional)
+        Categories to scan, the rest are skipped. Default = (21, 48)
+    binary : bool (optional)
+        True for binary .ast files, False for hexadecimal files.
+        Default = None (True if filename ends with .ast)
+
+    Returns
+    -------
+    records : dict
+        NumPy arrays with one element per record, in file order:
+        'block' (offset of the data block in the file; of its line on
+        hexadecimal files), 'position' (octet of the record in the data
+        block), 'length' (octets of the record), 'cat' and 'fspec'
+        (left-aligned to 64 bits, test items with fspec_mask).
+
+    """
+    if binary is None:
+        binary = filename.lower().endswith('.ast')
+
+    scan = scanner.RecordScan(categories)
+    try:
+        for info, start, block_offset in scanner.iter_data_blocks(filename, binary):
+            scan.add_data_block(info, start, block_offset)
+
+        if scan.errors:
+            print(f"\nData blocks not scanned: {scan.errors} (see log)\n")
+
+        return scan.to_arrays()
+
+    except FileNotFoundError:
+        print(f"\nFile {filename} not found.\n")
+
+    except Exception as e:
+        print(f"\nError reading the file: {e}\n")
+
+
+##############################################################################
+# Index a recording (.ast or hex) to decode only the records of a time range,
+# an aircraft...
+
+###################################
+###  [1.3] Indexed recordings  ###
+###################################
+
+def open_indexed(filename: str, categories: [] = (21, 48), binary: bool = None,
+                 rebuild: bool = False):
+    """
+    Open a recording through its record index, a sidecar file next to it
+    (<filename>.idx.npz) that keeps, per record, its offset, category, SAC/SIC
+    (item010), time of day (CAT21 item071 or item073, CAT48 item140) and
+    target address (CAT21 item080, CAT48 item220). The index is built the
+    first time (decoding only those items) and again if the recording
+    changes.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file: binary .ast or hexadecimal messages (one per line).
+    categories : list (optional)
+        Categories to index when it is built. Default = (21, 48)
+    binary : bool (optional)
+        True for binary .ast files, False for hexadecimal files.
+        Default = None (True if filename ends with .ast)
+    rebuild : bool (optional)
+        Build the index again even if it is up to date. Default = False
+
+    Returns
+    -------
+    recording : RecordIndex object
+        Use recording.query(time_range=(start, end), icao='3C6586') to decode
+        only the matching records (AsterixMessage list, one per record), or
+        recording.select(...) to get their numbers.
+
+    """
+    if binary is None:
+        binary = filename.lower().endswith('.ast')
+
+    try:
+        recording = None if rebuild else index.RecordIndex.load(filename)
+        if recording is None:
+            recording = index.RecordIndex.build(filename, binary, categories)
+            recording.save()
+            print(f'\nIndex saved on: {index.index_path(filename)}\n')
+        return recording
+
+    except FileNotFoundError:
+        print(f"\nFile {filename} not found.\n")
+
+    except Exception as e:
+        print(f"\nError indexing the file: {e}\n")
+
+
 ##############################################################################
 # Split huge files into equal lines number files
 
@@ -200,16 +391,31 @@ def split_file(input_file, prefix, number_lines = 0, path = os.getcwd()):
 ###  [2] Decode ASTERIX message  ####
 #####################################
 
-def decode_message(message: str, verbose: bool = True):
+def decode_message(message, verbose: bool = True, lazy: bool = False, items: [] = None,
+                   cache: Any = None):
     """
-    Decode one message in string type from hexadecimal. 
+    Decode one message, given as a hexadecimal string or as raw octets. 
         
     Parameters
     ----------
-    message : str
-        String containing de ASTERIX message on hexadecimal format. 
+    message : str, bytes, bytearray or memoryview
+        ASTERIX message on hexadecimal format or its raw octets (e.g. read
+        directly from a .ast recording). 
     verbose : bool
         Print decode success/failure
+    lazy : bool (optional)
+        Only parse the FSPEC and keep the offset of every present item; each 
+        fixed-length item is decoded the first time it is read (e.g. 
+        block.item130.latitude). Variable-length items are still decoded 
+        to find where the next item starts. Default = False
+    items : list (optional)
+        Names of the items to decode (e.g. ['item130', 'item145']); the rest 
+        are skipped by their length, without decoding them. Default = None (all)
+    cache : DecodeCache object (optional)
+        LRU cache of decoded messages, keyed by the message octets (and lazy/
+        items). A message already in the cache is not decoded again: the 
+        cached object is returned, shared, so it must not be modified. 
+        Default = None
         
     Returns
     -------
@@ -220,15 +426,24 @@ def decode_message(message: str, verbose: bool = True):
     """
     try:
         message_asterix = None
+        message = to_octets(message)
         cat, length, count_octets = get_catlen(message)
         #print("CAT: {} | LEN: {}".format(cat, length))
+        
+        if cache is not None:
+            key = cache.message_key(message, lazy, items)
+            message_asterix = cache.get(key)
+            if message_asterix is not None:
+                if verbose:
+                    print("\nMessage decoded!")
+                return message_asterix
     
         if cat == 21:
-            message_asterix = classcategory21.AsterixMessage(cat, length, message, count_octets)
+            message_asterix = classcategory21.AsterixMessage(cat, length, message, count_octets, lazy, items)
             message_asterix.add_blocks()
             
         elif cat == 48:
-            message_asterix = classcategory48.AsterixMessage(cat, length, message, count_octets)
+            message_asterix = classcategory48.AsterixMessage(cat, length, message, count_octets, lazy, items)
             message_asterix.add_blocks()
             
         else:
@@ -237,6 +452,9 @@ def decode_message(message: str, verbose: bool = True):
                 
             return None
         
+        if cache is not None:
+            cache.put(key, message_asterix)
+            
         if verbose:
             print("\nMessage decoded!")
             
@@ -255,8 +473,8 @@ def get_catlen(line):
         
     Parameters
     ----------
-    line : str
-        String containing de ASTERIX message on hexadecimal format. 
+    line : str, bytes, bytearray or memoryview
+        ASTERIX message on hexadecimal format or its raw octets. 
         
     Returns
     -------
@@ -265,23 +483,15 @@ def get_catlen(line):
     asterix_len : int
         ASTERIX message length.
     count_octets : int
-        Number of hexadecimal octets read.
+        Number of octets read.
     
     """
-    base = 16
-    catlen_format = [1,2]
-    message = []
-    count_item = 0
-    count_octets = 0
-    catlen_format = [1,2]
-    while count_item < 2:
-        message.append(line[count_octets*2:count_octets*2+catlen_format[count_item]*2])
-        count_octets += catlen_format[count_item]
-        count_item += 1
+    if isinstance(line, str):
+        line = to_octets(line[:6])
     
-    asterix_cat = int(message[0], base)
-    asterix_len = int(message[1], base)
-    count_octets = count_item + 1
+    asterix_cat = line[0]
+    asterix_len = int.from_bytes(line[1:3], 'big')
+    count_octets = 3
     return asterix_cat, asterix_len, count_octets
 
 
@@ -293,23 +503,38 @@ def get_catlen(line):
 ###  [3.1] Decode ASTERIX messages list (file)  ####
 ####################################################
 
-def decode_file(filename: str, cat: int):
+def decode_file(filename: str, cat: int, lazy: bool = False, items: [] = None,
+                workers: int = 1, cache: Any = None):
     """
     Decode file with messages and return items values (object). Decoded into variable
     object type Category21 or Category48 (more categories will be added as they are developed).
-        
+
     Parameters
     ----------
     filename : str
-        Name of the file to read hexadecimal messages. 
+        Name of the file to read hexadecimal messages.
     cat : int
         Category to be decoded.
-        
+    lazy : bool (optional)
+        Decode the items of each record only when they are first read (see
+        decode_message). Default = False
+    items : list (optional)
+        Names of the items to decode (e.g. ['item130', 'item145']); the rest
+        are skipped by their length, without decoding them. Default = None (all)
+    workers : int (optional)
+        Number of processes. If greater than 1, the file is split by octet
+        offset at line boundaries and the parts are decoded in parallel;
+        messages keep the order of the file. Default = 1
+    cache : DecodeCache object (optional)
+        LRU cache of decoded messages (see decode_message); repeated messages 
+        are decoded once and share the same object. Not used with 
+        workers > 1. Default = None
+
     Returns
     -------
     messages_asterix : CategoryXX object (XX = category)
-        ASTERIX decoded messages list object. Its content depends on the category.      
-    
+        ASTERIX decoded messages list object. Its content depends on the category.
+
     """
     messages_asterix = None
     if cat == 21:
@@ -319,7 +544,11 @@ def decode_file(filename: str, cat: int):
     else:
         print(f"\nError: CAT{cat} not implemented yet\n")
         return None
-    
+
+    if workers > 1:
+        return decode_file_parallel(filename, cat, messages_asterix, lazy, items,
+                                    workers)
+
     try:
         with open(filename, 'r') as file1:
             
@@ -330,12 +559,20 @@ def decode_file(filename: str, cat: int):
             for line in tqdm(file1, total=total_lines, desc="Progress", 
                              unit=" messages"):
         
-                asterix_cat, asterix_len, count_octets = get_catlen(line)
-                info = line
+                try:
+                    info = to_octets(line)
+                    asterix_cat, asterix_len, count_octets = get_catlen(info)
+                except (ValueError, IndexError) as e:
+                    # Not hexadecimal or shorter than the header
+                    print(f"Error: {e}")
+                    logging.error(f'Message not decoded: {line}\n')
+                    logging.error(f'Error: {e}\n')
+                    continue
                 if asterix_cat == cat:
                     try:
                         messages_asterix.add_message(
-                            asterix_cat, asterix_len, info, count_octets, num_line
+                            asterix_cat, asterix_len, info, count_octets, num_line,
+                            lazy, items, cache
                         )
                         #print("Valid CAT and Len")
                     except ValueError as e:
@@ -361,21 +598,178 @@ def decode_file(filename: str, cat: int):
         
     except Exception as e:
         print(f"\nError reading the file: {e}\n")
-    
-    
-    
+
+
+##############################################################################
+# Parallel decoding: the file is split into parts by octet offset (at line
+# boundaries), each part is decoded in a worker process and the results are
+# merged in file order.
+
+def split_file_offsets(filename: str, parts: int):
+    """
+    Octet offsets that split a hexadecimal messages file into (at most) parts
+    ranges of similar size, every range starting at the beginning of a line.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file with hexadecimal messages (one per line).
+    parts : int
+        Number of ranges.
+
+    Returns
+    -------
+    offsets : list
+        Sorted offsets, from 0 to the file size; range i is
+        [offsets[i], offsets[i+1]).
+
+    """
+    size = os.path.getsize(filename)
+    offsets = [0]
+    with open(filename, 'rb') as file1:
+        for i in range(1, parts):
+            position = size * i // parts
+            if position <= offsets[-1]:
+                continue
+            # Move to the start of the line after the one holding position-1
+            file1.seek(position - 1)
+            file1.readline()
+            position = file1.tell()
+            if offsets[-1] < position < size:
+                offsets.append(position)
+    offsets.append(size)
+    return offsets
+
+
+def decode_file_range(filename: str, cat: int, start: int, end: int,
+                      lazy: bool = False, items: [] = None):
+    """
+    Decode the lines of a file that start between octets start and end (worker
+    of decode_file with workers > 1). Errors are only written to the log.
+
+    Returns
+    -------
+    messages_asterix : CategoryXX object (XX = category)
+        ASTERIX decoded messages of the range.
+    lines : int
+        Number of lines read.
+    errors : int
+        Number of messages decoded with error.
+
+    """
+    if cat == 21:
+        messages_asterix = classcategory21.Category21()
+    else:
+        messages_asterix = classcategory48.Category48()
+
+    lines = 0
+    errors = 0
+    num_line = 0
+    with open(filename, 'rb') as file1:
+        file1.seek(start)
+        position = start
+        while position < end:
+            line = file1.readline()
+            if not line:
+                break
+            position += len(line)
+            lines += 1
+            line = line.decode()
+
+            try:
+                info = to_octets(line)
+                asterix_cat, asterix_len, count_octets = get_catlen(info)
+            except (ValueError, IndexError) as e:
+                errors += 1
+                logging.error(f'Message not decoded: {line}\n')
+                logging.error(f'Error: {e}\n')
+                continue
+            if asterix_cat == cat:
+                try:
+                    messages_asterix.add_message(
+                        asterix_cat, asterix_len, info, count_octets, num_line,
+                        lazy, items
+                    )
+                except (ValueError, TypeError) as e:
+                    errors += 1
+                    logging.error(f'Message decoded with error: {line}\n')
+                    logging.error(f'Error: {e}\n')
+
+                messages_asterix.add_count()
+                num_line += 1
+            else:
+                logging.error(f'Message not decoded: {line}\n')
+
+    return messages_asterix, lines, errors
+
+
+def decode_file_parallel(filename: str, cat: int, messages_asterix: Any,
+                         lazy: bool, items: [], workers: int):
+    """
+    Decode file with messages in workers processes (see decode_file).
+    Progress and errors are added up over all the parts. The decoded messages
+    are sent back to this process (pickled), which takes a part of the time
+    saved: the gain is larger with items or lazy.
+
+    """
+    # Rebuilding the received objects triggers the garbage collector over and
+    # over (only new objects, no cycles to free): paused while merging
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(filename, 'r') as file1:
+            total_lines = sum(1 for line in file1)
+
+        # Several parts per worker, to balance the load and update progress
+        offsets = split_file_offsets(filename, workers * 4)
+        starts = offsets[:-1]
+        ends = offsets[1:]
+        n = len(starts)
+
+        errors = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(decode_file_range, [filename] * n, [cat] * n,
+                                   starts, ends, [lazy] * n, [items] * n)
+            with tqdm(total=total_lines, desc="Progress", unit=" messages") as progress:
+                # Results come back in file order
+                for messages_range, lines, errors_range in results:
+                    messages_asterix.messages.extend(messages_range.messages)
+                    messages_asterix.count += messages_range.count
+                    errors += errors_range
+                    progress.update(lines)
+
+        print("\n\nMessages decoded!\n")
+        if errors:
+            print(f"Messages decoded with error: {errors} (see log)\n")
+
+        return messages_asterix
+
+    except FileNotFoundError:
+        print(f"\nFile {filename} not found.\n")
+
+    except Exception as e:
+        print(f"\nError reading the file: {e}\n")
+
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+
 ##############################################################################
-# Decode file with messages on hex and dump results to JSON file without saving 
+# Decode file with messages on hex and dump results to JSON file without saving
 # it as variable
 
 ################################################################
 ###  [3.2] Decode ASTERIX messages list (file) to JSON file  ###
 ################################################################
 
-def decode_file_to_json (input_file: str, output_file: str):
+def decode_file_to_json (input_file: str, output_file: str, items: [] = None,
+                         append: bool = False):
     """
     Decode file with messages and dump results to JSON file without saving 
-    it as variable.
+    it as variable. Newline-delimited JSON (NDJSON): one compact JSON object
+    per record (block) and line, read back with iter_ndjson.
         
     Parameters
     ----------
@@ -383,25 +777,28 @@ def decode_file_to_json (input_file: str, output_file: str):
         Name of the file to read hexadecimal messages. 
     output_file : str
         Name of JSON file to dump decoded messages. 
+    items : list (optional)
+        Names of the items to decode and dump (e.g. ['item130', 'item145']); 
+        the rest are skipped by their length, without decoding them. 
+        Default = None (all)
+    append : bool (optional)
+        Add the records at the end of output_file instead of overwriting it.
+        Default = False
         
     """
     try:
         with open(input_file, 'r') as file1:
             
-            with codecs.open(output_file, 'w', encoding='utf-8') as file2:
+            with open(output_file, 'a' if append else 'w', encoding='utf-8') as file2:
             
                 total_lines = sum(1 for line in file1)
                 file1.seek(0)
         
-                file2.write('[')
                 for line in tqdm(file1, total=total_lines, desc="Progress", unit=" messages"):
-                    message = decode_message(line, verbose = False)
+                    message = decode_message(line, verbose = False, items = items)
                     
                     if message is not None:
                         dump_message_to_json(file2, message)
-                    
-                file2.seek(-2, 1)
-                file2.write('\n]')
                 
         print("\nMessages decoded!")   
         print(f'\nDumped object to: {output_file}\n')     
@@ -422,10 +819,14 @@ def decode_file_to_json (input_file: str, output_file: str):
 ###  [3.3] Decode ASTERIX messages list (file) to csv file  ###
 ###############################################################
 
-def decode_file_to_csv(input_file: str, output_file: str):
+def decode_file_to_csv(input_file: str, output_file: str, items: [] = None):
     """
     Decode file with messages and dump results to csv file without saving 
-    it as variable.
+    it as variable. One row per record and one column per item field, named
+    'item.field' (e.g. 'item130.latitude'); repetitive fields (e.g. item250 
+    BDS registers) in one column as JSON. Fields of absent items are empty.
+    Only messages of the category of the first message are dumped (the rest 
+    are written to the log).
         
     Parameters
     ----------
@@ -433,12 +834,14 @@ def decode_file_to_csv(input_file: str, output_file: str):
         Name of the file to read hexadecimal messages. 
     output_file : str
         Name of csv file to dump decoded messages. 
+    items : list (optional)
+        Names of the items to decode and dump (e.g. ['item130', 'item145']); 
+        the rest are skipped by their length, without decoding them. 
+        Default = None (all)
         
     """
     try:         
-        j = 0
-        data_dict = {}
-        first_mess = True
+        layout = None
         with open(input_file, 'r') as file1:
             
             with open(output_file, 'w', newline='') as file2:
@@ -451,30 +854,22 @@ def decode_file_to_csv(input_file: str, output_file: str):
                 for line in tqdm(file1, total=total_lines, desc="Progress", 
                                  unit=" messages"):
                     
-                    message_aux = decode_message(line, verbose = False)
-                    
-                    if message_aux is not None:
-                       
-                        for j in range(len(message_aux.blocks)):
-                            
-                            message = message_aux.blocks[j]
-                            attribute_items = list(message.__dict__.keys())
-                            
-                            for item in attribute_items[1:]:
-                                value = getattr(message, item)
-                                if value.exist: 
-                                    data_dict[item] = asdict(value)
-                                else:
-                                    data_dict[item] = None
-                                    
-                        json_object = json.dumps(data_dict, indent=8)
-                        json_content = json.loads(json_object)
-                        if first_mess:
-                            csv_writer.writerow(json_content.keys())
-                            first_mess = False
+                    message_aux = decode_message(line, verbose = False, items = items)
                     
-                        csv_writer.writerow(json_content.values())
-                        data_dict = {}
+                    if message_aux is not None and message_aux.blocks:
+                        
+                        block_class = type(message_aux.blocks[0])
+                        if layout is None:
+                            header_class = block_class
+                            layout = columns.RowLayout(block_class, items)
+                            csv_writer.writerow(layout.header)
+                        
+                        if block_class is not header_class:
+                            logging.error(f'Message not dumped (CAT{message_aux.cat}): {line}\n')
+                            continue
+                        
+                        csv_writer.writerows(layout.row(block) 
+                                             for block in message_aux.blocks)
         print("\nMessages decoded!")   
         print(f'\nDumped object to: {output_file}\n')     
 
@@ -496,7 +891,8 @@ def decode_file_to_csv(input_file: str, output_file: str):
 
 def var_to_csv(csv_file: str, messages_list: Any):
     """
-    Dump decoded CategoryXX object to csv file. (XX = category)
+    Dump decoded CategoryXX object to csv file. (XX = category) One row per 
+    record and one column per item field (see decode_file_to_csv).
         
     Parameters
     ----------
@@ -507,39 +903,23 @@ def var_to_csv(csv_file: str, messages_list: Any):
         
     """
     try:
-        j = 0
-        data_dict = {}
-        first_mess = True
+        if isinstance(messages_list, classcategory21.Category21):
+            layout = columns.RowLayout(classcategory21.BlockCat21)
+        else:
+            layout = columns.RowLayout(classcategory48.BlockCat48)
             
         with open(csv_file, 'w', newline='') as file1:
                 
             csv_writer = csv.writer(file1)
+            csv_writer.writerow(layout.header)
                 
             total_lines = messages_list.count
         
             for message_aux in tqdm(messages_list.messages, total=total_lines, 
                              desc="Progress", unit=" messages"):
         
-                for j in range(len(message_aux.blocks)):
-                            
-                    message = message_aux.blocks[j]
-                    attribute_items = list(message.__dict__.keys())
-                    
-                    for item in attribute_items[1:]:
-                        value = getattr(message, item)
-                        if value.exist: 
-                            data_dict[item] = asdict(value)
-                        else:
-                            data_dict[item] = None
-                            
-                json_object = json.dumps(data_dict, indent=8)
-                json_content = json.loads(json_object)
-                if first_mess:
-                    csv_writer.writerow(json_content.keys())
-                    first_mess = False
-            
-                csv_writer.writerow(json_content.values())
-                data_dict = {}
+                csv_writer.writerows(layout.row(block) 
+                                     for block in message_aux.blocks)
         print("\nMessages decoded!\n")   
         print(f'\nDumped object to: {csv_file}\n')   
     
@@ -548,11 +928,283 @@ def var_to_csv(csv_file: str, messages_list: Any):
         
     except Exception as e:
         print(f"\nError writing CSV file: {e}\n")
+
+
+
+##############################################################################
+# Decode file with messages on hex into columns (NumPy arrays / DataFrame)
+# without building the messages objects
+
+##############################################################
+###  [3.5] Decode ASTERIX messages list (file) to columns  ###
+##############################################################
+
+def iter_file_records(filename: str, cat: int, items: [] = None):
+    """
+    Generator that decodes a file with messages record by record (one block
+    per record of each data block), without keeping them. Messages of other
+    categories and messages that cannot be decoded are written to the error 
+    log (the records decoded before the error are kept).
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file to read hexadecimal messages.
+    cat : int
+        Category to be decoded (21 or 48).
+    items : list (optional)
+        Names of the items to decode; the rest are skipped by their length, 
+        without decoding them. Default = None (all)
+
+    Yields
+    ------
+    block : BlockCat21 or BlockCat48 object
+        Decoded record.
+
+    """
+    block_class = scanner.BLOCK_CLASSES[cat]
+    cursor = columns.RecordCursor()
+    with open(filename, 'r') as file1:
+
+        total_lines = sum(1 for line in file1)
+        file1.seek(0)
+
+        for line in tqdm(file1, total=total_lines, desc="Progress",
+                         unit=" messages"):
+
+            try:
+                info = to_octets(line)
+                asterix_cat, asterix_len, count_octets = get_catlen(info)
+            except (ValueError, IndexError) as e:
+                print(f"Error: {e}")
+                logging.error(f'Message not decoded: {line}\n')
+                logging.error(f'Error: {e}\n')
+                continue
+            if asterix_cat == cat:
+                try:
+                    # One row per record of the data block (a zero FSPEC
+                    # octet is filler after the last record)
+                    while count_octets < asterix_len and info[count_octets]:
+                        block = block_class(items = items)
+                        count_octets = block.add_block(info, count_octets, cursor)
+                        yield block
+                except (ValueError, IndexError) as e:
+                    print(f"Error: {e}")
+                    logging.error(f'Message decoded with error: {line}\n')
+                    logging.error(f'Error: {e}\n')
+            else:
+                logging.error(f'Message not decoded: {line}\n')
+
+
+def decode_file_columnar(filename: str, cat: int, items: [] = None,
+                         dataframe: bool = True):
+    """
+    Decode file with messages straight into columns, one per item field
+    (e.g. 'item130.latitude', 'item080.target_addr'), one row per record.
+    Values are written into growable NumPy buffers; no AsterixMessage or
+    CategoryXX objects are kept.
+
+    Dtypes are fixed per field by the item classes (FIELDS tables): float64
+    for scaled values (latitude/longitude, time of day...), NaN when the item
+    is missing; int64 for integer values; uint32 for ICAO addresses (CAT21
+    item080, CAT48 item220); object for text and flags. Fields of an absent
+    extension (e.g. item040.first_ext) are missing. Repetitive fields (e.g.
+    item250 BDS registers) are not included.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file to read hexadecimal messages.
+    cat : int
+        Category to be decoded.
+    items : list (optional)
+        Names of the items to decode (e.g. ['item130', 'item080']); the rest
+        are skipped by their length, without decoding them. Default = None (all)
+    dataframe : bool (optional)
+        Return a pandas DataFrame (integer columns with missing values use
+        nullable dtypes Int64/UInt32). If False, return a dictionary column
+        name -> NumPy array (integer columns with missing values are masked
+        arrays). Default = True
+
+    Returns
+    -------
+    columns : pandas DataFrame or dict
+        Decoded fields, one column per field.
+
+    """
+    if cat not in scanner.BLOCK_CLASSES:
+        print(f"\nError: CAT{cat} not implemented yet\n")
+        return None
+
+    table = columns.ColumnTable(scanner.BLOCK_CLASSES[cat], items)
+    try:
+        for block in iter_file_records(filename, cat, items):
+            table.add_block(block)
+
+        print("\n\nMessages decoded!\n")
+
+        if dataframe:
+            return table.to_dataframe()
+        return table.to_arrays()
+
+    except FileNotFoundError:
+        print(f"\nFile {filename} not found.\n")
+
+    except Exception as e:
+        print(f"\nError reading the file: {e}\n")
+
+
+
+##############################################################
+###  [3.6] Decode ASTERIX messages list (file) to Parquet  ###
+##############################################################
+
+def decode_file_to_parquet(input_file: str, output_file: str, cat: int, 
+                           items: [] = None, row_group_size: int = 65536):
+    """
+    Decode file with messages into a Parquet file (requires pyarrow), one 
+    column per item field as in decode_file_columnar (e.g. 'item130.latitude'
+    float64, 'item080.target_addr' uint32), one row per record. Row groups are
+    written while the file is decoded, so memory use does not grow with the 
+    file size.
+
+    Parameters
+    ----------
+    input_file : str
+        Name of the file to read hexadecimal messages.
+    output_file : str
+        Name of the Parquet file.
+    cat : int
+        Category to be decoded.
+    items : list (optional)
+        Names of the items to decode (e.g. ['item130', 'item080']); the rest
+        are skipped by their length, without decoding them. Default = None (all)
+    row_group_size : int (optional)
+        Records per row group. Default = 65536
+
+    """
+    if cat not in scanner.BLOCK_CLASSES:
+        print(f"\nError: CAT{cat} not implemented yet\n")
+        return
+    
+    try:
+        from .classesASTERIX.parquet import ParquetSink
+        
+        with ParquetSink(output_file, scanner.BLOCK_CLASSES[cat], items, 
+                         row_group_size) as sink:
+            for block in iter_file_records(input_file, cat, items):
+                sink.add_block(block)
+
+        print(f"\n\nMessages decoded and saved in {output_file}\n")
+
+    except FileNotFoundError:
+        print(f"\nFile {input_file} not found.\n")
+
+    except Exception as e:
+        print(f"\nError dumping into the file: {e}\n")
+
+
+
+#############################################################
+###  [3.7] Decode ASTERIX messages list (file) to SQLite  ###
+#############################################################
+
+def decode_file_to_sqlite(input_file: str, output_file: str, cat: int, 
+                          items: [] = None, batch_size: int = 10000):
+    """
+    Decode file with messages into a SQLite database (table "cat21" or 
+    "cat48", same columns as dump_to_sqlite), inserting the records by batches 
+    while the file is decoded.
+
+    Parameters
+    ----------
+    input_file : str
+        Name of the file to read hexadecimal messages.
+    output_file : str
+        Name of the SQLite database.
+    cat : int
+        Category to be decoded.
+    items : list (optional)
+        Names of the items to decode (e.g. ['item130', 'item080']); the rest
+        are skipped by their length, without decoding them. Default = None (all)
+    batch_size : int (optional)
+        Records inserted per transaction. Default = 10000
+
+    """
+    if cat not in scanner.BLOCK_CLASSES:
+        print(f"\nError: CAT{cat} not implemented yet\n")
+        return
     
+    try:
+        with SQLiteSink(output_file, cat, items, batch_size) as sink:
+            for block in iter_file_records(input_file, cat, items):
+                sink.add_block(block)
+
+        print(f"\n\nMessages decoded and saved in {output_file}\n")
+
+    except FileNotFoundError:
+        print(f"\nFile {input_file} not found.\n")
+
+    except Exception as e:
+        print(f"\nError dumping into SQLite database: {e}\n")
+
+
+
+##############################################################
+###  [3.8] Decode ASTERIX messages list (file) to MongoDB  ###
+##############################################################
+
+def decode_file_to_mongodb(input_file: str, cat: int, config_file: str = "mongodb.conf",
+                           items: [] = None, batch_size: int = 1000):
+    """
+    Decode file with messages into a MongoDB database (server with mongod 
+    required), same documents as dump_to_mongodb, inserted by batches while 
+    the file is decoded.
+
+    Parameters
+    ----------
+    input_file : str
+        Name of the file to read hexadecimal messages.
+    cat : int
+        Category to be decoded.
+    config_file : str (optional)
+        File with configuration MongoDB configuration settings. Default = "mongodb.conf"
+    items : list (optional)
+        Names of the items to decode (e.g. ['item130', 'item080']); the rest
+        are skipped by their length, without decoding them. Default = None (all)
+    batch_size : int (optional)
+        Documents per insert. Default = 1000
+
+    """
+    if cat not in scanner.BLOCK_CLASSES:
+        print(f"\nError: CAT{cat} not implemented yet\n")
+        return
+    
+    try:
+        client, coleccion = mongo.connect(config_file)
+        
+        try:
+            with mongo.MongoSink(coleccion, batch_size) as sink:
+                for block in iter_file_records(input_file, cat, items):
+                    sink.add_block(block)
+        finally:
+            client.close()
+
+        print(f"\n\nMessages decoded and saved in MongoDB database: "
+              f"{coleccion.database.name} ({sink.inserted} inserted, "
+              f"{sink.failed} failed)\n")
+
+    except FileNotFoundError as e:
+        print(f"\nFile {e.filename} not found.\n")
+
+    except Exception as e:
+        print(f"\nError dumping into MongoDB: {e}\n")
+
 
 
 ##############################################################################
-# Dump object message (transformed to dict) to JSON file 
+# Dump object message (transformed to dict) to JSON file, newline-delimited 
+# (NDJSON): one compact JSON object per record and line.
 # Note: separated in two def to be able to add only ONE message on one call
 #       (for memory optimization purpose [RAM]).
 
@@ -562,7 +1214,7 @@ def var_to_csv(csv_file: str, messages_list: Any):
 
 def dump_message_to_json(file: IO, message_blocks: Any):
     """
-    Dump decoded MessageAsterix object to JSON file.
+    Dump decoded MessageAsterix object to JSON file, one line per block.
     Reminder: Each message can have more than one data block.
         
     Parameters
@@ -574,28 +1226,24 @@ def dump_message_to_json(file: IO, message_blocks: Any):
         
     """
     data_dict = {}
-    #end_block = False
-    j = 0
-    for j in range(len(message_blocks.blocks)):
-        message = message_blocks.blocks[j]
-        attribute_items = list(message.__dict__.keys())
+    for message in message_blocks.blocks:
+        attribute_items = message.item_names()
         # Iterar sobre los atributos en el orden de declaración
-        for item in attribute_items[1:]:
+        for item in attribute_items:
             value = getattr(message, item)
             if value.exist: 
-                data_dict[item] = asdict(value)
+                data_dict[item] = to_dict(value)
             else:
                 data_dict[item] = None
-        #json_object = jsonpickle.encode(data_dict, indent=8)
-        json_object = json.dumps(data_dict, indent=8)
-        file.write(json_object)
-        file.write(',\n')
+        file.write(json.dumps(data_dict, separators=(',', ':')))
+        file.write('\n')
         data_dict = {}
 
 
-def dump_all_to_json(filename: str, messages_list: Any):
+def dump_all_to_json(filename: str, messages_list: Any, append: bool = False):
     """
-    Dump decoded CategoryXX object to JSON file.
+    Dump decoded CategoryXX object to JSON file, newline-delimited (NDJSON):
+    one compact JSON object per record (block) and line.
         
     Parameters
     ----------
@@ -603,22 +1251,18 @@ def dump_all_to_json(filename: str, messages_list: Any):
         Name of JSON file to dump decoded messages. 
     messages_list : CategoryXX object (XX = category)
         ASTERIX decoded messages list object. Its content depends on the category.
+    append : bool (optional)
+        Add the records at the end of the file instead of overwriting it.
+        Default = False
         
     """
-    #end_block = False
-    #i = 0
     try:
-        with codecs.open(filename, 'w', encoding='utf-8') as file1:
-            file1.write('[\n')
+        with open(filename, 'a' if append else 'w', encoding='utf-8') as file1:
             
             total_lines = messages_list.count
-            for i in tqdm(range(messages_list.count), total=total_lines, 
-                          desc="Progress", unit=" messages"):
-            #for i in range(messages_list.count):
-                dump_message_to_json(file1, messages_list.messages[i])
-                
-            file1.seek(-2, 1)
-            file1.write('\n]')
+            for message in tqdm(messages_list.messages, total=total_lines, 
+                                desc="Progress", unit=" messages"):
+                dump_message_to_json(file1, message)
             
         print(f'\nDumped object to: {filename}\n')
         
@@ -652,34 +1296,25 @@ def dump_all_to_json_bk(filename: str, messages_list: Any):
     data_dict = {}
     i, j = 0, 0
     try:
-        with codecs.open(filename, 'w', encoding='utf-8') as file1:
+        with open(filename, 'w', encoding='utf-8') as file1:
             
             total_lines = messages_list.count
-            file1.write('[')
             for i in tqdm(range(messages_list.count), total=total_lines, 
                           desc="Progress", unit=" messages"):
-            #for i in range(messages_list.count):
                 for j in range(len(messages_list.messages[i].blocks)):
                     
-                    print
                     message = messages_list.messages[i].blocks[j]
-                    attribute_items = list(message.__dict__.keys())
-                    for item in attribute_items[1:]:
+                    attribute_items = message.item_names()
+                    for item in attribute_items:
                         value = getattr(message, item)
                         if value.exist:  
-                            data_dict[item] = asdict(value)
-                            #data_dict[item] = recursive_asdict(value)
+                            data_dict[item] = to_dict(value)
                         else:
                             data_dict[item] = None
-                    #json_object = jsonpickle.encode(data_dict, indent=8)
-                    json_object = json.dumps(data_dict, indent=8)
+                    json_object = json.dumps(data_dict, separators=(',', ':'))
                     file1.write(json_object)
-                    file1.write(',\n')
+                    file1.write('\n')
                     data_dict = {}
-                    
-            file1.seek(-2, 1)
-            file1.write('\n]')
-            #file1.write(']')
         
         print(f'\nDumped object to: {filename}\n')
         
@@ -688,6 +1323,46 @@ def dump_all_to_json_bk(filename: str, messages_list: Any):
 
 
 
+##############################################################################
+# Read JSON file record by record (NDJSON from "dump_all_to_json" or 
+# "decode_file_to_json")
+
+#############################
+#####  [4.3] Read JSON  #####
+#############################
+
+def iter_ndjson(filename: str):
+    """
+    Generator that reads a JSON file generated with dump_all_to_json() or 
+    decode_file_to_json() (newline-delimited JSON) and yields its records 
+    one at a time, without loading the whole file. Empty lines are skipped.
+    JSON array files written by older versions are also read (loaded whole).
+    
+    Parameters
+    ----------
+    filename : str
+        Name of JSON file to read decoded messages.
+        
+    Yields
+    ------
+    record : dict
+        Item name -> item fields (None if the item is absent) of one record.
+        
+    """
+    with open(filename, 'r', encoding='utf-8') as file1:
+        for line in file1:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('['):
+                # JSON array (older versions)
+                file1.seek(0)
+                yield from json.load(file1)
+                return
+            yield json.loads(line)
+
+
+
 ##############################################################################
 # Dump complex object into JSON file with "jsonpickle" package.
 # Note: it can be useful since all the properties and information of 
@@ -767,7 +1442,8 @@ def load_from_jsonpickle(filename: str):
 def dump_to_csv(json_filename: str, csv_filename: str):
     """
     Dump to csv from JSON file (use JSON generated with dump_all_to_json(), NOT 
-    from dump_to_jsonpickle()).
+    from dump_to_jsonpickle()). Records are read and written one at a time 
+    (see iter_ndjson).
         
     Parameters
     ----------
@@ -778,17 +1454,16 @@ def dump_to_csv(json_filename: str, csv_filename: str):
         
     """
     try:
-        with open(json_filename, 'r') as file1:
-            json_content = json.load(file1)
-        
         with open(csv_filename, 'w', newline='') as file2:
             # Creat CSV writer object
             csv_writer = csv.writer(file2)
             
-            # Write CSV header (based on JSON dict keys)
-            csv_writer.writerow(json_content[0].keys())
-            
-            for mess in json_content:
+            first_mess = True
+            for mess in iter_ndjson(json_filename):
+                if first_mess:
+                    # Write CSV header (based on JSON dict keys)
+                    csv_writer.writerow(mess.keys())
+                    first_mess = False
                 # Write data on a row
                 csv_writer.writerow(mess.values())
         
@@ -811,10 +1486,12 @@ def dump_to_csv(json_filename: str, csv_filename: str):
 #####  [7] MongoDB  #######
 ###########################
 
-def dump_to_mongodb(messages_list: Any, config_file: str = "mongodb.conf"):
+def dump_to_mongodb(messages_list: Any, config_file: str = "mongodb.conf",
+                    batch_size: int = 1000):
     """
-    Dump all messages (one by one) converted to dict to a MongoDB database
-    (server with mongod required).
+    Dump all messages (one document per block) converted to dict to a MongoDB 
+    database (server with mongod required). Documents are inserted by batches
+    (unordered), and documents that fail are sent again.
     
     Parameters
     ----------
@@ -822,44 +1499,24 @@ def dump_to_mongodb(messages_list: Any, config_file: str = "mongodb.conf"):
         ASTERIX decoded messages list object. Its content depends on the category.
     config_file : str (optional)
         File with configuration MongoDB configuration settings. Default = "mongodb.conf"
+    batch_size : int (optional)
+        Documents per insert. Default = 1000
         
     """
     try:
-        with open(config_file, 'r') as file1:
-            #lines = file1.readlines()
-            lines = [line.rstrip('\n') for line in file1.readlines()]
-            
         # Connect to MongoDB database (it is compulsory to have one mongod server)
-        client = MongoClient(lines[0])
-        db = client[lines[1]]
-        coleccion = db[lines[2]]
-           
-        data_dict = {}
-        #data_dict_aux= {}
-        i, j = 0, 0
+        client, coleccion = mongo.connect(config_file)
         
-        for i in range(messages_list.count):
-            for j in range(len(messages_list.messages[i].blocks)):
-                message = messages_list.messages[i].blocks[j]
-                attribute_items = list(message.__dict__.keys())
-                
-                for item in attribute_items[1:]:
-                    value = getattr(message, item)
-                    #print("Valor actual:", valor_actual)
-                    if value.exist: 
-                        #data_dict_aux[item] = asdict(value)  
-                        data_dict[item] = asdict(value)
-                    else:
-                        data_dict[item] = None
-                #data_dict[str(i)] = data_dict_aux
-                #data_dict_aux = {}
-                
-                coleccion.insert_one(data_dict)
-                data_dict = {}
-        #db.dropDatabase()
-        client.close()
+        try:
+            with mongo.MongoSink(coleccion, batch_size) as sink:
+                for message in messages_list.messages:
+                    for block in message.blocks:
+                        sink.add_block(block)
+        finally:
+            client.close()
         
-        print(f"Dumped data to MongoDB database: {lines[1]}\n")
+        print(f"Dumped data to MongoDB database: {coleccion.database.name} "
+              f"({sink.inserted} inserted, {sink.failed} failed)\n")
         
     except Exception as e:
         print(f"Error dumping into MongoDB: {e}\n")
@@ -873,9 +1530,14 @@ def dump_to_mongodb(messages_list: Any, config_file: str = "mongodb.conf"):
 ##### [8] SQLite DB #######
 ###########################
 
-def dump_to_sqlite(filename: str, messages_list: Any):
+def dump_to_sqlite(filename: str, messages_list: Any, items: [] = None,
+                   batch_size: int = 10000):
     """
-    Dump all messages (one by one) converted to dict to a SQlite database
+    Dump all messages to a SQlite database, table "cat21" or "cat48" with one 
+    column per item field (e.g. "item130.latitude" REAL, "item080.target_addr"
+    INTEGER, see decode_file_columnar), one row per record (block). Rows are 
+    inserted by batches, one transaction per batch, and the table is indexed
+    by time of day, SAC/SIC and target address.
     
     Parameters
     ----------
@@ -883,45 +1545,75 @@ def dump_to_sqlite(filename: str, messages_list: Any):
         Database name to dump ASTERIX messages.
     messages_list : CategoryXX object (XX = category)
         ASTERIX decoded messages list object. Its content depends on the category.
+    items : list (optional)
+        Names of the items to dump (e.g. ['item130', 'item080']). Default = None (all)
+    batch_size : int (optional)
+        Records inserted per transaction. Default = 10000
         
     """
     try:
-        # Create/connect to SQLite database
-        conexion = sqlite3.connect(filename)
-        
-        # Create table
-        cursor = conexion.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS dictionary_data (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                data TEXT
-            )
-        ''')
+        if isinstance(messages_list, classcategory21.Category21):
+            cat = 21
+        else:
+            cat = 48
+        
+        with SQLiteSink(filename, cat, items, batch_size) as sink:
+            for message in tqdm(messages_list.messages, total=messages_list.count,
+                                desc="Progress", unit=" messages"):
+                for block in message.blocks:
+                    sink.add_block(block)
+        
+        print(f"Dumped data to SQLite database: {filename}\n")
+        
+    except Exception as e:
+        print(f"Error dumping into SQLite database: {e}\n")    
         
-        data_dict = {}
-        i, j = 0, 0
         
-        for i in range(messages_list.count):
-            for j in range(len(messages_list.messages[i].blocks)):
-                message = messages_list.messages[i].blocks[j]  
-                data_dict = asdict(message)
-                
-                # Convert dict to json
-                data = json.dumps(data_dict)
                 
-                # Insert json into database
-                cursor.execute('INSERT INTO dictionary_data (data) VALUES (?)', (data,))
+##############################################################################       
+# Dump to Parquet file (one column per item field)
+
+##############################
+##### [8.1] Parquet  #########
+##############################
+
+def dump_to_parquet(filename: str, messages_list: Any, items: [] = None,
+                    row_group_size: int = 65536):
+    """
+    Dump all messages to a Parquet file (requires pyarrow), one column per 
+    item field (e.g. 'item130.latitude' float64, 'item080.target_addr' uint32,
+    see decode_file_columnar), one row per record (block).
+    
+    Parameters
+    ----------
+    filename : str 
+        Name of the Parquet file.
+    messages_list : CategoryXX object (XX = category)
+        ASTERIX decoded messages list object. Its content depends on the category.
+    items : list (optional)
+        Names of the items to dump (e.g. ['item130', 'item080']). Default = None (all)
+    row_group_size : int (optional)
+        Records per row group. Default = 65536
         
-                data_dict = {}
+    """
+    try:
+        from .classesASTERIX.parquet import ParquetSink
         
-        # Save and close connection
-        conexion.commit()
-        conexion.close()  
+        if isinstance(messages_list, classcategory21.Category21):
+            block_class = classcategory21.BlockCat21
+        else:
+            block_class = classcategory48.BlockCat48
         
-        print(f"Dumped data to SQLite database: {filename}\n")
+        with ParquetSink(filename, block_class, items, row_group_size) as sink:
+            for message in tqdm(messages_list.messages, total=messages_list.count,
+                                desc="Progress", unit=" messages"):
+                for block in message.blocks:
+                    sink.add_block(block)
+        
+        print(f"Dumped data to Parquet file: {filename}\n")
         
     except Exception as e:
-        print(f"Error dumping into SQLite database: {e}\n")    
+        print(f"Error dumping into Parquet file: {e}\n")    
         
         
                 
@@ -946,14 +1638,14 @@ def message_str(message: Any):
         str_info = ('********************************************\n'
                     '*******   Decoded ASTERIX Message:   *******\n'
                     '********************************************\n\n'
-                    f'{message.info}\n' 
+                    f'{message.info.hex().upper()}\n' 
                     '********************************************\n\n')
         #for block in message.blocks:
         for index, block in enumerate(message.blocks): 
             str_info += f'  Block {index}:\n--------------\n\n'
-            attribute_items = list(block.__dict__.keys())
+            attribute_items = block.item_names()
             # Iterar sobre los atributos en el orden de declaración
-            for item in attribute_items[1:]:
+            for item in attribute_items:
                 value = getattr(block, item)
                 #print("Valor actual:", valor_actual)
                 if value.exist: 
@@ -1008,7 +1700,7 @@ def dump_items_txt(filename: str, messages_list: Any, items_to_save: []):
             header = ""
             header_keys = []
             for key, value in data.items():
-                dictionary = asdict(value)
+                dictionary = to_dict(value)
                 header_keys += list(dictionary.keys())
             header = '\t'.join(header_keys)
             file1.write(header + "\n")
@@ -1021,18 +1713,15 @@ def dump_items_txt(filename: str, messages_list: Any, items_to_save: []):
 
                     for item in items_to_save:
                         if data[item].exist:
-                            #print(asdict(datos_a_guardar[item]))
-                            data_dict = asdict(data[item])
-                            for value in data_dict.values():
+                            for value in to_row(data[item]):
                                 values.append(str(value))
                         else:
-                            data_dict = asdict(data[item])
-                            for value in data_dict.values():
+                            for value in to_row(data[item]):
                                 values.append(str(None))
                     values_str = '\t'.join(values)
                     file1.write(values_str + "\n")
                     
-                    data_dict, values, values_str = {}, [], ""
+                    values, values_str = [], ""
                     
         print("Data dumped to txt!\n")
 
@@ -1108,7 +1797,8 @@ def dump_bds_cat_txt(input_file: str, output_file: str, bds_type: str):
 #####  [13] Merge items CAT21 and BDS50 BDS60  #####
 ####################################################
 
-def merge_data(fileCAT21: str, fileBDS50: str, fileBDS60: str, output_file: str, max_dev: float = 5):
+def merge_data(fileCAT21: str, fileBDS50: str, fileBDS60: str, output_file: str, max_dev: float = 5,
+               chunksize: int = None):
     """
     Merge on csv file CAT21 items with BDS50 and BDS60 decoded data, given a 
     max. deviation based on time (s). It is recommended to set max. deviation
@@ -1125,11 +1815,20 @@ def merge_data(fileCAT21: str, fileBDS50: str, fileBDS60: str, output_file: str,
         Name of file with BDS50 items (generated with dump_bds_cat_txt()).
     max_dev : float (optional)
         Max. deviation to merge data depending on timestamp of data (5s recommended)
+    chunksize : int (optional)
+        Rows read at a time. If given, files are merged out of memory: they are
+        split by time (15 min buckets, on a temporary directory) and merged 
+        bucket by bucket, for files larger than RAM. Same output. 
+        Default = None (files read whole)
         
     """
     try:
     
-       meteotool.merge_data(fileCAT21, fileBDS50, fileBDS60, output_file, max_dev)
+       if chunksize:
+           meteotool.merge_data_chunked(fileCAT21, fileBDS50, fileBDS60, output_file, 
+                                        max_dev, chunksize)
+       else:
+           meteotool.merge_data(fileCAT21, fileBDS50, fileBDS60, output_file, max_dev)
 
     except Exception as e:
         print(f"Error merging data: {e}")  
@@ -1172,3 +1871,60 @@ def calculate_meteo(input_file: str, output_file: str, local_meteo_grid: str):
         print(f"Error calculating meteo data: {e}")  
 
 
+
+
+
+##############################################################################
+# Calculate meteo data (BDS and ERA5) from CAT21 and CAT48 messages, in memory:
+# same result as [10] -> [11] -> [12] -> [13] -> [14] without intermediate 
+# text files
+
+#######################################
+#####  [15] Meteo pipeline         #####
+#######################################
+
+def meteo_pipeline(cat21_source: Any, cat48_source: Any, output_file: str, 
+                   local_meteo_grid: str, max_dev: float = 5):
+    """
+    Calculate dataframe with ASTERIX and ERA5 meteo data (see calculate_meteo)
+    directly from CAT21 (ADS-B) and CAT48 (Mode-S) data. Decoded items pass
+    between the stages in memory (dump_items_txt, dump_bds_txt, 
+    dump_bds_cat_txt, merge_data and calculate_meteo) and only the final 
+    data is written.
+    
+    Parameters
+    ----------
+    cat21_source : str or Category21 object
+        Name of the hex file with CAT21 messages, or the messages already 
+        decoded (with at least items 073, 080, 131 and 140).
+    cat48_source : str or Category48 object
+        Name of the hex file with CAT48 messages, or the messages already 
+        decoded (with at least items 140, 220 and 250).
+    output_file : str
+        Name of file to save data.
+    local_meteo_grid : str
+        Local grid to store ERA5 data (see calculate_meteo).
+    max_dev : float (optional)
+        Max. deviation to merge data depending on timestamp of data (see 
+        merge_data). Default = 5
+        
+    """
+    try:
+        
+        # Only the items used are decoded
+        if isinstance(cat21_source, str):
+            cat21_source = decode_file(cat21_source, 21, items=meteotool.CAT21_ITEMS)
+        if isinstance(cat48_source, str):
+            cat48_source = decode_file(cat48_source, 48, items=meteotool.CAT48_ITEMS)
+        
+        df_cat21 = meteotool.cat21_frame(cat21_source)
+        df_bds50, df_bds60 = meteotool.bds_frames(cat48_source)
+        df_merge = meteotool.merge_frames(df_cat21, df_bds50, df_bds60, max_dev)
+        
+        df_meteo = meteotool.meteo_frame(df_merge, local_meteo_grid)
+        df_meteo.to_csv(output_file, sep='\t', index=False)
+        
+        print("Data calculated successfully!")
+
+    except Exception as e:
+        print(f"Error calculating meteo data: {e}")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bounded LRU cache of decoded results.
+
+Merged multi-sensor feeds carry the same record several times (different
+ground stations or relays). With a cache, a record whose octets were already
+decoded returns the same decoded object instead of decoding it again, so the
+cached results are shared and must be treated as read-only.
+"""
+
+from collections import OrderedDict
+
+
+######################################################
+
+class DecodeCache:
+    """
+    Least recently used cache with hit/miss/eviction statistics.
+
+    Parameters
+    ----------
+    maxsize : int (optional)
+        Maximum number of entries; the least recently used one is evicted
+        when it is full. Default = 65536
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize   = maxsize
+        self.entries   = OrderedDict()
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+
+    @staticmethod
+    def message_key(info, lazy=False, items=None):
+        """
+        Key of a record decoded with the given options.
+        """
+        return (bytes(info), lazy, None if items is None else frozenset(items))
+
+    def get(self, key):
+        """
+        Cached value of key, or None (miss).
+        """
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def stats(self):
+        """
+        Dictionary with hits, misses, evictions, size, maxsize and hit_rate.
+        """
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self.entries),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / lookups if lookups else 0.0}
+
+    def __str__(self):
+        stats = self.stats()
+        return (f'DecodeCache: {stats["size"]}/{stats["maxsize"]} entries, '
+                f'{stats["hits"]} hits, {stats["misses"]} misses, '
+                f'{stats["evictions"]} evictions, '
+                f'hit rate {stats["hit_rate"]:.1%}')
+
+
+######################################################
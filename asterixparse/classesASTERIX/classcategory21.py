@@ -7,19 +7,22 @@ Created on Mon Dec 11 15:48:46 2023
 """
 
 import inspect
+import logging
 import math
 import json
 
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from typing import List
+from .octets import octetbin, octetint, to_octets, bitfields, unpack_fields, extract_fields
+from .octets import UNSIGNED, SIGNED, BITS, OCTAL
+from .uap import install_items, read_fspec
+from . import classmodes
+from .uap import skip_compound, skip_explicit, skip_fx, skip_rep
 
 
 ######################################################
 
-def hexabin(num = int, base = int):
-  return bin(int(num, base))[2:].zfill(len(num) * int(math.log2(base)))
-
 def twos_comp(val, bits):
     """compute the 2's complement of int value val"""
     if (val & (1 << (bits - 1))) != 0: # if sign bit is set e.g., 8bit: 128-255
@@ -38,10 +41,20 @@ class Item008:
     tcas: int
     sa: int    
     
+    __slots__ = ('ra', 'tc', 'ts', 'arv', 'cdti_a', 'tcas', 'sa', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('ra', 0, 1, BITS),
+                       ('tc', 1, 3),
+                       ('ts', 3, 4, BITS),
+                       ('arv', 4, 5, BITS),
+                       ('cdti_a', 5, 6, BITS),
+                       ('tcas', 6, 7, BITS),
+                       ('sa', 7, 8, BITS))
+
     def __init__(self):
         self.exist  = False
-        self.len    = 1
-        self.hex    = 0
         self.ra     = 0
         self.tc     = 0
         self.ts     = 0
@@ -51,15 +64,7 @@ class Item008:
         self.sa     = 0
     
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.ra     = res[:1]
-        self.tc     = int(res[1:3], 2)
-        self.ts     = res[3:4]
-        self.arv    = res[4:5]
-        self.cdti_a = res[5:6]
-        self.tcas   = res[6:7]
-        self.sa     = res[7:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -79,17 +84,17 @@ class Item010:
     sac: int
     sic: int
     
+    __slots__ = ('sac', 'sic', 'exist')
+    len = 2
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
-        self.hex   = 0
         self.sac   = 0
         self.sic   = 0
         
     def add_info(self, info):
-        self.hex = info
-        self.sac = int(info[:2], 16)
-        self.sic = int(info[2:], 16)
+        self.sac = info[0]
+        self.sic = info[1]
         if not 0 <= self.sac <= 255 or not 0 <= self.sic <= 255:
             raise ValueError("El valor debe estar en el rango 0, 255")
         
@@ -104,15 +109,15 @@ class Item010:
 class Item015:
     service_id: int
     
+    __slots__ = ('service_id', 'exist')
+    len = 1
+
     def __init__(self):
         self.exist      = False
-        self.len        = 1
-        self.hex        = 0
         self.service_id = 0
 
     def add_info(self, info):
-        self.hex = info
-        self.service_id = hexabin(info, 16)
+        self.service_id = octetbin(info)
         
     def __str__(self):
         return (
@@ -125,15 +130,15 @@ class Item015:
 class Item016:
     rp: int
     
+    __slots__ = ('rp', 'exist')
+    len = 1
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
-        self.hex   = 0
         self.rp    = 0
         
     def add_info(self, info):
-        self.hex = info
-        self.rp = int(info, 16)*0.5
+        self.rp = octetint(info)*0.5
         
     def __str__(self):
         return (
@@ -146,16 +151,18 @@ class Item016:
 class Item020:
     ecat: int
     
+    __slots__ = ('ecat', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('ecat', 0, 8))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
-        self.hex   = 0
         self.ecat  = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.ecat = int(res, 2)
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -172,24 +179,33 @@ class Item040:
     third_ext: 'Item040.ThirdExt()'
     fourth_ext: 'Item040.FourthExt()'
         
+    __slots__ = ('primary', 'first_ext', 'second_ext', 'third_ext',
+                 'fourth_ext', 'exist')
+    len = 0
+
     @dataclass
     class FourthExt:
         mbc: int
         
+        __slots__ = ('mbc', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('mbc', 0, 1, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.mbc   = 0
             self.fx    = 0   # There is no more documentacion about this FX
        
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            value = octetint(info_item)
+            extract_fields(self, value, self.FIELDS)
             self.exist = True 
-            self.mbc = res[:1]
             if self.mbc == '1':
-                self.mbc = res[1:7]
-            self.fx  = res[7:]
+                self.mbc = format((value >> 1) & 0x3F, '06b')
             count_octets += self.len
             return count_octets
             
@@ -203,20 +219,25 @@ class Item040:
     class ThirdExt:
         tbc: int
         
+        __slots__ = ('tbc', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('tbc', 0, 1, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.tbc   = 0
             self.fx    = 0
        
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            value = octetint(info_item)
+            extract_fields(self, value, self.FIELDS)
             self.exist = True 
-            self.tbc = res[:1]
             if self.tbc == '1':
-                self.tbc = res[1:7]
-            self.fx  = res[7:]
+                self.tbc = format((value >> 1) & 0x3F, '06b')
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.fourth_ext.add_info(item, info, count_octets)
@@ -237,9 +258,22 @@ class Item040:
         ldpj: int
         rcf: int
         
+        __slots__ = ('llc', 'ipc', 'nogo', 'cpr', 'ldpj', 'rcf', 'spare', 'fx',
+                     'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('spare', 0, 1, BITS),
+                           ('llc', 1, 2, BITS),
+                           ('ipc', 2, 3, BITS),
+                           ('nogo', 3, 4, BITS),
+                           ('cpr', 4, 5, BITS),
+                           ('ldpj', 5, 6, BITS),
+                           ('rcf', 6, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.spare = 0
             self.llc   = 0
             self.ipc   = 0
@@ -250,17 +284,9 @@ class Item040:
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.spare = res[:1]
-            self.llc = res[1:2]
-            self.ipc  = res[2:3]
-            self.nogo = res[3:4]
-            self.cpr = res[4:5]
-            self.ldpj = res[5:6]
-            self.rcf = res[6:7]
-            self.fx  = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.third_ext.add_info(item, info, count_octets)
@@ -286,9 +312,20 @@ class Item040:
         saa: int
         cl: int
         
+        __slots__ = ('dcr', 'gbs', 'sim', 'tst', 'saa', 'cl', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('dcr', 0, 1, BITS),
+                           ('gbs', 1, 2, BITS),
+                           ('sim', 2, 3, BITS),
+                           ('tst', 3, 4, BITS),
+                           ('saa', 4, 5, BITS),
+                           ('cl', 5, 7),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.dcr   = 0
             self.gbs   = 0
             self.sim   = 0
@@ -298,16 +335,9 @@ class Item040:
             self.fx    = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.dcr = res[:1]
-            self.gbs = res[1:2]
-            self.sim = res[2:3]
-            self.tst = res[3:4]
-            self.saa = res[4:5]
-            self.cl  = int(res[5:7],2)
-            self.fx  = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.second_ext.add_info(item, info, count_octets)
@@ -331,9 +361,18 @@ class Item040:
         rc: int
         rab: int
         
+        __slots__ = ('atp', 'arc', 'rc', 'rab', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('atp', 0, 3),
+                           ('arc', 3, 5),
+                           ('rc', 5, 6, BITS),
+                           ('rab', 6, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.atp   = 0
             self.arc   = 0
             self.rc    = 0
@@ -341,14 +380,9 @@ class Item040:
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.atp = int(res[:3],2)
-            self.arc = int(res[3:5],2)
-            self.rc  = res[5:6]
-            self.rab = res[6:7]
-            self.fx  = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.first_ext.add_info(item, info, count_octets)
@@ -365,8 +399,6 @@ class Item040:
             
     def __init__(self):
         self.exist      = False
-        self.len        = 0
-        self.hex        = 0
         self.primary    = self.Primary()
         self.first_ext  = self.FirstExt()
         self.second_ext = self.SecondExt()
@@ -374,9 +406,7 @@ class Item040:
         self.fourth_ext = self.FourthExt()
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         count_octets = self.primary.add_info(self, info, count_octets)
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
     
     def __str__(self):
@@ -388,20 +418,19 @@ class Item040:
 class Item070:
     mode3_a: int
     
+    __slots__ = ('mode3_a', 'exist', 'spare')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('mode3_a', 4, 16, OCTAL))
+
     def __init__(self):
         self.exist   = False
-        self.len     = 2
-        self.hex     = 0
         self.spare   = 0
         self.mode3_a = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        # Convert str bin to int, then to octal
-        aux = oct(int(res[4:], 2))
-        # Get rid from the initial "0o"
-        self.mode3_a = aux[2:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -414,15 +443,15 @@ class Item070:
 class Item071:
     time_app_pos: int
     
+    __slots__ = ('time_app_pos', 'exist')
+    len = 3
+
     def __init__(self):
         self.exist        = False
-        self.len          = 3
-        self.hex          = 0
         self.time_app_pos = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.time_app_pos = int(hexabin(info, 16), 2)/128
+        self.time_app_pos = octetint(info)/128
         
     def __str__(self):
         delta = timedelta(seconds=self.time_app_pos)
@@ -441,15 +470,15 @@ class Item071:
 class Item072:
     time_app_vel: int
     
+    __slots__ = ('time_app_vel', 'exist')
+    len = 3
+
     def __init__(self):
         self.exist        = False
-        self.len          = 3
-        self.hex          = 0
         self.time_app_vel = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.time_app_vel = int(hexabin(info, 16), 2)/128
+        self.time_app_vel = octetint(info)/128
     
     def __str__(self):
         delta = timedelta(seconds=self.time_app_vel)
@@ -468,15 +497,15 @@ class Item072:
 class Item073:
     time_rec_pos: int
     
+    __slots__ = ('time_rec_pos', 'exist')
+    len = 3
+
     def __init__(self):
         self.exist        = False
-        self.len          = 3
-        self.hex          = 0
         self.time_rec_pos = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.time_rec_pos = int(hexabin(info, 16), 2)/128
+        self.time_rec_pos = octetint(info)/128
         
     def __str__(self):
         delta = timedelta(seconds=self.time_rec_pos)
@@ -496,17 +525,20 @@ class Item074:
     fsi: int
     time_rec_poshf: int
     
+    __slots__ = ('fsi', 'time_rec_poshf', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('fsi', 0, 4, BITS),
+                       ('time_rec_poshf', 4, 32, UNSIGNED, pow(2,-30)))
+
     def __init__(self):
         self.exist          = False
-        self.len            = 4
-        self.hex            = 0
         self.fsi            = 0
         self.time_rec_poshf = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.fsi = hexabin(info[:1], 16)
-        self.time_rec_poshf = int(hexabin(info[1:], 16), 2)*pow(2,-30)
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         delta = timedelta(seconds=self.time_rec_poshf)
@@ -526,15 +558,15 @@ class Item074:
 class Item075:
     time_rec_vel: int
     
+    __slots__ = ('time_rec_vel', 'exist')
+    len = 3
+
     def __init__(self):
         self.exist        = False
-        self.len          = 3
-        self.hex          = 0
         self.time_rec_vel = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.time_rec_vel = int(hexabin(info, 16), 2)/128
+        self.time_rec_vel = octetint(info)/128
 
     def __str__(self):
         delta = timedelta(seconds=self.time_rec_vel)
@@ -554,17 +586,20 @@ class Item076:
     fsi: int
     time_rec_velhf: int
     
+    __slots__ = ('fsi', 'time_rec_velhf', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('fsi', 0, 4, BITS),
+                       ('time_rec_velhf', 4, 32, UNSIGNED, pow(2,-30)))
+
     def __init__(self):
         self.exist          = False
-        self.len            = 4
-        self.hex            = 0
         self.fsi            = 0
         self.time_rec_velhf = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.fsi = hexabin(info[:1], 16)
-        self.time_rec_velhf = int(hexabin(info[1:], 16), 2)*pow(2,-30)
+        extract_fields(self, octetint(info), self.FIELDS)
     
     def __str__(self):
         delta = timedelta(seconds=self.time_rec_velhf)
@@ -584,15 +619,15 @@ class Item076:
 class Item077:
     time_report_trans: int
     
+    __slots__ = ('time_report_trans', 'exist')
+    len = 3
+
     def __init__(self):
         self.exist             = False
-        self.len               = 3
-        self.hex               = 0
         self.time_report_trans = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.time_report_trans = int(hexabin(info, 16), 2)/128
+        self.time_report_trans = octetint(info)/128
 
     def __str__(self):
         delta = timedelta(seconds=self.time_report_trans)
@@ -611,15 +646,15 @@ class Item077:
 class Item080:
     target_addr: int
     
+    __slots__ = ('target_addr', 'exist')
+    len = 3
+
     def __init__(self):
         self.exist        = False
-        self.len          = 3
-        self.hex          = 0
         self.target_addr  = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.target_addr = info
+        self.target_addr = info.hex().upper()
         
     def __str__(self):
         return (
@@ -634,24 +669,31 @@ class Item090:
     second_ext: 'Item090.SecondExt()'
     third_ext: 'Item090.ThirdExt()'
     
+    __slots__ = ('primary', 'first_ext', 'second_ext', 'third_ext', 'exist')
+    len = 0
+
     @dataclass
     class ThirdExt:
         pic: int
         
+        __slots__ = ('pic', 'spare', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('pic', 0, 4),
+                           ('spare', 4, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.pic   = 0
             self.spare = 0
             self.fx    = 0  # There is no more documentacion about this FX
        
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.pic = int(res[:4], 2)
-            self.spare = res[4:7]
-            self.fx  = res[7:]
             count_octets += self.len
             return count_octets
          
@@ -666,9 +708,18 @@ class Item090:
         sda: int
         gva: int
         
+        __slots__ = ('sils', 'sda', 'gva', 'spare', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('spare', 0, 2, BITS),
+                           ('sils', 2, 3, BITS),
+                           ('sda', 3, 5, BITS),
+                           ('gva', 5, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.spare = 0
             self.sils  = 0
             self.sda   = 0
@@ -676,14 +727,9 @@ class Item090:
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.spare = res[:2]
-            self.sils = res[2:3]
-            self.sda  = res[3:5]
-            self.gva = res[5:7]
-            self.fx  = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.third_ext.add_info(item, info, count_octets)
@@ -703,22 +749,26 @@ class Item090:
         sil: int
         nac: int
         
+        __slots__ = ('nic_baro', 'sil', 'nac', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('nic_baro', 0, 1, BITS),
+                           ('sil', 1, 3, BITS),
+                           ('nac', 3, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist    = False
-            self.len      = 1 
             self.nic_baro = 0
             self.sil      = 0
             self.nac      = 0 
             self.fx       = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.nic_baro = res[:1]
-            self.sil = res[1:3]
-            self.nac = res[3:7]
-            self.fx  = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.second_ext.add_info(item, info, count_octets)
@@ -737,20 +787,24 @@ class Item090:
         nuc_nac: int
         nuc_nic: int
         
+        __slots__ = ('nuc_nac', 'nuc_nic', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('nuc_nac', 0, 3, BITS),
+                           ('nuc_nic', 3, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist   = False
-            self.len     = 1 
             self.nuc_nac = 0
             self.nuc_nic = 0
             self.fx      = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.nuc_nac = res[:3]
-            self.nuc_nic = res[3:7]
-            self.fx  = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.first_ext.add_info(item, info, count_octets)
@@ -765,17 +819,13 @@ class Item090:
             
     def __init__(self):
         self.exist      = False
-        self.len        = 0
-        self.hex        = 0
         self.primary    = self.Primary()
         self.first_ext  = self.FirstExt()
         self.second_ext = self.SecondExt()
         self.third_ext  = self.ThirdExt()
     
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         count_octets = self.primary.add_info(self, info, count_octets)
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
 
     def __str__(self):
@@ -785,12 +835,15 @@ class Item090:
 ######################################################
 # REVISAR si los bloques se añaden bien y si se imprimen bien (no he encontrado
 # ejemplo con este item)
-# Resvisar que (res = hexabin(info_item, 16)) en TID.add_info es correcto
+# Resvisar que (res = octetbin(info_item)) en TID.add_info es correcto
 @dataclass
 class Item110:
     tis: 'Item110.TIS()'
     tid: 'Item110.RepTID()'
     
+    __slots__ = ('tis', 'tid', 'fx', 'exist', 'spare')
+    len = 0
+
     @dataclass
     class TID:
         tca: int
@@ -806,8 +859,26 @@ class Item110:
         tov: int
         ttr: int
         
+        __slots__ = ('tca', 'nc', 'tcp_num', 'altitude', 'latitude',
+                     'longitude', 'point_type', 'td', 'tra', 'toa', 'tov',
+                     'ttr', 'exist')
+        len = 15
+
+        FIELDS = bitfields(15,
+                           ('tca', 0, 1, BITS),
+                           ('nc', 1, 2, BITS),
+                           ('tcp_num', 2, 8, BITS),
+                           ('altitude', 8, 24, SIGNED, 10),
+                           ('latitude', 24, 48, SIGNED, 180/pow(2,23)),
+                           ('longitude', 48, 72, SIGNED, 180/pow(2,23)),
+                           ('point_type', 72, 77),
+                           ('td', 77, 79, BITS),
+                           ('tra', 79, 80, BITS),
+                           ('toa', 80, 81, BITS),
+                           ('tov', 81, 105),
+                           ('ttr', 105, 120, UNSIGNED, 0.01))
+
         def __init__(self):
-            self.len        = 15
             self.tca        = 0
             self.nc         = 0
             self.tcp_num    = 0
@@ -822,21 +893,9 @@ class Item110:
             self.ttr        = 0
         
         def add_info (self, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.tca = res[:1]
-            self.nc =res[1:2]
-            self.tcp_num = res[2:8]
-            self.altitude = twos_comp(int(res[8:24], 2), len(res[8:24]))*10
-            self.latitude = twos_comp(int(res[24:48], 2), len(res[24:48]))*(180/pow(2,23))
-            self.longitude = twos_comp(int(res[48:72], 2), len(res[48:72]))*(180/pow(2,23))
-            self.point_type = int(res[72:77],2)
-            self.td = res[77:79]
-            self.tra = res[79:80]
-            self.toa = res[80:81]
-            self.tov = int(res[81:105],2)*1
-            self.ttr = int(res[105:],2)*0.01
             count_octets += self.len          
             return count_octets
      
@@ -860,18 +919,20 @@ class Item110:
         rep: int
         blocks: []
     
+        __slots__ = ('rep', 'blocks', 'exist')
+        len = 1
+
         def __init__(self):
             self.exist  = False
-            self.len    = 1
             self.rep    = 0
             self.blocks = []
         
         def add_blocks(self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            self.rep = int(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            self.rep = octetint(info_item)
             count_octets += self.len
             for i in range(self.rep): 
-                new_block = self.TID()
+                new_block = item.TID()
                 self.blocks.append(new_block)
                 count_octets = self.blocks[i].add_info(info, count_octets)
             return count_octets
@@ -889,21 +950,25 @@ class Item110:
         nav: int
         nvb: int
         
+        __slots__ = ('nav', 'nvb', 'fx', 'exist', 'spare')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('nav', 0, 1, BITS),
+                           ('nvb', 1, 2, BITS),
+                           ('fx', 7, 8, BITS))
+        
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.nav   = 0
             self.nvb   = 0
             self.spare = 0 
             self.fx    = 0 # There is no more documentacion about this FX
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = int(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
             self.exist = True 
-            self.nav = res[:1]
-            self.nvb = res[1:2]
-            self.fx = res[7:]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             count_octets += self.len            
             return count_octets
         
@@ -915,10 +980,11 @@ class Item110:
             return ""
    
             
+    FIELDS = bitfields(1,
+                       ('fx', 7, 8, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 0
-        self.hex   = 0
         self.tis   = self.TIS()
         self.tid   = self.RepTID()
         self.spare = 0
@@ -926,16 +992,14 @@ class Item110:
         
     def add_info(self, info = str, count_octets = int):
         lenght = 1
-        aux_count_octets = count_octets
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        res = "{0:08b}".format(int(info_item, 16))
+        info_item = info[count_octets:count_octets+lenght]
+        value = octetint(info_item)
+        extract_fields(self, value, self.FIELDS)
         count_octets += lenght
-        if res[:1] == '1':
+        if value & 0x80:
             count_octets = self.tis.add_info(self, info, count_octets)
-        if res[1:2] == '1':
+        if value & 0x40:
             count_octets = self.tid.add_blocks(self, info, count_octets)
-        self.fx = res[7:]
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
             
     def __str__(self):
@@ -949,18 +1013,20 @@ class Item130:
     latitude: int
     longitude: int
     
+    __slots__ = ('latitude', 'longitude', 'exist')
+    len = 6
+
+    FIELDS = bitfields(6,
+                       ('latitude', 0, 24, SIGNED, 180/pow(2,23)),
+                       ('longitude', 24, 48, SIGNED, 180/pow(2,23)))
+
     def __init__(self):
         self.exist     = False
-        self.len       = 6
-        self.hex       = 0
         self.latitude  = 0
         self.longitude = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.latitude  = twos_comp(int(res[:24], 2), len(res[:24]))*(180/pow(2,23)) 
-        self.longitude = twos_comp(int(res[24:], 2), len(res[24:]))*(180/pow(2,23))
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -975,18 +1041,20 @@ class Item131:
     latitude: int
     longitude: int
     
+    __slots__ = ('latitude', 'longitude', 'exist')
+    len = 8
+
+    FIELDS = bitfields(8,
+                       ('latitude', 0, 32, SIGNED, 180/pow(2,30)),
+                       ('longitude', 32, 64, SIGNED, 180/pow(2,30)))
+
     def __init__(self):
         self.exist     = False
-        self.len       = 8
-        self.hex       = 0
         self.latitude  = 0
         self.longitude = 0
 
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.latitude  = twos_comp(int(res[:32], 2), len(res[:32]))*(180/pow(2,30)) 
-        self.longitude = twos_comp(int(res[32:], 2), len(res[32:]))*(180/pow(2,30))
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -1000,16 +1068,18 @@ class Item131:
 class Item132:
     mam: int
     
+    __slots__ = ('mam', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('mam', 0, 8, SIGNED))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
-        self.hex   = 0
         self.mam   = 0
 
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.mam  = twos_comp(int(res, 2), len(res))*1
+        extract_fields(self, octetint(info), self.FIELDS)
 
     def __str__(self):
         return (
@@ -1022,16 +1092,18 @@ class Item132:
 class Item140:
     geom_height: int
     
+    __slots__ = ('geom_height', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('geom_height', 0, 16, SIGNED, 6.25))
+
     def __init__(self):
         self.exist       = False
-        self.len         = 2
-        self.hex         = 0
         self.geom_height = 0
 
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.geom_height = twos_comp(int(res, 2), len(res))*6.25
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -1044,16 +1116,18 @@ class Item140:
 class Item145:
     fl: int
     
+    __slots__ = ('fl', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('fl', 0, 16, SIGNED, 1/4))
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
-        self.hex   = 0
         self.fl    = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.fl = twos_comp(int(res, 2), len(res))*(1/4)
+        extract_fields(self, octetint(info), self.FIELDS)
 
     def __str__(self):
         return (
@@ -1068,20 +1142,22 @@ class Item146:
     source: int
     altitude: int
     
+    __slots__ = ('sas', 'source', 'altitude', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('sas', 0, 1, BITS),
+                       ('source', 1, 3, BITS),
+                       ('altitude', 3, 16, SIGNED, 25))
+
     def __init__(self):
         self.exist    = False
-        self.len      = 2
-        self.hex      = 0
         self.sas      = 0
         self.source   = 0
         self.altitude = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.sas = res[:1] 
-        self.source = res[1:3]
-        self.altitude = twos_comp(int(res[3:], 2), len(res[3:]))*25
+        extract_fields(self, octetint(info), self.FIELDS)
 
     def __str__(self):
         return (
@@ -1099,22 +1175,24 @@ class Item148:
     am: int
     altitude: int
     
+    __slots__ = ('mv', 'ah', 'am', 'altitude', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('mv', 0, 1, BITS),
+                       ('ah', 1, 2, BITS),
+                       ('am', 2, 3, BITS),
+                       ('altitude', 3, 16, SIGNED, 25))
+
     def __init__(self):
         self.exist    = False
-        self.len      = 2
-        self.hex      = 0
         self.mv       = 0
         self.ah       = 0
         self.am       = 0
         self.altitude = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.mv = res[:1] 
-        self.ah = res[1:2]
-        self.am = res[2:3]
-        self.altitude = twos_comp(int(res[3:], 2), len(res[3:]))*25
+        extract_fields(self, octetint(info), self.FIELDS)
       
     def __str__(self):
         return (
@@ -1131,19 +1209,21 @@ class Item150:
     im: int
     airspeed: int
     
+    __slots__ = ('im', 'airspeed', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('im', 0, 1),
+                       ('airspeed', 1, 16))
+
     def __init__(self):
         self.exist     = False
-        self.len       = 2
-        self.hex       = 0
         self.im        = 0
         self.airspeed  = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.im = int(res[:1], 2)
-        self.airspeed = int(res[1:], 2)
-        if self.im == '0':
+        extract_fields(self, octetint(info), self.FIELDS)
+        if self.im == 0:
             self.airspeed = self.airspeed*pow(2,-14)
         else:
             self.airspeed = self.airspeed*0.001
@@ -1161,18 +1241,20 @@ class Item151:
     re: int
     true_airspeed: int
     
+    __slots__ = ('re', 'true_airspeed', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('re', 0, 1, BITS),
+                       ('true_airspeed', 1, 16))
+
     def __init__(self):
         self.exist         = False
-        self.len           = 2
-        self.hex           = 0
         self.re            = 0
         self.true_airspeed = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.re = res[:1]
-        self.true_airspeed = int(res[1:], 2)
+        extract_fields(self, octetint(info), self.FIELDS)
 
     def __str__(self):
         return (
@@ -1186,16 +1268,18 @@ class Item151:
 class Item152:
     mag_heading: int
     
+    __slots__ = ('mag_heading', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('mag_heading', 0, 16, UNSIGNED, 360/pow(2,16)))
+
     def __init__(self):
         self.exist       = False
-        self.len         = 2
-        self.hex         = 0
         self.mag_heading = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.mag_heading = int(res, 2)*(360/pow(2,16))
+        extract_fields(self, octetint(info), self.FIELDS)
     
     def __str__(self):
         return (
@@ -1209,18 +1293,20 @@ class Item155:
     re: int
     bar_vert_rate: int
     
+    __slots__ = ('re', 'bar_vert_rate', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('re', 0, 1, BITS),
+                       ('bar_vert_rate', 1, 16, SIGNED, 6.25))
+
     def __init__(self):
         self.exist         = False
-        self.len           = 2
-        self.hex           = 0
         self.re            = 0
         self.bar_vert_rate = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.re = res[:1]
-        self.bar_vert_rate = twos_comp(int(res[1:], 2), len(res[1:]))*6.25
+        extract_fields(self, octetint(info), self.FIELDS)
     
     def __str__(self):
         return (
@@ -1235,18 +1321,20 @@ class Item157:
     re: int
     geo_vert_rate: int
     
+    __slots__ = ('re', 'geo_vert_rate', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('re', 0, 1, BITS),
+                       ('geo_vert_rate', 1, 16, SIGNED, 6.25))
+
     def __init__(self):
         self.exist         = False
-        self.len           = 2
-        self.hex           = 0
         self.re            = 0
         self.geo_vert_rate = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.re = res[:1]
-        self.geo_vert_rate = twos_comp(int(res[1:], 2), len(res[1:]))*6.25
+        extract_fields(self, octetint(info), self.FIELDS)
 
     def __str__(self):
         return (
@@ -1262,20 +1350,22 @@ class Item160:
     ground_speed: int
     track_angle: int
     
+    __slots__ = ('re', 'ground_speed', 'track_angle', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('re', 0, 1, BITS),
+                       ('ground_speed', 1, 16, UNSIGNED, 0.22),
+                       ('track_angle', 16, 32, UNSIGNED, 360/pow(2,16)))
+
     def __init__(self):
         self.exist        = False
-        self.len          = 4
-        self.hex          = 0
         self.re           = 0
         self.ground_speed = 0
         self.track_angle  = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.re = res[:1]
-        self.ground_speed = int(res[1:16], 2)*0.22
-        self.track_angle = int(res[16:], 2)*(360/pow(2,16))
+        extract_fields(self, octetint(info), self.FIELDS)
     
     def __str__(self):
         return (
@@ -1290,17 +1380,19 @@ class Item160:
 class Item161:
     track_number: int
     
+    __slots__ = ('track_number', 'exist', 'spare')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('track_number', 4, 16))
+
     def __init__(self):
         self.exist        = False
-        self.len          = 2
-        self.hex          = 0
         self.spare        = 0
         self.track_number = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.track_number = int(res[4:], 2)
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -1313,17 +1405,19 @@ class Item161:
 class Item165:
     tar: int
     
+    __slots__ = ('tar', 'exist', 'spare')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('tar', 4, 16, SIGNED, 1/32))
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
-        self.hex   = 0
         self.spare = 0
         self.tar   = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.tar = twos_comp(int(res[4:], 2), len(res[4:]))*(1/32)
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -1334,12 +1428,24 @@ class Item165:
 ######################################################
 @dataclass
 class Item170:
-    target_id: int = ""
-    
+    target_id: int
+    
+    __slots__ = ('target_id', 'char1', 'char2', 'char3', 'char4', 'char5',
+                 'char6', 'char7', 'char8', 'exist')
+    len = 6
+
+    FIELDS = bitfields(6,
+                       ('char1', 0, 6, BITS),
+                       ('char2', 6, 12, BITS),
+                       ('char3', 12, 18, BITS),
+                       ('char4', 18, 24, BITS),
+                       ('char5', 24, 30, BITS),
+                       ('char6', 30, 36, BITS),
+                       ('char7', 36, 42, BITS),
+                       ('char8', 42, 48, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 6
-        self.hex   = 0
         self.char1 = 0
         self.char2 = 0
         self.char3 = 0
@@ -1351,27 +1457,12 @@ class Item170:
         self.target_id = ""
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.char1 = res[:6]
-        self.char2 = res[6:12]
-        self.char3 = res[12:18]
-        self.char4 = res[18:24]
-        self.char5 = res[24:30]
-        self.char6 = res[30:36]
-        self.char7 = res[36:42]
-        self.char8 = res[42:]
+        value = octetint(info)
+        extract_fields(self, value, self.FIELDS)
         
         char_map = "#ABCDEFGHIJKLMNOPQRSTUVWXYZ#####_###############0123456789######"
-        char_len = 6
-        count_bits = 0
-        i = 0
-        while i < 8:
-            aux_char = res[count_bits:count_bits+char_len]
-            aux_map = int(aux_char,2)
-            self.target_id += char_map[aux_map]
-            count_bits += char_len
-            i += 1  
+        for shift in range(42, -1, -6):
+            self.target_id += char_map[(value >> shift) & 0x3F]
 
     def __str__(self):
         return (
@@ -1388,10 +1479,18 @@ class Item200:
     ps: int
     ss: int
     
+    __slots__ = ('icf', 'lnav', 'me', 'ps', 'ss', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('icf', 0, 1),
+                       ('lnav', 1, 2),
+                       ('me', 2, 3),
+                       ('ps', 3, 6),
+                       ('ss', 6, 8))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
-        self.hex   = 0
         self.icf   = 0
         self.lnav  = 0
         self.me    = 0
@@ -1399,13 +1498,7 @@ class Item200:
         self.ss    = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.icf = int(res[:1], 2)
-        self.lnav = int(res[1:2], 2)
-        self.me = int(res[2:3], 2)
-        self.ps = int(res[3:6], 2)
-        self.ss = int(res[6:], 2)
+        extract_fields(self, octetint(info), self.FIELDS)
 
     def __str__(self):
         return (
@@ -1424,21 +1517,23 @@ class Item210:
     vn: int
     ltt: int
     
+    __slots__ = ('vns', 'vn', 'ltt', 'exist', 'spare')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('vns', 1, 2),
+                       ('vn', 2, 5),
+                       ('ltt', 5, 8))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
-        self.hex   = 0
         self.spare = 0
         self.vns   = 0
         self.vn    = 0
         self.ltt   = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.vns = int(res[1:2], 2)
-        self.vn = int(res[2:5], 2)
-        self.ltt = int(res[5:], 2)
+        extract_fields(self, octetint(info), self.FIELDS)
 
     def __str__(self):
         return (
@@ -1455,18 +1550,24 @@ class Item220:
     temperature: 'Item220.Temperature()'
     turbulence:'Item220.Turbulence()'
      
+    __slots__ = ('wind_speed', 'wind_direction', 'temperature', 'turbulence',
+                 'fx', 'exist', 'spare')
+    len = 0
+
     @dataclass
     class Turbulence():
         turbulence: int
         
+        __slots__ = ('turbulence', 'exist')
+        len = 1
+
         def __init__(self):
             self.exist          = False
-            self.len            = 1 
             self.turbulence     = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = int(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            res = octetint(info_item)
             self.exist = True 
             self.turbulence = res
             count_octets += self.len            
@@ -1482,16 +1583,20 @@ class Item220:
     class Temperature():
         temperature: int
         
+        __slots__ = ('temperature', 'wind_direction', 'exist')
+        len = 2
+
+        FIELDS = bitfields(2,
+                           ('wind_direction', 0, 16, SIGNED, 0.25))
+
         def __init__(self):
             self.exist       = False
-            self.len         = 2 
             self.temperature = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.wind_direction = twos_comp(int(res, 2), len(res))*0.25            
             count_octets += self.len            
             return count_octets
         
@@ -1505,14 +1610,16 @@ class Item220:
     class WindDirection():
         wind_direction: int
         
+        __slots__ = ('wind_direction', 'exist')
+        len = 2
+
         def __init__(self):
             self.exist          = False
-            self.len            = 2 
             self.wind_direction = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = int(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            res = octetint(info_item)
             self.exist = True 
             self.wind_direction = res
             count_octets += self.len            
@@ -1528,14 +1635,16 @@ class Item220:
     class WindSpeed():
         wind_speed: int
         
+        __slots__ = ('wind_speed', 'exist')
+        len = 2
+
         def __init__(self):
             self.exist      = False
-            self.len        = 2 
             self.wind_speed = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = int(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            res = octetint(info_item)            
             self.exist = True 
             self.wind_speed = res
             count_octets += self.len
@@ -1548,10 +1657,11 @@ class Item220:
             return ""
 
             
+    FIELDS = bitfields(1,
+                       ('fx', 7, 8, BITS))
+
     def __init__(self):
         self.exist          = False
-        self.len            = 0
-        self.hex            = 0
         self.wind_speed     = self.WindSpeed()
         self.wind_direction = self.WindDirection()
         self.temperature    = self.Temperature()
@@ -1561,23 +1671,21 @@ class Item220:
         
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1 
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        res = "{0:08b}".format(int(info_item, 16))
+        info_item = info[count_octets:count_octets+lenght]
+        value = octetint(info_item)
+        extract_fields(self, value, self.FIELDS)
         count_octets += lenght
         
-        if res[:1] == '1':
+        if value & 0x80:
             count_octets = self.wind_speed.add_info(self, info, count_octets)
-        if res[1:2] == '1':
+        if value & 0x40:
             count_octets = self.wind_direction.add_info(self, info, count_octets)
-        if res[2:3] == '1':
+        if value & 0x20:
             count_octets = self.temperature.add_info(self, info, count_octets)
-        if res[3:4] == '1':
+        if value & 0x10:
             count_octets = self.turbulence.add_info(self, info, count_octets)
         
-        self.fx = res[7:]
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
         
     def __str__(self):
@@ -1591,16 +1699,18 @@ class Item220:
 class Item230:
     roll_angle: int
     
+    __slots__ = ('roll_angle', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('roll_angle', 0, 16, SIGNED, 0.01))
+
     def __init__(self):
         self.exist      = False
-        self.len        = 2
-        self.hex        = 0
         self.roll_angle = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.roll_angle = twos_comp(int(res, 2), len(res))*0.01
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -1616,29 +1726,44 @@ class Item250:
     #rep: int
     blocks: []
     
+    __slots__ = ('blocks', 'exist', 'rep')
+    len = 0
+
     @dataclass
     class BDS:
         bdsdata: int
         bds1: int
         bds2: int
         
+        __slots__ = ('bdsdata', 'bds1', 'bds2', 'exist')
+        len = 8
+
+        FIELDS = bitfields(8,
+                           ('bds1', 56, 60, BITS),
+                           ('bds2', 60, 64, BITS))
+
         def __init__(self):
             self.exist   = False
-            self.len     = 8
             self.bdsdata = 0
             self.bds1    = 0
             self.bds2    = 0
         
         def add_info (self, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.bdsdata = info_item[:-2]
-            self.bds1 = res[56:60]
-            self.bds2 = res[60:]
+            self.bdsdata = info_item[:-1].hex().upper()
             count_octets += self.len            
             return count_octets
         
+        def modes(self):
+            """
+            Decoded register (BDS44/50/60), from the register cache shared
+            with CAT48 (see classmodes.decode_modes).
+            """
+            bds_type = "BDS{}{}".format(int(self.bds1, 2), int(self.bds2, 2))
+            return classmodes.decode_modes(int(self.bdsdata, 16), bds_type)
+        
         def __str__(self):
             return (
                 f' BDS Reg. Data: {self.bdsdata}\n'
@@ -1648,16 +1773,13 @@ class Item250:
         
     def __init__(self):
         self.exist  = False
-        self.len    = 0
-        self.hex    = 0
         self.rep    = 0
         self.blocks = []
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        self.rep = int(info_item, 16)
+        info_item = info[count_octets:count_octets+lenght]
+        self.rep = octetint(info_item)
         count_octets += lenght 
         
         for i in range(self.rep): 
@@ -1665,7 +1787,6 @@ class Item250:
             self.blocks.append(new_block)
             count_octets = self.blocks[i].add_info(info, count_octets)
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
 
     def __str__(self):
@@ -1688,10 +1809,22 @@ class Item260:
     tti: int
     tid: int
     
+    __slots__ = ('typ', 'styp', 'ara', 'rac', 'rat', 'mte', 'tti', 'tid',
+                 'exist')
+    len = 7
+
+    FIELDS = bitfields(7,
+                       ('typ', 0, 5, BITS),
+                       ('styp', 5, 8, BITS),
+                       ('ara', 8, 22, BITS),
+                       ('rac', 22, 26, BITS),
+                       ('rat', 26, 27, BITS),
+                       ('mte', 27, 28, BITS),
+                       ('tti', 28, 30, BITS),
+                       ('tid', 30, 56, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 7
-        self.hex   = 0
         self.typ   = 0
         self.styp  = 0
         self.ara   = 0
@@ -1702,17 +1835,7 @@ class Item260:
         self.tid   = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.len   = res[:5]
-        self.typ   = res[5:8]
-        self.styp  = res[8:16]
-        self.ara   = res[16:22]
-        self.rac   = res[22:26]
-        self.rat   = res[26:27]
-        self.mte   = res[27:28]
-        self.tti   = res[28:30]
-        self.tid   = res[30:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -1733,23 +1856,30 @@ class Item271:
     primary: 'Item271.Primary()'
     first_ext: 'Item271.FirstExt()'
     
+    __slots__ = ('primary', 'first_ext', 'exist')
+    len = 0
+
     @dataclass
     class FirstExt:
         l_w: int
         
+        __slots__ = ('l_w', 'fx', 'exist', 'spare')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('l_w', 0, 4),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.l_w   = 0
             self.spare = 0
             self.fx    = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.l_w = int(res[:4], 16)
-            self.fx  = res[7:]
             count_octets += self.len
             return count_octets
    
@@ -1767,9 +1897,20 @@ class Item271:
         ras: int
         ident: int
         
+        __slots__ = ('poa', 'cdti_s', 'b2_low', 'ras', 'ident', 'fx', 'exist',
+                     'spare')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('poa', 2, 3, BITS),
+                           ('cdti_s', 3, 4, BITS),
+                           ('b2_low', 4, 5, BITS),
+                           ('ras', 5, 6, BITS),
+                           ('ident', 6, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist  = False
-            self.len    = 1 
             self.spare  = 0
             self.poa    = 0
             self.cdti_s = 0
@@ -1779,15 +1920,9 @@ class Item271:
             self.fx     = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.poa = res[2:3]
-            self.cdti_s = res[3:4]
-            self.b2_low = res[4:5]
-            self.ras    = res[5:6]
-            self.ident  = res[6:7]
-            self.fx  = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.first_ext.add_info(item, info, count_octets)
@@ -1805,18 +1940,14 @@ class Item271:
         
     def __init__(self):
         self.exist      = False
-        self.len        = 0
-        self.hex        = 0
         self.primary    = self.Primary()
         self.first_ext  = self.FirstExt()
         
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         self.exist = True
         count_octets = self.primary.add_info(self, info, count_octets)
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
 
     def __str__(self):
@@ -1829,14 +1960,16 @@ class Item271:
 class DataAge:
     data: int
     
+    __slots__ = ('data', 'exist')
+    len = 1
+
     def __init__(self):
         self.exist = False
-        self.len   = 1 
         self.data  = 0
     
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = int(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        res = octetint(info_item)        
         self.exist = True 
         self.data = res*0.1
         count_octets += self.len        
@@ -1852,14 +1985,19 @@ class Item295:
     octet_3: 'Item295.Octet3()'
     octet_4: 'Item295.Octet4()'
     
+    __slots__ = ('octet_1', 'octet_2', 'octet_3', 'octet_4', 'exist', 'fx')
+    len = 0
+
     @dataclass
     class Octet4:
         ara: DataAge()
         scc: DataAge()
         
+        __slots__ = ('ara', 'scc', 'exist', 'octet', 'spare', 'fx')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.octet = 0
             self.ara   = DataAge()
             self.scc   = DataAge()
@@ -1891,9 +2029,12 @@ class Item295:
         met: DataAge()
         roa: DataAge()
         
+        __slots__ = ('gvr', 'gv', 'tar', 'ti', 'ts', 'met', 'roa', 'exist',
+                     'octet', 'fx')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.octet = 0
             self.gvr   = DataAge()
             self.gv    = DataAge()
@@ -1942,9 +2083,12 @@ class Item295:
         mh: DataAge()
         bvr: DataAge()
         
+        __slots__ = ('fl', 'sal', 'fsa', 'asa', 'tas', 'mh', 'bvr', 'exist',
+                     'octet', 'fx')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.octet = 0
             self.fl    = DataAge()
             self.sal   = DataAge()
@@ -1993,9 +2137,12 @@ class Item295:
         mam: DataAge()
         gh: DataAge()
         
+        __slots__ = ('aos', 'trd', 'm3a', 'qi', 'ti', 'mam', 'gh', 'exist',
+                     'octet', 'fx')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.octet = 0
             self.aos   = DataAge()
             self.trd   = DataAge()
@@ -2036,8 +2183,6 @@ class Item295:
     
     def __init__(self):
         self.exist   = False
-        self.len     = 0
-        self.hex     = 0
         self.octet_1 = self.Octet1()
         self.octet_2 = self.Octet2()
         self.octet_3 = self.Octet3()
@@ -2046,35 +2191,34 @@ class Item295:
         
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        res = "{0:08b}".format(int(info_item, 16))
-        self.octet_1.octet = res
+        info_item = info[count_octets:count_octets+lenght]
+        octet = octetint(info_item)
+        self.octet_1.octet = format(octet, '08b')
         self.octet_1.exist = True
         count_octets += lenght
-        if res[7:] == '1':
+        if octet & 0x01:
             
-            info_item = info[count_octets*2:count_octets*2+lenght*2]
-            res = "{0:08b}".format(int(info_item, 16))
-            self.octet_2.octet = res
+            info_item = info[count_octets:count_octets+lenght]
+            octet = octetint(info_item)
+            self.octet_2.octet = format(octet, '08b')
             self.octet_2.exist = True
             count_octets += lenght
-            if res[7:] == '1':
+            if octet & 0x01:
             
-                info_item = info[count_octets*2:count_octets*2+lenght*2]
-                res = "{0:08b}".format(int(info_item, 16))
-                self.octet_3.octet = res
+                info_item = info[count_octets:count_octets+lenght]
+                octet = octetint(info_item)
+                self.octet_3.octet = format(octet, '08b')
                 self.octet_3.exist = True
                 count_octets += lenght
-                if res[7:] == '1':
+                if octet & 0x01:
             
-                    info_item = info[count_octets*2:count_octets*2+lenght*2]
-                    res = "{0:08b}".format(int(info_item, 16))
-                    self.octet_4.octet = res
+                    info_item = info[count_octets:count_octets+lenght]
+                    octet = octetint(info_item)
+                    self.octet_4.octet = format(octet, '08b')
                     self.octet_4.exist = True
                     count_octets += lenght
-                    self.fx  = res[7:]
+                    self.fx  = '1' if octet & 0x01 else '0'
         
         if self.octet_1.exist:
             count_octets = self.octet_1.add_info(self, info, count_octets)
@@ -2088,7 +2232,6 @@ class Item295:
                     if self.octet_4.exist:
                         count_octets = self.octet_4.add_info(self, info, count_octets)      
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets 
     
     def __str__(self):
@@ -2100,15 +2243,15 @@ class Item295:
 class Item400:
     rid: int
     
+    __slots__ = ('rid', 'exist')
+    len = 1
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
-        self.hex   = 0
         self.rid   = 0
         
     def add_info(self, info):
-        self.hex = info
-        self.rid = hexabin(info, 16)
+        self.rid = octetbin(info)
 
     def __str__(self):
         return (
@@ -2123,16 +2266,20 @@ class Item400:
 class BPS:
     bps: int
     
+    __slots__ = ('bps', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('bps', 4, 16, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
         self.bps   = 0
                 
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True 
-        self.bps = res[4:]
         self.bps = int(self.bps, 2)*0.1
         count_octets += self.len            
         return count_octets
@@ -2152,20 +2299,24 @@ class SelH:
     stat: int
     selh: int
     
+    __slots__ = ('hrd', 'stat', 'selh', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('hrd', 4, 5, BITS),
+                       ('stat', 5, 6, BITS),
+                       ('selh', 6, 16, UNSIGNED, 0.703125))
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
         self.hrd   = 0
         self.stat  = 0
         self.selh  = 0
 
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True 
-        self.hrd = res[4:5]
-        self.stat = res[5:6]
-        self.selh = int(res[6:], 2)*0.703125
         count_octets += self.len
         
         return count_octets
@@ -2189,9 +2340,17 @@ class NAV:
     am: int
     mfm: int
     
+    __slots__ = ('ap', 'vn', 'ah', 'am', 'mfm', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('ap', 0, 1, BITS),
+                       ('vn', 1, 2, BITS),
+                       ('ah', 2, 3, BITS),
+                       ('am', 3, 4, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
         self.ap    = 0
         self.vn    = 0
         self.ah    = 0
@@ -2199,15 +2358,12 @@ class NAV:
         self.mfm   = 0
 
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)
+        info_item = info[count_octets:count_octets+self.len]
+        value = octetint(info_item)
+        extract_fields(self, value, self.FIELDS)
         self.exist = True 
-        self.ap = res[:1]
-        self.vn = res[1:2]
-        self.ah = res[2:3]
-        self.am = res[3:4]
-        if res[4] == '1':
-            self.mfm = res[5:6]
+        if value & 0x08:
+            self.mfm = '1' if value & 0x04 else '0'
         count_octets += self.len
             
         return count_octets
@@ -2230,18 +2386,22 @@ class GAO:
     lateral: int
     longitudinal: int
     
+    __slots__ = ('lateral', 'longitudinal', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('lateral', 0, 3, UNSIGNED, 2),
+                       ('longitudinal', 3, 8, UNSIGNED, 2))
+
     def __init__(self):
         self.exist        = False
-        self.len          = 1
         self.lateral      = 0
         self.longitudinal = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True 
-        self.lateral = int(res[:3], 2)*2
-        self.longitudinal = int(res[3:])*2
         count_octets += self.len
         
         return count_octets
@@ -2261,22 +2421,29 @@ class SGV:
     primary: 'SGV.Primary()'
     first_ext: 'SGV.FirstExt()'
     
+    __slots__ = ('primary', 'first_ext', 'exist')
+    len = 0
+
     @dataclass
     class FirstExt:
         hgt: int
         
+        __slots__ = ('hgt', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('hgt', 0, 7, UNSIGNED, 2.8125),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.hgt   = 0
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.hgt = int(res[:7], 2)*2.8125
-            self.fx  = res[7:]
             count_octets += self.len
                 
             return count_octets
@@ -2294,9 +2461,19 @@ class SGV:
         hrd: int
         gss: int
 
+        __slots__ = ('stp', 'hts', 'htt', 'hrd', 'gss', 'fx', 'exist')
+        len = 2
+
+        FIELDS = bitfields(2,
+                           ('stp', 0, 1, BITS),
+                           ('hts', 1, 2, BITS),
+                           ('htt', 2, 3, BITS),
+                           ('hrd', 3, 4, BITS),
+                           ('gss', 4, 15, UNSIGNED, 0.125),
+                           ('fx', 15, 16, BITS))
+
         def __init__(self):
             self.exist  = False
-            self.len    = 2
             self.stp    = 0
             self.hts    = 0
             self.htt    = 0
@@ -2305,15 +2482,9 @@ class SGV:
             self.fx     = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.stp = res[:1]
-            self.hts = res[1:2]
-            self.htt = res[2:3]
-            self.hrd = res[3:4]
-            self.gss = int(res[4:17], 2)*0.125
-            self.fx  = res[-1]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.first_ext.add_info(item, info, count_octets)
@@ -2331,7 +2502,6 @@ class SGV:
 
     def __init__(self):
         self.exist      = False
-        self.len        = 0
         self.primary    = self.Primary()
         self.first_ext  = self.FirstExt()
         
@@ -2355,23 +2525,32 @@ class STA:
     fourth_ext: 'STA.FourthExt()'
     fifth_ext: 'STA.FifthExt()'
     
+    __slots__ = ('primary', 'first_ext', 'second_ext', 'third_ext',
+                 'fourth_ext', 'fifth_ext', 'exist')
+    len = 0
+
     @dataclass
     class FifthExt:
         tao: int
         
+        __slots__ = ('tao', 'fx', 'exist', 'svh')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.tao   = 0
             self.fx    = 0  #No especifica uso de siguiente extensión
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))                
+            info_item = info[count_octets:count_octets+self.len]
+            value = octetint(info_item)
+            extract_fields(self, value, self.FIELDS)
             self.exist = True 
-            if res[:1] == '1':
-                self.svh = res[1:6]
-            self.fx  = res[-1]
+            if value & 0x80:
+                self.svh = format((value >> 2) & 0x1F, '05b')
             count_octets += self.len
             return count_octets
     
@@ -2385,22 +2564,27 @@ class STA:
         svh: int
         catc: int
         
+        __slots__ = ('svh', 'catc', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.svh   = 0
             self.catc  = 0
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            value = octetint(info_item)
+            extract_fields(self, value, self.FIELDS)
             self.exist = True 
-            if res[:1] == '1':
-                self.svh = int(res[1:3], 2)
-            if res[3:4] == '1':
-                self.catc = int(res[4:7], 2)
-            self.fx  = res[-1]
+            if value & 0x80:
+                self.svh = (value >> 5) & 0x3
+            if value & 0x10:
+                self.catc = (value >> 1) & 0x7
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.fifth_ext.add_info(item, info, count_octets)                
@@ -2419,22 +2603,27 @@ class STA:
         daa: int
         df17ca: int
         
+        __slots__ = ('daa', 'df17ca', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist  = False
-            self.len    = 1 
             self.daa    = 0
             self.df17ca = 0
             self.fx     = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))                
+            info_item = info[count_octets:count_octets+self.len]
+            value = octetint(info_item)
+            extract_fields(self, value, self.FIELDS)
             self.exist = True 
-            if res[:1] == '1':
-                self.daa = int(res[1:3], 2)
-            if res[3:4] == '1':
-                self.df17ca = int(res[4:7], 2)
-            self.fx  = res[-1]
+            if value & 0x80:
+                self.daa = (value >> 5) & 0x3
+            if value & 0x10:
+                self.df17ca = (value >> 1) & 0x7
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.fourth_ext.add_info(item, info, count_octets)                
@@ -2454,25 +2643,30 @@ class STA:
         muo: int
         rwc: int
         
+        __slots__ = ('tsi', 'muo', 'rwc', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.tsi   = 0
             self.muo   = 0
             self.rwc   = 0
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))                
+            info_item = info[count_octets:count_octets+self.len]
+            value = octetint(info_item)
+            extract_fields(self, value, self.FIELDS)
             self.exist = True 
-            if res[:1] == '1':
-                self.tsi = int(res[1:3], 2)
-            if res[3:4] == '1':
-                self.muo = int(res[4:5], 2)
-            if res[5:6] == '1':
-                self.rwc = int(res[6:7], 2)
-            self.fx  = res[-1]
+            if value & 0x80:
+                self.tsi = (value >> 5) & 0x3
+            if value & 0x10:
+                self.muo = (value >> 3) & 0x1
+            if value & 0x04:
+                self.rwc = (value >> 1) & 0x1
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.third_ext.add_info(item, info, count_octets)                
@@ -2492,22 +2686,27 @@ class STA:
         ps3: int
         ptw: int
         
+        __slots__ = ('ps3', 'ptw', 'fx', 'exist', 'tpw')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.ps3   = 0
             self.ptw   = 0
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))                
+            info_item = info[count_octets:count_octets+self.len]
+            value = octetint(info_item)
+            extract_fields(self, value, self.FIELDS)
             self.exist = True
-            if res[:1] == '1':
-                self.ps3 = int(res[1:4], 2)
-            if res[4:5] == '1':
-                self.tpw = int(res[5:7], 2)
-            self.fx  = res[-1]
+            if value & 0x80:
+                self.ps3 = (value >> 4) & 0x7
+            if value & 0x08:
+                self.tpw = (value >> 1) & 0x3
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.second_ext.add_info(item, info, count_octets)                
@@ -2528,9 +2727,16 @@ class STA:
         rce: int
         rrl: int
 
+        __slots__ = ('es', 'uat', 'rce', 'rrl', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('es', 0, 1, BITS),
+                           ('uat', 1, 2, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist  = False
-            self.len    = 1
             self.es     = 0
             self.uat    = 0
             self.rce    = 0
@@ -2538,16 +2744,14 @@ class STA:
             self.fx     = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))            
+            info_item = info[count_octets:count_octets+self.len]
+            value = octetint(info_item)
+            extract_fields(self, value, self.FIELDS)
             self.exist = True 
-            self.es = res[:1]
-            self.uat = res[1:2]
-            if res[2:3] == '1':
-                self.rce = int(res[3:5], 2)
-            if res[5:6] == '1':
-                self.rrl = res[6:7]
-            self.fx  = res[-1]
+            if value & 0x20:
+                self.rce = (value >> 3) & 0x3
+            if value & 0x04:
+                self.rrl = '1' if value & 0x02 else '0'
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.first_ext.add_info(item, info, count_octets)
@@ -2565,7 +2769,6 @@ class STA:
 
     def __init__(self):
         self.exist      = False
-        self.len        = 0
         self.primary    = self.Primary()
         self.first_ext  = self.FirstExt()
         self.second_ext = self.SecondExt()
@@ -2590,16 +2793,20 @@ class STA:
 class TNH:
     true_north_hea: int
     
+    __slots__ = ('true_north_hea', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('true_north_hea', 0, 16, UNSIGNED, 360/pow(2,16)))
+
     def __init__(self):
         self.exist          = False
-        self.len            = 2
         self.true_north_hea = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True 
-        self.true_north_hea = int(res, 2)*(360/pow(2,16))
         count_octets += self.len        
         return count_octets
     
@@ -2621,6 +2828,10 @@ class MES:
     fom: 'MES.FOM()'
     m2: 'MES.M2()'
     
+    __slots__ = ('summ', 'pno', 'em1', 'xp', 'fom', 'm2', 'octet', 'fx',
+                 'exist')
+    len = 1
+
     @dataclass
     class SUM:
         m5: int
@@ -2632,9 +2843,22 @@ class MES:
         mc: int
         po: int
     
+        __slots__ = ('m5', 'idd', 'da', 'm1', 'm2', 'm3', 'mc', 'po', 'id',
+                     'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('m5', 0, 1, BITS),
+                           ('id', 1, 2, BITS),
+                           ('da', 2, 3, BITS),
+                           ('m1', 3, 4, BITS),
+                           ('m2', 4, 5, BITS),
+                           ('m3', 5, 6, BITS),
+                           ('mc', 6, 7, BITS),
+                           ('po', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1
             self.m5    = 0
             self.idd   = 0
             self.da    = 0
@@ -2645,17 +2869,9 @@ class MES:
             self.po    = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.m5    = res[:1]
-            self.id    = res[1:2]
-            self.da    = res[2:3]
-            self.m1    = res[3:4]
-            self.m2    = res[4:5]
-            self.m3    = res[5:6]
-            self.mc    = res[6:7]
-            self.po    = res[7:]
             count_octets += self.len            
             return count_octets
         
@@ -2678,18 +2894,22 @@ class MES:
         pin: int
         no: int
     
+        __slots__ = ('pin', 'no', 'exist')
+        len = 4
+
+        FIELDS = bitfields(4,
+                           ('pin', 2, 16, BITS),
+                           ('no', 22, 32, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 4
             self.pin   = 0
             self.no    = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.pin   = res[2:16]
-            self.no    = res[22:]
             count_octets += self.len            
             return count_octets
 
@@ -2707,20 +2927,24 @@ class MES:
         l: int
         em1: int
     
+        __slots__ = ('v', 'l', 'em1', 'exist')
+        len = 2
+
+        FIELDS = bitfields(2,
+                           ('v', 0, 1, BITS),
+                           ('l', 2, 3, BITS),
+                           ('em1', 4, 16, OCTAL))
+
         def __init__(self):
             self.exist = False
-            self.len   = 2
             self.v     = 0
             self.l     = 0
             self.em1   = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.v   = res[:1]
-            self.l   = res[2:3]
-            self.em1 = oct(int(res[4:], 2))
             count_octets += self.len            
             return count_octets
         
@@ -2742,9 +2966,19 @@ class MES:
         x2: int
         x1: int
     
+        __slots__ = ('xp', 'x5', 'xc', 'x3', 'x2', 'x1', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('xp', 2, 3, BITS),
+                           ('x5', 3, 4, BITS),
+                           ('xc', 4, 5, BITS),
+                           ('x3', 5, 6, BITS),
+                           ('x2', 6, 7, BITS),
+                           ('x1', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1
             self.xp    = 0
             self.x5    = 0
             self.xc    = 0
@@ -2753,15 +2987,9 @@ class MES:
             self.x1    = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.xp    = res[2:3]
-            self.x5    = res[3:4]
-            self.xc    = res[4:5]
-            self.x3    = res[5:6]
-            self.x2    = res[6:7]
-            self.x1    = res[7:]
             count_octets += self.len            
             return count_octets
         
@@ -2781,16 +3009,20 @@ class MES:
     class FOM:
         fom: int
     
+        __slots__ = ('fom', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('fom', 3, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1
             self.fom   = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.fom   = res[3:]
             count_octets += self.len            
             return count_octets 
 
@@ -2807,20 +3039,24 @@ class MES:
         l: int
         m2: int
     
+        __slots__ = ('v', 'l', 'm2', 'em2', 'exist')
+        len = 2
+
+        FIELDS = bitfields(2,
+                           ('v', 0, 1, BITS),
+                           ('l', 2, 3, BITS),
+                           ('em2', 4, 16, OCTAL))
+
         def __init__(self):
             self.exist = False
-            self.len   = 2
             self.v     = 0
             self.l     = 0
             self.m2    = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.v   = res[:1]
-            self.l   = res[2:3]
-            self.em2 = oct(int(res[4:], 2))
             count_octets += self.len            
             return count_octets  
         
@@ -2834,9 +3070,12 @@ class MES:
             return ""
         
         
+    FIELDS = bitfields(1,
+                       ('octet', 0, 8, BITS),
+                       ('fx', 7, 8, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1 
         self.octet = 0
         self.summ  = self.SUM()
         self.pno   = self.PNO()
@@ -2847,11 +3086,9 @@ class MES:
         self.fx    = 0
     
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = "{0:08b}".format(int(info_item, 16))
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.octet = res
-        self.fx = res[-1]
         count_octets += self.len
         
         if self.octet[0] == '1':
@@ -2883,6 +3120,9 @@ class MES:
 class RE:
     data: 'RE.Data()'
     
+    __slots__ = ('data', 'exist', 'len_indicator')
+    len = 0
+
     @dataclass
     class Data:
         bps: BPS()
@@ -2894,9 +3134,15 @@ class RE:
         tnh: TNH()
         mes: MES()
     
+        __slots__ = ('bps', 'selh', 'nav', 'gao', 'sgv', 'sta', 'tnh', 'mes',
+                     'octet', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('octet', 0, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.octet = 0
             self.bps   = BPS()
             self.selh  = SelH()
@@ -2908,10 +3154,9 @@ class RE:
             self.mes   = MES()
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.octet = res
             count_octets += self.len
             
             if self.octet[0] == '1':
@@ -2943,20 +3188,16 @@ class RE:
     
     def __init__(self):
         self.exist           = False
-        self.len             = 0
-        self.hex             = 0
         self.len_indicator   = 0
         self.data            = self.Data()
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1
-        self.len_indicator = info[count_octets*2:count_octets*2+lenght*2]
-        #aux_count = count_octets + int(self.len_indicator,16)
+        self.len_indicator = octetint(info[count_octets:count_octets+lenght])
+        #aux_count = count_octets + self.len_indicator
         count_octets += lenght
         count_octets = self.data.add_info(self, info, count_octets)
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         #if count_octets == aux_count:
         #    print("----CORRECT READ LENGTH----")
             
@@ -2970,10 +3211,15 @@ class RE:
 @dataclass
 class ItemNotUsed:
     
+    __slots__ = ('exist',)
+    len = 0
+
     def __init__(self):
         self.exist           = False
-        self.len             = 0   
-        self.hex             = 0
+        
+    def add_info(self, info = str, count_octets = int):
+        # Its length is unknown, so the rest of the record cannot be read
+        raise ValueError("Item not used (spare FRN) present on FSPEC")
         
     def __str__(self, item):
         return 'Item not used\n\n'
@@ -3025,132 +3271,130 @@ class BlockCat21:
     item260: Item260()
     item400: Item400()
     item295: Item295()
+    frn43  : ItemNotUsed()
+    frn44  : ItemNotUsed()
+    frn45  : ItemNotUsed()
+    frn46  : ItemNotUsed()
+    frn47  : ItemNotUsed()
     re     : RE()
     sp     : ItemNotUsed()
     
-    def __init__(self):
+    _items = None
+    
+    def __init__(self, lazy: bool = False, items = None):
+        # Only the items present in the record are set on the block, absent
+        # ones are the empty item shared by all blocks (see install_items)
         self.fspec   = 0
-        self.item010 = Item010()
-        self.item040 = Item040()
-        self.item161 = Item161()
-        self.item015 = Item015()
-        self.item071 = Item071()
-        self.item130 = Item130()
-        self.item131 = Item131()
-        self.item072 = Item072()
-        self.item150 = Item150()
-        self.item151 = Item151()
-        self.item080 = Item080()
-        self.item073 = Item073()
-        self.item074 = Item074()
-        self.item075 = Item075()
-        self.item076 = Item076()
-        self.item140 = Item140()
-        self.item090 = Item090()
-        self.item210 = Item210()
-        self.item070 = Item070()
-        self.item230 = Item230()
-        self.item145 = Item145()
-        self.item152 = Item152()
-        self.item200 = Item200()
-        self.item155 = Item155()
-        self.item157 = Item157()
-        self.item160 = Item160()
-        self.item165 = Item165()
-        self.item077 = Item077()
-        self.item170 = Item170()
-        self.item020 = Item020()
-        self.item220 = Item220()
-        self.item146 = Item146()
-        self.item148 = Item148()
-        self.item110 = Item110()
-        self.item016 = Item016()
-        self.item008 = Item008()
-        self.item271 = Item271()
-        self.item132 = Item132()
-        self.item250 = Item250()
-        self.item260 = Item260()
-        self.item400 = Item400()
-        self.item295 = Item295()
-        self.frn43   = ItemNotUsed()
-        self.frn44   = ItemNotUsed()
-        self.frn45   = ItemNotUsed()
-        self.frn46   = ItemNotUsed()
-        self.frn47   = ItemNotUsed()
-        self.re      = RE()
-        self.sp      = ItemNotUsed()
-    
-
-    def add_items(self, info: str, count_octets: int, message_info):
-        nombres_atributos = list(self.__dict__.keys())
-        i = 0
-        for nombre in nombres_atributos[1:]:
-            if self.fspec[i] != '0':
-                valor_item = getattr(self, nombre)
-                if valor_item.len > 0:
-                    info_item = info[count_octets*2:count_octets*2+valor_item.len*2]
-                    valor_item.add_info(info_item)
-                    count_octets += valor_item.len
-                else:
-                    count_octets = valor_item.add_info(info, count_octets)
-                message_info.modify_count(count_octets)        
-            #else:
-            #    print("_______________________________________")
-            #    print("ITEM NO INCLUIDO00: {}".format(nombre))  
-            i += 1
-            if i >= len(self.fspec):
+        if items is not None:
+            # Item projection: only these items are decoded
+            self._items = frozenset(items)
+        if lazy:
+            # Fixed-length items are decoded on first access, see load_item
+            self._info    = b""
+            self._offsets = {}
+    
+
+    def add_items(self, info: bytes, count_octets: int, message_info, frns):
+        uap = self.UAP
+        items = self._items
+        offsets = self.__dict__.get('_offsets')
+        if offsets is not None:
+            self._info = info
+        for frn in frns:
+            if frn >= len(uap):
                 break
+            nombre, length = uap[frn]
+            if items is not None and nombre not in items and (length > 0 or nombre in self.SKIP):
+                # Not requested: skip it by its length, without decoding it
+                if count_octets >= len(info):
+                    raise ValueError("Truncated record: no octets left to decode")
+                if length > 0:
+                    count_octets += length
+                else:
+                    count_octets = self.SKIP[nombre](info, count_octets)
+            elif length > 0 and offsets is not None:
+                # Lazy: only keep where the item starts
+                if count_octets >= len(info):
+                    raise ValueError("Truncated record: no octets left to decode")
+                offsets[nombre] = count_octets
+                count_octets += length
+            elif length > 0:
+                getattr(self, nombre).add_info(info[count_octets:count_octets+length])
+                count_octets += length
+            else:
+                valor_item = self.__dict__.get(nombre)
+                if valor_item is None:
+                    valor_item = self.new_item(nombre)
+                    valor_item.exist = True
+                    setattr(self, nombre, valor_item)
+                count_octets = valor_item.add_info(info, count_octets)
+            if count_octets > len(info):
+                # The item (decoded or skipped) runs past the end of the record
+                raise ValueError("Truncated record: no octets left to decode")
+            message_info.modify_count(count_octets)
         return count_octets
         
     
-    def modify_exist(self, fspec):       
-        # Get item names of instance
-        nombres_atributos = list(self.__dict__.keys())
-        i = 0
-        for nombre in nombres_atributos[1:]:
-            if fspec[i] != '0':
-                valor_actual = getattr(self, nombre)
-                setattr(valor_actual, 'exist', True)
-            #else:
-            #  print("ITEM NO INCLUIDO-O: {}".format(nombre))  
-            i += 1
-            if i >= len(fspec):
+    def modify_exist(self, frns):
+        if '_offsets' in self.__dict__:
+            # Lazy blocks mark their items when they are created
+            return
+        uap = self.UAP
+        items = self._items
+        for frn in frns:
+            if frn >= len(uap):
                 break
+            nombre = uap[frn][0]
+            if items is None or nombre in items:
+                valor_item = self.new_item(nombre)
+                valor_item.exist = True
+                setattr(self, nombre, valor_item)
 
 
+    def item_names(self):
+        if self._items is None:
+            return [nombre for nombre, length in self.UAP]
+        return [nombre for nombre, length in self.UAP if nombre in self._items]
+    
+    
+    def new_item(self, nombre):
+        return self.ITEM_TYPES[nombre]()
+    
+
+    def load_item(self, nombre):
+        # Lazy blocks: fixed-length item decoded the first time it is read
+        count_octets = self._offsets[nombre]
+        valor_item = self.new_item(nombre)
+        valor_item.exist = True
+        valor_item.add_info(self._info[count_octets:count_octets+valor_item.len])
+        setattr(self, nombre, valor_item)
+        return valor_item
+    
+
     def check_fspec(self, line, count_octets):
-        fspec = ""
-        while True:
-            octet = line[count_octets*2:count_octets*2+2]
-            count_octets += 1
-            res = "{0:08b}".format(int(octet, 16))
-            final = res[7]
-            fspec += res[0:7]
-            if final != '1':
-                break
-        return fspec, count_octets
+        return read_fspec(line, count_octets)
     
 
-    def add_fspec(self, fspec):
+    def add_fspec(self, fspec, frns):
         self.fspec = fspec
-        self.modify_exist(fspec)
+        self.modify_exist(frns)
         
         
     def add_block(self, info, count, message_info):
-        fspec, count_octets = self.check_fspec(info, count)
-        self.add_fspec(fspec)
-        count_octets = self.add_items(info, count_octets, message_info)
+        fspec, frns, count_octets = self.check_fspec(info, count)
+        self.add_fspec(fspec, frns)
+        count_octets = self.add_items(info, count_octets, message_info, frns)
         return count_octets
         
         
     def print_info_debbug(self):     
         # Obtener los nombres de los atributos de la instancia
         str_info = ""
-        nombres_atributos = list(self.__dict__.keys())
+        nombres_atributos = self.item_names()
         # Iterar sobre los atributos en el orden de declaración
         print("Valor actual:", nombres_atributos)
         print("\n----------------------------\n")
-        for nombre in nombres_atributos[1:]:
+        for nombre in nombres_atributos:
             valor_actual = getattr(self, nombre)
             #print("Valor actual:", valor_actual)
             if valor_actual.exist: 
@@ -3166,8 +3410,7 @@ class BlockCat21:
     
     def print_info(self):     
         str_info = ""
-        nombres_atributos = list(self.__dict__.keys())
-        for nombre in nombres_atributos[1:]:
+        for nombre in self.item_names():
             valor_actual = getattr(self, nombre)
             if valor_actual.exist: 
                 str_info += str(valor_actual) + "\n"
@@ -3178,22 +3421,107 @@ class BlockCat21:
         return (self.print_info())
 
 
+# FRN-indexed decode plan and shared empty items, compiled once from the UAP
+# order of the block
+install_items(BlockCat21)
+
+# Length rules of the variable-length items, to skip them when they are not
+# requested (item projection)
+BlockCat21.SKIP = {
+    'item040': skip_fx(5),
+    'item090': skip_fx(4),
+    'item110': skip_compound((1, skip_rep(15))),
+    'item220': skip_compound((2, 2, 2, 1)),
+    'item250': skip_rep(8),
+    'item271': skip_fx(2),
+    'item295': skip_compound((1,) * 7, (1,) * 7, (1,) * 7, (1, 1)),
+    're':      skip_explicit,
+    'sp':      skip_explicit,
+}
+
+# Type of the fields decoded outside a FIELDS table (or rescaled after it),
+# by column name, for the columnar outputs (the rest come from the tables)
+BlockCat21.DTYPES = {
+    'item010.sac':                            int,
+    'item010.sic':                            int,
+    'item015.service_id':                     str,
+    'item016.rp':                             float,
+    'item071.time_app_pos':                   float,
+    'item072.time_app_vel':                   float,
+    'item073.time_rec_pos':                   float,
+    'item075.time_rec_vel':                   float,
+    'item077.time_report_trans':              float,
+    'item110.tid.rep':                        int,
+    'item150.airspeed':                       float,
+    'item170.target_id':                      str,
+    'item220.wind_speed.wind_speed':          int,
+    'item220.wind_direction.wind_direction':  int,
+    'item220.temperature.temperature':        float,
+    'item220.turbulence.turbulence':          int,
+    'item400.rid':                            str,
+    'item295.octet_1.aos.data':               float,
+    'item295.octet_1.trd.data':               float,
+    'item295.octet_1.m3a.data':               float,
+    'item295.octet_1.qi.data':                float,
+    'item295.octet_1.ti.data':                float,
+    'item295.octet_1.mam.data':               float,
+    'item295.octet_1.gh.data':                float,
+    'item295.octet_2.fl.data':                float,
+    'item295.octet_2.sal.data':               float,
+    'item295.octet_2.fsa.data':               float,
+    'item295.octet_2.asa.data':               float,
+    'item295.octet_2.tas.data':               float,
+    'item295.octet_2.mh.data':                float,
+    'item295.octet_2.bvr.data':               float,
+    'item295.octet_3.gvr.data':               float,
+    'item295.octet_3.gv.data':                float,
+    'item295.octet_3.tar.data':               float,
+    'item295.octet_3.ti.data':                float,
+    'item295.octet_3.ts.data':                float,
+    'item295.octet_3.met.data':               float,
+    'item295.octet_3.roa.data':               float,
+    'item295.octet_4.ara.data':               float,
+    'item295.octet_4.scc.data':               float,
+    're.data.bps.bps':                        float,
+    're.data.nav.mfm':                        str,
+    're.data.sta.primary.rce':                int,
+    're.data.sta.primary.rrl':                str,
+    're.data.sta.first_ext.ps3':              int,
+    're.data.sta.first_ext.ptw':              int,
+    're.data.sta.second_ext.tsi':             int,
+    're.data.sta.second_ext.muo':             int,
+    're.data.sta.second_ext.rwc':             int,
+    're.data.sta.third_ext.daa':              int,
+    're.data.sta.third_ext.df17ca':           int,
+    're.data.sta.fourth_ext.svh':             int,
+    're.data.sta.fourth_ext.catc':            int,
+    're.data.sta.fifth_ext.tao':              int,
+    're.data.mes.summ.idd':                   int,
+    're.data.mes.m2.m2':                      str,
+}
+
+
 ##############################################################################
 @dataclass
 class AsterixMessage:
     cat: int
     leng: int
-    info: int
+    info: bytes
     count: int
     blocks: []
     
     
-    def __init__(self, cat: int, length: int, info: str, count: int):
+    __slots__ = ('cat', 'leng', 'info', 'count', 'blocks', 'lazy', 'items')
+
+    def __init__(self, cat: int, length: int, info, count: int, lazy: bool = False,
+                 items = None):
         self.cat = cat
         self.leng = length
-        self.info = info
+        self.info = to_octets(info)
         self.count = count
         self.blocks = []
+        self.lazy = lazy
+        self.items = items
         
         
     def modify_count(self, count_octets):
@@ -3201,19 +3529,27 @@ class AsterixMessage:
         
         
     def add_blocks(self):
-        # Add new BlockCat21 instance to blocks list
-        new_block = BlockCat21()
-        self.blocks.append(new_block)
+        # One BlockCat21 per record of the data block, until LEN is reached
+        info = self.info
         try:
-            i = 0
             while self.count < self.leng:
-                count_octets = self.blocks[i].add_block(self.info, self.count, self)
+                if not info[self.count]:
+                    # Empty FSPEC: filler octets after the last record
+                    break
+                new_block = BlockCat21(self.lazy, self.items)
+                count_octets = new_block.add_block(info, self.count, self)
+                self.blocks.append(new_block)
                 self.modify_count(count_octets)
-                i += 1
-        except IndexError as e:
-            print("-----------------------------")
-            print(f"Error: {e}")
-            print("-----------------------------")
+        except (IndexError, ValueError) as e:
+            # Record cut short (LEN beyond the octets of the message) or with
+            # an item that cannot be decoded
+            if not self.blocks:
+                if isinstance(e, IndexError):
+                    raise ValueError("Truncated record: no octets left to decode")
+                raise
+            # The records before it are kept
+            logging.error(f'Record {len(self.blocks)} not decoded: {self.info.hex().upper()}\n')
+            logging.error(f'Error: {e}\n')
             
         
     def __str__(self):
@@ -3225,7 +3561,7 @@ class AsterixMessage:
         return ('********************************************\n'
                 '*******   Decoded ASTERIX Message:   *******\n'
                 '********************************************\n\n'
-                f'{self.info}\n' 
+                f'{self.info.hex().upper()}\n' 
                 '********************************************\n\n'
                 + data)
     
@@ -3237,15 +3573,27 @@ class Category21:
     messages: []
     
     
+    __slots__ = ('count', 'messages')
+
     def __init__(self):
         self.count = 0
         self.messages = []
         
         
-    def add_message(self, cat: int, length: int, info: str, count: int, num_message: int):
-        new_message = AsterixMessage(cat, length, info, count)
+    def add_message(self, cat: int, length: int, info: bytes, count: int, num_message: int,
+                    lazy: bool = False, items = None, cache = None):
+        if cache is not None:
+            # Record already decoded: the cached message is shared
+            key = cache.message_key(info, lazy, items)
+            cached_message = cache.get(key)
+            if cached_message is not None:
+                self.messages.append(cached_message)
+                return
+        new_message = AsterixMessage(cat, length, info, count, lazy, items)
         self.messages.append(new_message)
         self.messages[num_message].add_blocks()
+        if cache is not None:
+            cache.put(key, new_message)
         
         
     def add_count(self):
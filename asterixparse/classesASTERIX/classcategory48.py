@@ -7,6 +7,7 @@ Created on Tue Jan 16 19:51:30 2024
 """
 
 import inspect
+import logging
 import math
 import json
 
@@ -14,13 +15,14 @@ from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 
 from . import classmodes
+from .octets import octetbin, octetint, to_octets, bitfields, unpack_fields, extract_fields
+from .octets import UNSIGNED, SIGNED, BITS, OCTAL
+from .uap import install_items, read_fspec
+from .uap import skip_compound, skip_explicit, skip_fx, skip_rep
 
 
 ######################################################
 
-def hexabin(num = int, base = int):
-  return bin(int(num, base))[2:].zfill(len(num) * int(math.log2(base)))
-
 def twos_comp(val, bits):
     """compute the 2's complement of int value val"""
     if (val & (1 << (bits - 1))) != 0: # if sign bit is set e.g., 8bit: 128-255
@@ -34,17 +36,17 @@ class Item010:
     sac: int
     sic: int
     
+    __slots__ = ('sac', 'sic', 'exist')
+    len = 2
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
-        self.hex   = 0
         self.sac   = 0
         self.sic   = 0
          
     def add_info(self, info):
-        self.hex = info
-        self.sac = int(info[:2], 16)
-        self.sic = int(info[2:], 16)
+        self.sac = info[0]
+        self.sic = info[1]
         if not 0 <= self.sac <= 255 or not 0 <= self.sic <= 255:
             raise ValueError("Item010: value out of range\n")
         
@@ -61,6 +63,9 @@ class Item020:
     first_ext: 'Item020.FirstExt()'
     second_ext: 'Item020.SecondExt()'
     
+    __slots__ = ('primary', 'first_ext', 'second_ext', 'exist')
+    len = 0
+
     @dataclass    
     class SecondExt:
         adsb: int
@@ -68,9 +73,18 @@ class Item020:
         pai: int
         spare: int
         
+        __slots__ = ('adsb', 'scn', 'pai', 'spare', 'adbs', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('adbs', 0, 2, BITS),
+                           ('scn', 2, 4, BITS),
+                           ('pai', 4, 6, BITS),
+                           ('spare', 6, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.adsb  = 0
             self.scn   = 0
             self.pai   = 0
@@ -78,14 +92,9 @@ class Item020:
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.adbs = res[0:2]
-            self.scn = res[2:4]
-            self.pai = res[4:6]
-            self.spare = res[6:7]
-            self.fx  = res[7:]
             count_octets += self.len
          
         def __str__(self, item):
@@ -108,9 +117,20 @@ class Item020:
         mi: int
         foe_fri: int
         
+        __slots__ = ('tst', 'err', 'xpp', 'me', 'mi', 'foe_fri', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('tst', 0, 1, BITS),
+                           ('err', 1, 2, BITS),
+                           ('xpp', 2, 3, BITS),
+                           ('me', 3, 4, BITS),
+                           ('mi', 4, 5, BITS),
+                           ('foe_fri', 5, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist   = False
-            self.len     = 1 
             self.tst     = 0
             self.err     = 0
             self.xpp     = 0
@@ -120,16 +140,9 @@ class Item020:
             self.fx      = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.tst = res[:1]
-            self.err = res[1:2]
-            self.xpp = res[2:3]
-            self.me = res[3:4]
-            self.mi = res[4:5]
-            self.foe_fri = res[5:7]
-            self.fx  = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.second_ext.add_info(item, info, count_octets)
@@ -154,9 +167,19 @@ class Item020:
         spi: int
         rab: int
  
+        __slots__ = ('typ', 'sim', 'rdp', 'spi', 'rab', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('typ', 0, 3, BITS),
+                           ('sim', 3, 4, BITS),
+                           ('rdp', 4, 5, BITS),
+                           ('spi', 5, 6, BITS),
+                           ('rab', 6, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.typ   = 0
             self.sim   = 0
             self.rdp   = 0
@@ -165,15 +188,9 @@ class Item020:
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.typ = res[:3]
-            self.sim = res[3:4]
-            self.rdp = res[4:5]
-            self.spi = res[5:6]
-            self.rab = res[6:7]
-            self.fx  = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.first_ext.add_info(item, info, count_octets)
@@ -190,16 +207,12 @@ class Item020:
             
     def __init__(self):
         self.exist      = False
-        self.len        = 0
-        self.hex        = 0
         self.primary    = self.Primary()
         self.first_ext  = self.FirstExt()
         self.second_ext = self.SecondExt()
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         count_octets = self.primary.add_info(self, info, count_octets)
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
     
     def __str__(self):
@@ -212,22 +225,29 @@ class Item030:
     primary: 'Item030.Primary()'
     first_ext: 'Item030.FirstExt()'
     
+    __slots__ = ('primary', 'first_ext', 'exist')
+    len = 0
+
     @dataclass        
     class FirstExt:
         code: int        
         
+        __slots__ = ('code', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('code', 0, 7),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1
             self.code  = 0
             self.fx    = 0  # There is no more documentacion about this FX
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.code = int(res[:7], 2)
-            self.fx = res[7:]
             count_octets += self.len
         
         def __str__(self, item):
@@ -239,18 +259,22 @@ class Item030:
     class Primary:
         code: int
         
+        __slots__ = ('code', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('code', 0, 7),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1
             self.code  = 0
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.code = int(res[:7], 2)
-            self.fx = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.first_ext.add_info(item, info, count_octets)
@@ -264,15 +288,11 @@ class Item030:
         
     def __init__(self):
         self.exist      = False
-        self.len        = 0
-        self.hex        = 0
         self.primary    = self.Primary()
         self.first_ext  = self.FirstExt()
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         count_octets = self.primary.add_info(self, info, count_octets)
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
     
     def __str__(self):
@@ -285,18 +305,20 @@ class Item040:
     rho: int
     theta: int
     
+    __slots__ = ('rho', 'theta', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('rho', 0, 16, UNSIGNED, 1/256),
+                       ('theta', 16, 32, UNSIGNED, 360/pow(2,16)))
+
     def __init__(self):
         self.exist = False
-        self.len   = 4
-        self.hex   = 0
         self.rho   = 0
         self.theta = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.rho = int(res[:16], 2)*(1/256)
-        self.theta = int(res[16:], 2)*(360/pow(2,16))
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -311,18 +333,20 @@ class Item042:
     x: int
     y: int
     
+    __slots__ = ('x', 'y', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('x', 0, 16, SIGNED, 1/128),
+                       ('y', 16, 32, SIGNED, 1/128))
+
     def __init__(self):
         self.exist = False
-        self.len   = 4
-        self.hex   = 0
         self.x     = 0
         self.y     = 0
 
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.x = twos_comp(int(res[:16], 2), len(res[:15]))/128
-        self.y = twos_comp(int(res[16:], 2), len(res[15:]))/128
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -339,25 +363,24 @@ class Item050:
     l: int
     mode2: int
     
+    __slots__ = ('v', 'g', 'l', 'mode2', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('v', 0, 1, BITS),
+                       ('g', 1, 2, BITS),
+                       ('l', 2, 3, BITS),
+                       ('mode2', 4, 16, OCTAL))
+
     def __init__(self):
         self.exist  = False
-        self.len    = 2
-        self.hex    = 0
         self.v      = 0
         self.g      = 0
         self.l      = 0
         self.mode2  = 0
       
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)        
-        self.v = res[:1]
-        self.g = res[1:2]
-        self.l = res[2:3]
-        # Convert str bin to int, then to octal
-        aux = oct(int(res[4:], 2))
-        #Get rid from the initial "0o"
-        self.mode2 = aux[2:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -374,25 +397,24 @@ class Item055:
     l: int
     mode1: int
     
+    __slots__ = ('v', 'g', 'l', 'mode1', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('v', 0, 1, BITS),
+                       ('g', 1, 2, BITS),
+                       ('l', 2, 3, BITS),
+                       ('mode1', 3, 8, OCTAL))
+
     def __init__(self):
         self.exist  = False
-        self.len    = 1
-        self.hex    = 0
         self.v      = 0
         self.g      = 0
         self.l      = 0
         self.mode1  = 0
       
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)        
-        self.v = res[:1]
-        self.g = res[1:2]
-        self.l = res[2:3]
-        # Convert str bin to int, then to octal
-        aux = oct(int(res[3:], 2))
-        #Get rid from the initial "0o"
-        self.mode1 = aux[2:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -406,18 +428,20 @@ class Item055:
 class Item060:
     qxi: int
     
+    __slots__ = ('qxi', 'spare', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('spare', 0, 4, BITS),
+                       ('qxi', 4, 16, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
-        self.hex   = 0
         self.spare = 0
         self.qxi   = 0
       
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.spare = res[:4]
-        self.qxi = res[4:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -430,18 +454,20 @@ class Item060:
 class Item065:
     qxi: int
     
+    __slots__ = ('qxi', 'spare', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('spare', 0, 3, BITS),
+                       ('qxi', 3, 8, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
-        self.hex   = 0
         self.spare = 0
         self.qxi   = 0
       
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.spare = res[:3]
-        self.qxi = res[3:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -457,25 +483,24 @@ class Item070:
     l: int
     mode3_a: int
     
+    __slots__ = ('v', 'g', 'l', 'mode3_a', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('v', 0, 1, BITS),
+                       ('g', 1, 2, BITS),
+                       ('l', 2, 3, BITS),
+                       ('mode3_a', 4, 16, OCTAL))
+
     def __init__(self):
         self.exist   = False
-        self.len     = 2
-        self.hex     = 0
         self.v       = 0
         self.g       = 0
         self.l       = 0
         self.mode3_a = 0
       
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)        
-        self.v = res[:1]
-        self.g = res[1:2]
-        self.l = res[2:3]
-        # Convert str bin to int, then to octal
-        aux = oct(int(res[4:], 2))
-        #Get rid from the initial "0o"
-        self.mode3_a = aux[2:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -489,18 +514,20 @@ class Item070:
 class Item080:
     qxi: int
     
+    __slots__ = ('qxi', 'spare', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('spare', 0, 4, BITS),
+                       ('qxi', 4, 16, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
-        self.hex   = 0
         self.spare = 0
         self.qxi   = 0
       
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.spare = res[:4]
-        self.qxi = res[4:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -516,22 +543,24 @@ class Item090:
     bina: int
     fl: int
     
+    __slots__ = ('v', 'g', 'bina', 'fl', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('v', 0, 1, BITS),
+                       ('g', 1, 2, BITS),
+                       ('bina', 2, 16, BITS),
+                       ('fl', 2, 16, UNSIGNED, 1/4))
+
     def __init__(self):
         self.exist  = False
-        self.len    = 2
-        self.hex    = 0
         self.v      = 0
         self.g      = 0
         self.bina   = 0
         self.fl     = 0
       
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)        
-        self.v = res[:1]
-        self.g = res[1:2]
-        self.bina = res[2:]
-        self.fl = int(res[2:],2)*(1/4)
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -548,22 +577,24 @@ class Item100:
     mode_c: int
     qxi: int
     
+    __slots__ = ('v', 'g', 'mode_c', 'qxi', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('v', 0, 1, BITS),
+                       ('g', 1, 2, BITS),
+                       ('mode_c', 4, 16, BITS),
+                       ('qxi', 20, 32, BITS))
+
     def __init__(self):
         self.exist  = False
-        self.len    = 4
-        self.hex    = 0
         self.v      = 0
         self.g      = 0
         self.mode_c = 0
         self.qxi    = 0
       
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)        
-        self.v = res[:1]
-        self.g = res[1:2]
-        self.mode_c = res[4:16]
-        self.qxi = res[20:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -578,16 +609,18 @@ class Item100:
 class Item110:
     height_3d: int
    
+    __slots__ = ('height_3d', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('height_3d', 2, 16, SIGNED, 25))
+
     def __init__(self):
         self.exist     = False
-        self.len       = 2
-        self.hex       = 0
         self.height_3d = 0
       
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.height_3d = twos_comp(int(res[2:], 2), len(res[2:]))*25
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -603,25 +636,32 @@ class Item120:
     cal: 'Item120.CAL()'
     rds: 'Item120.RepRDS()'
     
+    __slots__ = ('cal', 'rds', 'fx', 'exist', 'spare')
+    len = 0
+
     @dataclass
     class RDS:
         dop:int
         amb: int
         frq: int
         
+        __slots__ = ('dop', 'amb', 'frq', 'exist')
+        len = 6
+
+        FIELDS = bitfields(6,
+                           ('dop', 0, 16),
+                           ('amb', 16, 32),
+                           ('frq', 32, 48))
+
         def __init__(self):
-            self.len = 6
             self.dop = 0
             self.amb = 0
             self.frq = 0
         
         def add_info (self, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.dop = int(res[:16], 2)
-            self.amb = int(res[16:32], 2)
-            self.frq = int(res[32:], 2)
             count_octets += self.len            
             return count_octets
      
@@ -636,18 +676,20 @@ class Item120:
         #rep: int
         blocks: []
     
+        __slots__ = ('blocks', 'exist', 'rep')
+        len = 1
+
         def __init__(self):
             self.exist  = False
-            self.len    = 1
             self.rep    = 0
             self.blocks = []
         
         def add_blocks(self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            self.rep = int(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            self.rep = octetint(info_item)
             count_octets += self.len 
             for i in range(self.rep): 
-                new_block = self.RDS()
+                new_block = item.RDS()
                 self.blocks.append(new_block)
                 count_octets = self.blocks[i].add_info(info, count_octets)
             return count_octets
@@ -664,19 +706,23 @@ class Item120:
         d: int
         cal: int
         
+        __slots__ = ('d', 'cal', 'exist', 'spare')
+        len = 2
+
+        FIELDS = bitfields(2,
+                           ('d', 0, 1, BITS),
+                           ('cal', 6, 16, SIGNED))
+
         def __init__(self):
             self.exist = False
-            self.len   = 2 
             self.d     = 0
             self.cal   = 0
             self.spare = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.d = res[:1]
-            self.cal = twos_comp(int(res[6:], 2), len(res[6:]))*1
             count_octets += self.len            
             return count_octets
         
@@ -688,10 +734,11 @@ class Item120:
             return ""
    
     
+    FIELDS = bitfields(1,
+                       ('fx', 7, 8, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 0
-        self.hex   = 0
         self.cal   = self.CAL()
         self.rds   = self.RepRDS()
         self.spare = 0
@@ -699,16 +746,14 @@ class Item120:
         
     def add_info(self, info = str, count_octets = int):
         lenght = 1
-        aux_count_octets = count_octets
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        res = "{0:08b}".format(int(info_item, 16))
+        info_item = info[count_octets:count_octets+lenght]
+        value = octetint(info_item)
+        extract_fields(self, value, self.FIELDS)
         count_octets += lenght
-        if res[:1] == '1':
+        if value & 0x80:
             count_octets = self.cal.add_info(self, info, count_octets)
-        if res[1:2] == '1':
+        if value & 0x40:
             count_octets = self.rds.add_blocks(self, info, count_octets)
-        self.fx = res[7:]
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets    
             
     def __str__(self):
@@ -727,20 +772,27 @@ class Item130:
     rpd: 'Item130.RPD()'
     apd: 'Item130.APD()'
     
+    __slots__ = ('srl', 'srr', 'sam', 'prl', 'pam', 'rpd', 'apd', 'fx', 'exist')
+    len = 0
+
     @dataclass
     class APD():
         apd: int
         
+        __slots__ = ('apd', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('apd', 0, 8, SIGNED, 360/pow(2,14)))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.apd   = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.apd = twos_comp(int(res, 2), len(res))*(360/pow(2,14))
             count_octets += self.len            
             return count_octets
         
@@ -754,16 +806,20 @@ class Item130:
     class RPD():
         rpd: int
         
+        __slots__ = ('rpd', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('rpd', 0, 8, SIGNED, 1/256))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.rpd   = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.rpd = twos_comp(int(res, 2), len(res))*(1/256)
             count_octets += self.len            
             return count_octets
         
@@ -777,16 +833,20 @@ class Item130:
     class PAM():
         pam: int
         
+        __slots__ = ('pam', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('pam', 0, 8, SIGNED))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.pam   = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.pam = twos_comp(int(res, 2), len(res))*1
             count_octets += self.len            
             return count_octets
         
@@ -800,14 +860,16 @@ class Item130:
     class PRL():
         prl: int
         
+        __slots__ = ('prl', 'exist')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.prl   = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = int(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            res = octetint(info_item)            
             self.exist = True 
             self.prl = res*(360/pow(2,13))
             count_octets += self.len            
@@ -823,14 +885,16 @@ class Item130:
     class SAM():
         sam: int
         
+        __slots__ = ('sam', 'exist')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.sam   = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = int(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            res = octetint(info_item)            
             self.exist = True 
             self.sam = res*1
             count_octets += self.len            
@@ -846,14 +910,16 @@ class Item130:
     class SRR():
         srr: int
         
+        __slots__ = ('srr', 'exist')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.srr   = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = int(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            res = octetint(info_item)            
             self.exist = True 
             self.srr = res*1
             count_octets += self.len            
@@ -869,14 +935,16 @@ class Item130:
     class SRL():
         srl: int
         
+        __slots__ = ('srl', 'exist')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.srl   = 0
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = int(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            res = octetint(info_item)            
             self.exist = True 
             self.srl = res*(360/pow(2,13))
             count_octets += self.len            
@@ -889,10 +957,11 @@ class Item130:
             return ""
    
             
+    FIELDS = bitfields(1,
+                       ('fx', 7, 8, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 0
-        self.hex   = 0
         self.srl   = self.SRL()
         self.srr   = self.SRR()
         self.sam   = self.SAM()
@@ -904,29 +973,27 @@ class Item130:
         
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1 
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        res = "{0:08b}".format(int(info_item, 16))
+        info_item = info[count_octets:count_octets+lenght]
+        value = octetint(info_item)
+        extract_fields(self, value, self.FIELDS)
         count_octets += lenght
         
-        if res[:1] == '1':
+        if value & 0x80:
             count_octets = self.srl.add_info(self, info, count_octets)
-        if res[1:2] == '1':
+        if value & 0x40:
             count_octets = self.srr.add_info(self, info, count_octets)
-        if res[2:3] == '1':
+        if value & 0x20:
             count_octets = self.sam.add_info(self, info, count_octets)
-        if res[3:4] == '1':
+        if value & 0x10:
             count_octets = self.prl.add_info(self, info, count_octets)
-        if res[4:5] == '1':
+        if value & 0x08:
             count_octets = self.pam.add_info(self, info, count_octets)
-        if res[5:6] == '1':
+        if value & 0x04:
             count_octets = self.rpd.add_info(self, info, count_octets)
-        if res[6:7] == '1':
+        if value & 0x02:
             count_octets = self.apd.add_info(self, info, count_octets)
         
-        self.fx = res[7:]
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
         
     def __str__(self):
@@ -941,15 +1008,15 @@ class Item130:
 class Item140:
     time_of_day: int
     
+    __slots__ = ('time_of_day', 'exist')
+    len = 3
+
     def __init__(self):
         self.exist       = False
-        self.len         = 3
-        self.hex         = 0
         self.time_of_day = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.time_of_day = int(hexabin(info, 16), 2)/128
+        self.time_of_day = octetint(info)/128
         
     def __str__(self):
         delta = timedelta(seconds=self.time_of_day)
@@ -968,17 +1035,19 @@ class Item140:
 class Item161:
     track_number: int
     
+    __slots__ = ('track_number', 'exist', 'spare')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('track_number', 4, 16))
+
     def __init__(self):
         self.exist        = False
-        self.len          = 2
-        self.hex          = 0
         self.spare        = 0
         self.track_number = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.track_number = int(res[4:], 2)
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -992,6 +1061,9 @@ class Item170:
     primary: 'Item170.Primary()'
     first_ext: 'Item170.FirstExt()'
     
+    __slots__ = ('primary', 'first_ext', 'exist')
+    len = 0
+
     @dataclass        
     class FirstExt:
         tre: int
@@ -999,9 +1071,18 @@ class Item170:
         sup: int
         tcc: int
         
+        __slots__ = ('tre', 'gho', 'sup', 'tcc', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('tre', 0, 1, BITS),
+                           ('gho', 1, 2, BITS),
+                           ('sup', 2, 3, BITS),
+                           ('tcc', 3, 4, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1
             self.tre   = 0
             self.gho   = 0
             self.sup   = 0
@@ -1009,14 +1090,9 @@ class Item170:
             self.fx    = 0  # There is no more documentacion about this FX
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.tre = res[:1]
-            self.gho = res[1:2]
-            self.sup = res[2:3]
-            self.tcc = res[3:4]
-            self.fx = res[7:]
             count_octets += self.len
             return count_octets
         
@@ -1037,9 +1113,19 @@ class Item170:
         mah: int
         cdm: int
         
+        __slots__ = ('cnf', 'rad', 'dou', 'mah', 'cdm', 'fx', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('cnf', 0, 1, BITS),
+                           ('rad', 1, 3, BITS),
+                           ('dou', 3, 4, BITS),
+                           ('mah', 4, 5, BITS),
+                           ('cdm', 5, 7, BITS),
+                           ('fx', 7, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1
             self.cnf   = 0
             self.rad   = 0
             self.dou   = 0
@@ -1048,15 +1134,9 @@ class Item170:
             self.fx    = 0
             
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True 
-            self.cnf = res[:1]
-            self.rad = res[1:3]
-            self.dou = res[3:4]
-            self.mah = res[4:5]
-            self.cdm = res[5:7]
-            self.fx = res[7:]
             count_octets += self.len
             if self.fx == '1':
                 count_octets = item.first_ext.add_info(item, info, count_octets)
@@ -1074,15 +1154,11 @@ class Item170:
             
     def __init__(self):
         self.exist      = False
-        self.len        = 0
-        self.hex        = 0
         self.primary    = self.Primary()
         self.first_ext  = self.FirstExt()
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         count_octets = self.primary.add_info(self, info, count_octets)
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
     
     def __str__(self):
@@ -1095,18 +1171,20 @@ class Item200:
     ground_speed: int
     heading: int
     
+    __slots__ = ('ground_speed', 'heading', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('ground_speed', 0, 16, UNSIGNED, pow(2,-14)),
+                       ('heading', 16, 32, UNSIGNED, 360/pow(2,16)))
+
     def __init__(self):
         self.exist        = False
-        self.len          = 4
-        self.hex          = 0
         self.ground_speed = 0
         self.heading      = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.ground_speed = int(res[:16], 2)*pow(2,-14)
-        self.heading = int(res[16:], 2)*(360/pow(2,16))
+        extract_fields(self, octetint(info), self.FIELDS)
 
     def __str__(self):
         return (
@@ -1123,22 +1201,24 @@ class Item210:
     sigma_v: int
     sigma_h: int
     
+    __slots__ = ('sigma_x', 'sigma_y', 'sigma_v', 'sigma_h', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('sigma_x', 0, 8, UNSIGNED, 1/128),
+                       ('sigma_y', 8, 16, UNSIGNED, 1/128),
+                       ('sigma_v', 16, 24, UNSIGNED, pow(2,-14)),
+                       ('sigma_h', 24, 32, UNSIGNED, 360/pow(2,12)))
+
     def __init__(self):
         self.exist    = False
-        self.len      = 4
-        self.hex      = 0
         self.sigma_x  = 0
         self.sigma_y  = 0
         self.sigma_v  = 0
         self.sigma_h  = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.sigma_x = int(res[:8], 2)*(1/128)
-        self.sigma_y = int(res[8:16], 2)*(1/128)
-        self.sigma_v = int(res[16:24], 2)*pow(2,-14)
-        self.sigma_h = int(res[24:], 2)*(360/pow(2,12))
+        extract_fields(self, octetint(info), self.FIELDS)
 
     def __str__(self):
         return (
@@ -1154,15 +1234,15 @@ class Item210:
 class Item220:
     aircraft_addr: int
     
+    __slots__ = ('aircraft_addr', 'exist')
+    len = 3
+
     def __init__(self):
         self.exist         = False
-        self.len           = 3
-        self.hex           = 0
         self.aircraft_addr = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.aircraft_addr = info
+        self.aircraft_addr = info.hex().upper()
         
     def __str__(self):
         return (
@@ -1182,10 +1262,22 @@ class Item230:
     b1a: int
     b1b: int
     
+    __slots__ = ('com', 'stat', 'si', 'mssc', 'arc', 'aic', 'b1a', 'b1b',
+                 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('com', 0, 3),
+                       ('stat', 3, 6),
+                       ('si', 6, 7),
+                       ('mssc', 8, 9, BITS),
+                       ('arc', 9, 10, BITS),
+                       ('aic', 10, 11, BITS),
+                       ('b1a', 11, 12, BITS),
+                       ('b1b', 12, 16, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
-        self.hex   = 0
         self.com   = 0
         self.stat  = 0
         self.si    = 0
@@ -1196,16 +1288,7 @@ class Item230:
         self.b1b   = 0
     
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.com   = int(res[:3], 2)
-        self.stat  = int(res[3:6], 2)
-        self.si    = int(res[6:7], 2)
-        self.mssc  = res[8:9]
-        self.arc   = res[9:10]
-        self.aic   = res[10:11]
-        self.b1a   = res[11:12]
-        self.b1b   = res[12:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -1225,10 +1308,22 @@ class Item230:
 class Item240:
     aircraft_id: str
     
+    __slots__ = ('aircraft_id', 'char1', 'char2', 'char3', 'char4', 'char5',
+                 'char6', 'char7', 'char8', 'exist')
+    len = 6
+
+    FIELDS = bitfields(6,
+                       ('char1', 0, 6, BITS),
+                       ('char2', 6, 12, BITS),
+                       ('char3', 12, 18, BITS),
+                       ('char4', 18, 24, BITS),
+                       ('char5', 24, 30, BITS),
+                       ('char6', 30, 36, BITS),
+                       ('char7', 36, 42, BITS),
+                       ('char8', 42, 48, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 6
-        self.hex   = 0
         self.char1 = 0
         self.char2 = 0
         self.char3 = 0
@@ -1240,26 +1335,12 @@ class Item240:
         self.aircraft_id = ""
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.char1 = res[:6]
-        self.char2 = res[6:12]
-        self.char3 = res[12:18]
-        self.char4 = res[18:24]
-        self.char5 = res[24:30]
-        self.char6 = res[30:36]
-        self.char7 = res[36:42]
-        self.char8 = res[42:]
+        value = octetint(info)
+        extract_fields(self, value, self.FIELDS)
+        
         char_map = "#ABCDEFGHIJKLMNOPQRSTUVWXYZ#####_###############0123456789######"
-        char_len = 6
-        count_bits = 0
-        i = 0
-        while i < 8:
-            aux_char = res[count_bits:count_bits+char_len]
-            aux_map = int(aux_char,2)
-            self.aircraft_id += char_map[aux_map]
-            count_bits += char_len
-            i += 1  
+        for shift in range(42, -1, -6):
+            self.aircraft_id += char_map[(value >> shift) & 0x3F]
 
     def __str__(self):
         return (
@@ -1275,6 +1356,9 @@ class Item250:
     #rep: int
     blocks: []
     
+    __slots__ = ('blocks', 'exist', 'rep', 'item090')
+    len = 0
+
     @dataclass
     class BDS:
         bdsdatahex: int
@@ -1282,24 +1366,31 @@ class Item250:
         bds_type: int
         bdsdata: None
         
+        __slots__ = ('bdsdatahex', 'bds_type', 'bdsdata', 'bds1', 'bds2',
+                     'exist', 'altitude')
+        len = 8
+
+        FIELDS = bitfields(8,
+                           ('bds1', 56, 60),
+                           ('bds2', 60, 64))
+        
         def __init__(self, item090):
             self.exist      = False
-            self.len        = 8
             self.bdsdatahex = 0
             self.bds_type   = 0
-            self.bdsdata    = classmodes.ModeS()
+            self.bdsdata    = None
             self.altitude   = item090.fl*100
         
         def add_info (self, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
             self.altitude = 0
             self.exist = True
-            self.bdsdatahex = info_item[:-2]
-            bds1 = int(res[56:60],2)
-            bds2 = int(res[60:],2)
+            self.bdsdatahex = info_item[:-1].hex().upper()
+            value = octetint(info_item)
+            bds1, bds2 = unpack_fields(value, self.FIELDS)
             self.bds_type = "BDS{}{}".format(bds1, bds2)
-            self.bdsdata.add_info(self.bdsdatahex, self.bds_type)
+            # Shared with the other registers with the same MB field
+            self.bdsdata = classmodes.decode_modes(value >> 8, self.bds_type)
             count_octets += self.len            
             return count_octets
         
@@ -1311,18 +1402,15 @@ class Item250:
     
     def __init__(self, item090):
         self.exist   = False
-        self.len     = 0
-        self.hex     = 0
         self.rep     = 0
         self.item090 = item090
         self.blocks  = []
         
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        self.rep = int(info_item, 16)
+        info_item = info[count_octets:count_octets+lenght]
+        self.rep = octetint(info_item)
         count_octets += lenght 
         
         for i in range(self.rep): 
@@ -1330,7 +1418,6 @@ class Item250:
             self.blocks.append(new_block)
             count_octets = self.blocks[i].add_info(info, count_octets)
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
 
     def __str__(self):
@@ -1346,15 +1433,15 @@ class Item250:
 class Item260:
     acasra: int
     
+    __slots__ = ('acasra', 'exist')
+    len = 7
+
     def __init__(self):
         self.exist  = False
-        self.len    = 7
-        self.hex    = 0
         self.acasra = 0
       
     def add_info(self, info):
-        self.hex = info
-        self.acasra = hexabin(info, 16)
+        self.acasra = octetbin(info)
         
     def __str__(self):
         return (
@@ -1376,9 +1463,20 @@ class SUM:
     m3: int
     mc: int
     
+    __slots__ = ('m5', 'idd', 'da', 'm1', 'm2', 'm3', 'mc', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('m5', 0, 1, BITS),
+                       ('idd', 1, 2, BITS),
+                       ('da', 2, 3, BITS),
+                       ('m1', 3, 4, BITS),
+                       ('m2', 4, 5, BITS),
+                       ('m3', 5, 6, BITS),
+                       ('mc', 6, 7, BITS))
+
     def __init__(self):
         self.exist  = False
-        self.len    = 1
         self.m5     = 0
         self.idd    = 0
         self.da     = 0
@@ -1388,16 +1486,9 @@ class SUM:
         self.mc     = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.m5    = res[:1]
-        self.idd    = res[1:2]
-        self.da    = res[2:3]
-        self.m1    = res[3:4]
-        self.m2    = res[4:5]
-        self.m3    = res[5:6]
-        self.mc    = res[6:7]
         count_octets += self.len        
         return count_octets
     
@@ -1421,22 +1512,26 @@ class PMN:
     nat: int
     mis: int
 
+    __slots__ = ('pin', 'nav', 'nat', 'mis', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('pin', 2, 16, BITS),
+                       ('nav', 18, 19, BITS),
+                       ('nat', 19, 24, BITS),
+                       ('mis', 26, 32, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 4
         self.pin   = 0
         self.nav   = 0
         self.nat   = 0
         self.mis   = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.pin   = res[2:16]
-        self.nav   = res[18:19]
-        self.nat   = res[19:24]
-        self.mis   = res[26:]
         count_octets += self.len
         return count_octets
 
@@ -1456,20 +1551,24 @@ class PMNO:
     nov: int
     no: int
     
+    __slots__ = ('pin', 'nov', 'no', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('pin', 2, 16, BITS),
+                       ('nov', 20, 21, BITS),
+                       ('no', 21, 32, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 4
         self.pin   = 0
         self.nov   = 0
         self.no    = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.pin   = res[2:16]
-        self.nov   = res[20:21]
-        self.no    = res[21:]
         count_octets += self.len        
         return count_octets
 
@@ -1487,18 +1586,22 @@ class POS:
     latitude: int
     longitude: int
 
+    __slots__ = ('latitude', 'longitude', 'exist')
+    len = 6
+
+    FIELDS = bitfields(6,
+                       ('latitude', 0, 24, SIGNED, 180/pow(2,23)),
+                       ('longitude', 24, 48, SIGNED, 180/pow(2,23)))
+
     def __init__(self):
         self.exist     = False
-        self.len       = 6
         self.latitude  = 0
         self.longitude = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.latitude  = twos_comp(int(res[:24], 2), len(res[:24]))*(180/pow(2,23)) 
-        self.longitude = twos_comp(int(res[24:], 2), len(res[24:]))*(180/pow(2,23))
         count_octets += self.len        
         return count_octets
     
@@ -1515,21 +1618,26 @@ class GA:
     res: int
     ga: int
 
+    __slots__ = ('res', 'ga', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('res', 1, 2, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
         self.res   = 0
         self.ga    = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        value = octetint(info_item)
+        extract_fields(self, value, self.FIELDS)
         self.exist = True
-        self.res = res[1:2]
         if self.res == '0':
-            self.ga = twos_comp(int(res[2:], 2), len(res[2:]))*25*100
+            self.ga = twos_comp(value & 0x3FFF, 14)*25*100
         if self.res == '1':
-            self.ga = twos_comp(int(res[2:], 2), len(res[2:]))*25*25
+            self.ga = twos_comp(value & 0x3FFF, 14)*25*25
         count_octets += self.len        
         return count_octets
     
@@ -1548,25 +1656,26 @@ class EM1:
     l: int
     em1: int
 
+    __slots__ = ('v', 'g', 'l', 'em1', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('v', 0, 1, BITS),
+                       ('g', 1, 2, BITS),
+                       ('l', 2, 3, BITS),
+                       ('em1', 4, 16, OCTAL))
+
     def __init__(self):
         self.exist = False
-        self.len   = 2
         self.v     = 0
         self.g     = 0
         self.l     = 0
         self.em1   = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.v = res[:1]
-        self.g = res[1:2]
-        self.l = res[2:3]
-        # Convert str bin to int, then to octal
-        aux = oct(int(res[4:], 2))
-        # Get rid from the initial "0o"
-        self.em1 = aux[2:]
         count_octets += self.len        
         return count_octets        
     
@@ -1582,16 +1691,20 @@ class EM1:
 class TOS:
     tos: int
 
+    __slots__ = ('tos', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('tos', 0, 8, SIGNED, 1/128))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
         self.tos   = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.tos = twos_comp(int(res, 2), len(res))*(1/128)
         count_octets += self.len        
         return count_octets  
     
@@ -1611,9 +1724,19 @@ class XP:
     x2: int
     x1: int
 
+    __slots__ = ('xp', 'x5', 'xc', 'x3', 'x2', 'x1', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('xp', 2, 3, BITS),
+                       ('x5', 3, 4, BITS),
+                       ('xc', 4, 5, BITS),
+                       ('x3', 5, 6, BITS),
+                       ('x2', 6, 7, BITS),
+                       ('x1', 7, 8, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
         self.xp    = 0
         self.x5    = 0
         self.xc    = 0
@@ -1622,15 +1745,9 @@ class XP:
         self.x1    = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.xp    = res[2:3]
-        self.x5    = res[3:4]
-        self.xc    = res[4:5]
-        self.x3    = res[5:6]
-        self.x2    = res[6:7]
-        self.x1    = res[7:]
         count_octets += self.len        
         return count_octets  
     
@@ -1650,16 +1767,20 @@ class XP:
 class FOM:
     fom: int
 
+    __slots__ = ('fom', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('fom', 3, 8, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
         self.fom   = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.fom = res[3:]
         count_octets += self.len        
         return count_octets  
     
@@ -1682,9 +1803,16 @@ class MD5:
     tos: TOS()
     xp: XP()
     
+    __slots__ = ('summ', 'pmn', 'pos', 'ga', 'em1', 'tos', 'xp', 'octet', 'fx',
+                 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('octet', 0, 8, BITS),
+                       ('fx', 7, 8, BITS))
+
     def __init__(self):
         self.exist  = False
-        self.len    = 1 
         self.octet  = 0
         self.summ   = SUM()
         self.pmn    = PMN()
@@ -1696,11 +1824,9 @@ class MD5:
         self.fx     = 0
     
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = "{0:08b}".format(int(info_item, 16))
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.octet = res
-        self.fx = res[-1]
         count_octets += self.len
         
         if self.octet[0] == '1':
@@ -1735,14 +1861,19 @@ class M5N:
     octet_1: 'M5N.Octet1()'
     octet_2: 'M5N.Octet2()'
     
+    __slots__ = ('octet_1', 'octet_2', 'exist', 'fx')
+    len = 0
+
     @dataclass
     class Octet2:
         octet: int
         fom: FOM()
         
+        __slots__ = ('octet', 'fom', 'exist', 'fx')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.octet = 0
             self.fom   = FOM()
             self.fx    = 0
@@ -1770,9 +1901,12 @@ class M5N:
         tos: TOS()
         xp: XP()
         
+        __slots__ = ('summ', 'pmno', 'pos', 'ga', 'em1', 'tos', 'xp', 'exist',
+                     'octet', 'fx')
+        len = 1
+
         def __init__(self):
             self.exist  = False
-            self.len    = 1 
             self.octet  = 0
             self.summ   = SUM()
             self.pmno   = PMNO()
@@ -1811,8 +1945,6 @@ class M5N:
    
     def __init__(self):
         self.exist   = False
-        self.len     = 0
-        self.hex     = 0
         self.octet_1 = self.Octet1()
         self.octet_2 = self.Octet2()
         self.fx      = 0   # There is no more documentacion about this FX
@@ -1820,21 +1952,20 @@ class M5N:
 
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        res = "{0:08b}".format(int(info_item, 16))
-        self.octet_1.octet = res
+        info_item = info[count_octets:count_octets+lenght]
+        octet = octetint(info_item)
+        self.octet_1.octet = format(octet, '08b')
         self.octet_1.exist = True
         count_octets += lenght
         
-        if res[7:] == '1':
-            info_item = info[count_octets*2:count_octets*2+lenght*2]
-            res = "{0:08b}".format(int(info_item, 16))
-            self.octet_2.octet = res
+        if octet & 0x01:
+            info_item = info[count_octets:count_octets+lenght]
+            octet = octetint(info_item)
+            self.octet_2.octet = format(octet, '08b')
             self.octet_2.exist = True
             count_octets += lenght
-            self.fx  = res[7:]
+            self.fx  = '1' if octet & 0x01 else '0'
         
         if self.octet_1.exist:
             count_octets = self.octet_1.add_info(self, info, count_octets)
@@ -1842,7 +1973,6 @@ class M5N:
             if self.octet_2.exist:
                 count_octets = self.octet_2.add_info(self, info, count_octets)
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
         
     
@@ -1855,18 +1985,22 @@ class M5N:
 class M4E:
     foe_fri: int
 
+    __slots__ = ('foe_fri', 'fx', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('foe_fri', 5, 7, BITS),
+                       ('fx', 7, 8, BITS))
+
     def __init__(self):
         self.exist   = False
-        self.len     = 1
         self.foe_fri = 0
         self.fx      = 0  # There is no more documentacion about this FX
 
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True 
-        self.foe_fri = res[5:7]
-        self.fx = res[7:]
         count_octets += self.len            
         return count_octets
         
@@ -1886,20 +2020,27 @@ class RPC:
     ar: 'RPC.AR()'
     rw: 'RPC.RW()'
     
+    __slots__ = ('sco', 'scr', 'ar', 'rw', 'octet', 'fx', 'exist')
+    len = 1
+
     @dataclass        
     class SCO:
         sco: int
     
+        __slots__ = ('sco', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('sco', 0, 8))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1
             self.sco   = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.sco   = int(res, 2)
             count_octets += self.len            
             return count_octets
         
@@ -1914,16 +2055,20 @@ class RPC:
     class SCR:
         scr: int
     
+        __slots__ = ('scr', 'exist')
+        len = 2
+
+        FIELDS = bitfields(2,
+                           ('scr', 0, 16, UNSIGNED, 0.1))
+
         def __init__(self):
             self.exist = False
-            self.len   = 2
             self.scr   = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.scr   = int(res, 2)*0.1
             count_octets += self.len            
             return count_octets
         
@@ -1938,16 +2083,20 @@ class RPC:
     class AR:
         ar: int
     
+        __slots__ = ('ar', 'exist')
+        len = 2
+
+        FIELDS = bitfields(2,
+                           ('ar', 0, 16, UNSIGNED, 1/256))
+
         def __init__(self):
             self.exist = False
-            self.len   = 2
             self.ar    = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.ar    = int(res, 2)*(1/256)
             count_octets += self.len            
             return count_octets  
         
@@ -1962,16 +2111,20 @@ class RPC:
     class RW:
         rw: int
         
+        __slots__ = ('rw', 'exist')
+        len = 2
+
+        FIELDS = bitfields(2,
+                           ('rw', 0, 16, UNSIGNED, 1/256))
+
         def __init__(self):
             self.exist = False
-            self.len   = 2
             self.rw    = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)            
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.rw    = int(res, 2)*(1/256)
             count_octets += self.len            
             return count_octets 
         
@@ -1983,9 +2136,12 @@ class RPC:
             return ""        
         
         
+    FIELDS = bitfields(1,
+                       ('octet', 0, 8, BITS),
+                       ('fx', 7, 8, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1 
         self.octet = 0
         self.sco   = self.SCO()
         self.scr   = self.SCR()
@@ -1994,11 +2150,9 @@ class RPC:
         self.fx    = 0
     
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = "{0:08b}".format(int(info_item, 16))
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.octet = res
-        self.fx = res[-1]
         count_octets += self.len
         if self.octet[0] == '1':
             count_octets = self.sco.add_info(self, info, count_octets)
@@ -2025,16 +2179,20 @@ class RPC:
 class ERR:
     rho: int
     
+    __slots__ = ('rho', 'exist')
+    len = 3
+
+    FIELDS = bitfields(3,
+                       ('rho', 0, 24, UNSIGNED, 1/256))
+
     def __init__(self):
         self.exist = False
-        self.len   = 3
         self.rho   = 0
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True 
-        self.rho = int(res, 2)*(1/256)
         count_octets += self.len        
         return count_octets
     
@@ -2056,9 +2214,19 @@ class PTL:
     psr: int
     plotnr: int
 
+    __slots__ = ('scn', 'rc', 'ac', 'ssr', 'psr', 'plotnr', 'exist')
+    len = 3
+
+    FIELDS = bitfields(3,
+                       ('scn', 3, 4, BITS),
+                       ('rc', 4, 5, BITS),
+                       ('ac', 5, 6, BITS),
+                       ('ssr', 6, 7, BITS),
+                       ('psr', 7, 8, BITS),
+                       ('plotnr', 8, 24, BITS))
+
     def __init__(self):
         self.exist  = False
-        self.len    = 3
         self.scn    = 0
         self.rc     = 0
         self.ac     = 0
@@ -2068,15 +2236,9 @@ class PTL:
 
             
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = hexabin(info_item, 16)        
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist  = True
-        self.scn    = res[3:4]
-        self.rc     = res[4:5]
-        self.ac     = res[5:6]
-        self.ssr    = res[6:7]
-        self.psr    = res[7:8]
-        self.plotnr = res[8:]
         count_octets += self.len        
         return count_octets  
     
@@ -2097,20 +2259,27 @@ class PTL:
 class ATL:
     blocks: []
 
+    __slots__ = ('blocks', 'exist', 'rep')
+    len = 0
+
     @dataclass
     class ADSBTL:
         adsbrepnr: int
         
+        __slots__ = ('adsbrepnr', 'exist')
+        len = 2
+
+        FIELDS = bitfields(2,
+                           ('adsbrepnr', 0, 16, BITS))
+
         def __init__(self):
             self.exist     = False
-            self.len       = 2
             self.adsbrepnr = 0
         
         def add_info (self, info = str, count_octets = int):
-            #info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.adsbrepnr = res
             count_octets += self.len            
             return count_octets
         
@@ -2121,17 +2290,14 @@ class ATL:
     
     def __init__(self):
         self.exist  = False
-        self.len    = 0
-        self.hex    = 0
         self.rep    = 0
         self.blocks = []
         
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        self.rep = int(info_item, 16)
+        info_item = info[count_octets:count_octets+lenght]
+        self.rep = octetint(info_item)
         count_octets += lenght 
         
         for i in range(self.rep): 
@@ -2139,7 +2305,6 @@ class ATL:
             self.blocks.append(new_block)
             count_octets = self.blocks[i].add_info(info, count_octets)
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
 
     def __str__(self):
@@ -2154,15 +2319,18 @@ class ATL:
 class TRN:
     probaturn: int
     
+    __slots__ = ('probaturn', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('probaturn', 0, 8, UNSIGNED, 0.01))
+
     def __init__(self):
         self.exist      = False
-        self.len        = 1
         self.probaturn  = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.probaturn = int(res, 2)*0.01
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -2184,9 +2352,27 @@ class NPP:
     noisethetaend: int
     predtime: int
 
+    __slots__ = ('predrho', 'predtheta', 'evolrhostart', 'evolrhoend',
+                 'evolthetastart', 'evolthetaend', 'noiserhostart',
+                 'noiserhoend', 'noisethetastart', 'noisethetaend', 'predtime',
+                 'exist')
+    len = 22
+
+    FIELDS = bitfields(22,
+                       ('predrho', 0, 16, UNSIGNED, 1/128),
+                       ('predtheta', 16, 32, UNSIGNED, 360/pow(2,16)),
+                       ('evolrhostart', 32, 48, UNSIGNED, 1/128),
+                       ('evolrhoend', 48, 64, UNSIGNED, 1/128),
+                       ('evolthetastart', 64, 80, UNSIGNED, 360/pow(2,16)),
+                       ('evolthetaend', 80, 96, UNSIGNED, 360/pow(2,16)),
+                       ('noiserhostart', 96, 112, UNSIGNED, 1/128),
+                       ('noiserhoend', 112, 128, UNSIGNED, 1/128),
+                       ('noisethetastart', 128, 144, UNSIGNED, 360/pow(2,16)),
+                       ('noisethetaend', 144, 160, UNSIGNED, 360/pow(2,16)),
+                       ('predtime', 160, 176, UNSIGNED, 1/128))
+
     def __init__(self):
         self.exist           = False
-        self.len             = 22
         self.predrho         = 0
         self.predtheta       = 0
         self.evolrhostart    = 0
@@ -2200,19 +2386,7 @@ class NPP:
         self.predtime        = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.predrho         = int(res[:16], 2)*(1/128)
-        self.predtheta       = int(res[16:32], 2)*(360/pow(2,16))
-        self.evolrhostart    = int(res[32:48], 2)*(1/128)
-        self.evolrhoend      = int(res[48:64], 2)*(1/128)
-        self.evolthetastart  = int(res[64:80], 2)*(360/pow(2,16))
-        self.evolthetaend    = int(res[80:96], 2)*(360/pow(2,16))
-        self.noiserhostart   = int(res[96:112], 2)*(1/128)
-        self.noiserhoend     = int(res[112:128], 2)*(1/128)
-        self.noisethetastart = int(res[128:144], 2)*(360/pow(2,16))
-        self.noisethetaend   = int(res[144:160], 2)*(360/pow(2,16))
-        self.predtime        = int(res[160:], 2)*(1/128)
+        extract_fields(self, octetint(info), self.FIELDS)
         #self.probaturn = int(res, 2)*0.01
         
     def __str__(self):
@@ -2236,25 +2410,32 @@ class NPP:
 class DLK:
     blocks: []
     
+    __slots__ = ('blocks', 'exist', 'rep')
+    len = 0
+
     @dataclass
     class DLC:
         origin: int
         state: int
         
+        __slots__ = ('origin', 'state', 'type', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('type', 0, 4),
+                           ('origin', 4, 6),
+                           ('state', 6, 8))
+
         def __init__(self):
             self.exist  = False
-            self.len    = 1
             self.type   = 0
             self.origin = 0
             self.state  = 0
         
         def add_info (self, info = str, count_octets = int):
-            #info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.type   = int(res[:4], 2)
-            self.origin = int(res[4:6], 2)
-            self.state  = int(res[6:], 2)
             count_octets += self.len            
             return count_octets
         
@@ -2267,17 +2448,14 @@ class DLK:
     
     def __init__(self):
         self.exist  = False
-        self.len    = 0
-        self.hex    = 0
         self.rep    = 0
         self.blocks = []
         
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        self.rep = int(info_item, 16)
+        info_item = info[count_octets:count_octets+lenght]
+        self.rep = octetint(info_item)
         count_octets += lenght 
         
         for i in range(self.rep): 
@@ -2285,7 +2463,6 @@ class DLK:
             self.blocks.append(new_block)
             count_octets = self.blocks[i].add_info(info, count_octets)
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
 
     def __str__(self):
@@ -2301,17 +2478,20 @@ class LCK:
     ls: int
     loctim: int
 
+    __slots__ = ('ls', 'loctim', 'exist')
+    len = 2
+
+    FIELDS = bitfields(2,
+                       ('ls', 0, 1, BITS),
+                       ('loctim', 1, 16))
+
     def __init__(self):
         self.exist   = False
-        self.len     = 2
         self.ls      = 0
         self.loctim  = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.ls      = res[:1]
-        self.loctim  = int(res[1:], 2)*1
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -2329,9 +2509,20 @@ class TC:
     tcount3: int
     tcode3: int
 
+    __slots__ = ('tcount1', 'tcode1', 'tcount2', 'tcode2', 'tcount3', 'tcode3',
+                 'exist')
+    len = 6
+
+    FIELDS = bitfields(6,
+                       ('tcount1', 7, 11),
+                       ('tcode1', 11, 16, BITS),
+                       ('tcount2', 16, 20),
+                       ('tcode2', 20, 32, BITS),
+                       ('tcount3', 32, 36),
+                       ('tcode3', 36, 48, BITS))
+
     def __init__(self):
         self.exist   = False
-        self.len     = 6
         self.tcount1 = 0
         self.tcode1  = 0
         self.tcount2 = 0
@@ -2340,14 +2531,7 @@ class TC:
         self.tcode3  = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)        
-        self.tcount1 = int(res[7:11],2)
-        self.tcode1  = res[11:16]
-        self.tcount2 = int(res[16:20],2)
-        self.tcode2  = res[20:32]
-        self.tcount3 = int(res[32:36],2)
-        self.tcode3  = res[36:]
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -2366,19 +2550,22 @@ class TLC:
     trkupdctr: int
     lasttrkupd: int
 
+    __slots__ = ('acqi', 'trkupdctr', 'lasttrkupd', 'exist')
+    len = 4
+
+    FIELDS = bitfields(4,
+                       ('acqi', 0, 2),
+                       ('trkupdctr', 2, 16),
+                       ('lasttrkupd', 16, 32))
+
     def __init__(self):
         self.exist      = False
-        self.len        = 4
         self.acqi       = 0
         self.trkupdctr  = 0
         self.lasttrkupd = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.acqi = int(res[:2],2)
-        self.trkupdctr  = int(res[2:16],2)
-        self.lasttrkupd = int(res[16:],2)*1
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -2393,6 +2580,9 @@ class TLC:
 class ASI:
     blocks: []
     
+    __slots__ = ('blocks', 'exist', 'rep')
+    len = 0
+
     @dataclass
     class ASIBlock:
         sacadjs: int
@@ -2402,9 +2592,20 @@ class ASI:
         drna: int
         drn: int
         
+        __slots__ = ('sacadjs', 'sicadjs', 'time_of_day_scn', 'datause',
+                     'drna', 'drn', 'exist')
+        len = 8
+
+        FIELDS = bitfields(8,
+                           ('sacadjs', 0, 8),
+                           ('sicadjs', 8, 16),
+                           ('time_of_day_scn', 16, 40),
+                           ('datause', 40, 47),
+                           ('drna', 47, 48),
+                           ('drn', 48, 64))
+
         def __init__(self):
             self.exist           = False
-            self.len             = 8
             self.sacadjs         = 0
             self.sicadjs         = 0
             self.time_of_day_scn = 0
@@ -2413,15 +2614,9 @@ class ASI:
             self.drn             = 0
         
         def add_info (self, info = str, count_octets = int):
-            #info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.sacadjs         = int(res[:8], 2)
-            self.sicadjs         = int(res[8:16], 2)
-            self.time_of_day_scn = int(res[16:40], 2)
-            self.datause         = int(res[40:47], 2)
-            self.drna            = int(res[47:48], 2)
-            self.drn             = int(res[48:], 2)
             count_octets += self.len            
             return count_octets
         
@@ -2437,17 +2632,14 @@ class ASI:
     
     def __init__(self):
         self.exist  = False
-        self.len    = 0
-        self.hex    = 0
         self.rep    = 0
         self.blocks = []
         
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        self.rep = int(info_item, 16)
+        info_item = info[count_octets:count_octets+lenght]
+        self.rep = octetint(info_item)
         count_octets += lenght 
         
         for i in range(self.rep): 
@@ -2455,7 +2647,6 @@ class ASI:
             self.blocks.append(new_block)
             count_octets = self.blocks[i].add_info(info, count_octets)
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
 
     def __str__(self):
@@ -2470,17 +2661,20 @@ class ASI:
 class TES:
     tes: int
 
+    __slots__ = ('tes', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('tes', 0, 8))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
         self.tes   = 0
         
     def add_info(self, info):
-        self.hex = info
         #res = "{0:08b}".format(int(info[:5], 16))
         #res = res + "{0:08b}".format(int(info[5:], 16))
-        res = hexabin(info, 16)
-        self.tes = int(res, 2)
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -2493,17 +2687,20 @@ class IR:
     ir: int
     m3a: int
 
+    __slots__ = ('ir', 'm3a', 'exist')
+    len = 1
+
+    FIELDS = bitfields(1,
+                       ('ir', 0, 1, BITS),
+                       ('m3a', 1, 8))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1
         self.ir    = 0
         self.m3a   = 0
         
     def add_info(self, info):
-        self.hex = info
-        res = hexabin(info, 16)
-        self.ir  = res[:1]
-        self.m3a = int(res[1:], 2)*1
+        extract_fields(self, octetint(info), self.FIELDS)
         
     def __str__(self):
         return (
@@ -2517,6 +2714,9 @@ class RTC:
     octet_1: 'RTC.Octet1()'
     octet_2: 'RTC.Octet2()'
     
+    __slots__ = ('octet_1', 'octet_2', 'exist', 'fx')
+    len = 0
+
     @dataclass
     class Octet2:
         tlc: TLC()
@@ -2524,9 +2724,11 @@ class RTC:
         tes: TES()
         ir: IR()
         
+        __slots__ = ('tlc', 'asi', 'tes', 'ir', 'exist', 'octet', 'fx')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.octet = 0
             self.tlc   = TLC()
             self.asi   = ASI()
@@ -2558,9 +2760,12 @@ class RTC:
         lck: LCK()
         tc: TC()
         
+        __slots__ = ('ptl', 'atl', 'trn', 'npp', 'dlk', 'lck', 'tc', 'exist',
+                     'octet', 'fx')
+        len = 1
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.octet = 0
             self.ptl   = PTL()
             self.atl   = ATL()
@@ -2600,29 +2805,26 @@ class RTC:
     
     def __init__(self):
         self.exist   = False
-        self.len     = 0
-        self.hex     = 0
         self.octet_1 = self.Octet1()
         self.octet_2 = self.Octet2()
         self.fx      = 0   # There is no more documentacion about this FX
 
 
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1
-        info_item = info[count_octets*2:count_octets*2+lenght*2]
-        res = "{0:08b}".format(int(info_item, 16))
-        self.octet_1.octet = res
+        info_item = info[count_octets:count_octets+lenght]
+        octet = octetint(info_item)
+        self.octet_1.octet = format(octet, '08b')
         self.octet_1.exist = True
         count_octets += lenght
         
-        if res[7:] == '1':
-            info_item = info[count_octets*2:count_octets*2+lenght*2]
-            res = "{0:08b}".format(int(info_item, 16))
-            self.octet_2.octet = res
+        if octet & 0x01:
+            info_item = info[count_octets:count_octets+lenght]
+            octet = octetint(info_item)
+            self.octet_2.octet = format(octet, '08b')
             self.octet_2.exist = True
             count_octets += lenght
-            self.fx  = res[7:]
+            self.fx  = '1' if octet & 0x01 else '0'
         
         if self.octet_1.exist:
             count_octets = self.octet_1.add_info(self, info, count_octets)
@@ -2630,7 +2832,6 @@ class RTC:
             if self.octet_2.exist:
                 count_octets = self.octet_2.add_info(self, info, count_octets)
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         return count_octets
         
     
@@ -2646,20 +2847,27 @@ class CPC:
     snb: 'CPC.SNB()'
     date: 'CPC.DATE()'
     
+    __slots__ = ('pnb', 'rpl', 'snb', 'date', 'octet', 'fx', 'exist')
+    len = 1
+
     @dataclass
     class PNB:
         plotnbr: int
     
+        __slots__ = ('plotnbr', 'exist')
+        len = 2
+
+        FIELDS = bitfields(2,
+                           ('plotnbr', 0, 16, BITS))
+
         def __init__(self):
             self.exist   = False
-            self.len     = 2
             self.plotnbr = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.plotnbr = res
             count_octets += self.len            
             return count_octets
         
@@ -2675,23 +2883,30 @@ class CPC:
         #rep: int
         blocks: []
         
+        __slots__ = ('blocks', 'exist', 'rep')
+        len = 0
+
         @dataclass
         class RPLBlock:
             typeb: int
             replynbr: int
             
+            __slots__ = ('typeb', 'replynbr', 'exist')
+            len = 3
+
+            FIELDS = bitfields(3,
+                               ('typeb', 0, 8),
+                               ('replynbr', 8, 24, BITS))
+
             def __init__(self):
                 self.exist    = False
-                self.len      = 3
                 self.typeb     = 0
                 self.replynbr = 0
             
             def add_info (self, info = str, count_octets = int):
-                #info_item = info[count_octets*2:count_octets*2+self.len*2]
-                res = hexabin(info, 16)
+                info_item = info[count_octets:count_octets+self.len]
+                extract_fields(self, octetint(info_item), self.FIELDS)
                 self.exist = True
-                self.typeb  = int(res[:8], 2)
-                self.replynbr = res[8:]
                 count_octets += self.len
                 return count_octets
             
@@ -2702,23 +2917,19 @@ class CPC:
      
         def __init__(self):
             self.exist  = False
-            self.len    = 0
-            self.hex    = 0
             self.rep    = 0
             self.blocks = []
             
             
         def add_info(self, info = str, count_octets = int):
-            aux_count_octets = count_octets
             lenght = 1
-            info_item = info[count_octets*2:count_octets*2+lenght*2]
-            self.rep = int(info_item, 16)
+            info_item = info[count_octets:count_octets+lenght]
+            self.rep = octetint(info_item)
             count_octets += lenght 
             for i in range(self.rep): 
                 new_block = self.RPLBlock()
                 self.blocks.append(new_block)
                 count_octets = self.blocks[i].add_info(info, count_octets)
-            self.hex = info[aux_count_octets*2:count_octets*2]
             return count_octets
     
         def __str__(self):
@@ -2732,16 +2943,20 @@ class CPC:
     class SNB:
         scannbr: int
     
+        __slots__ = ('scannbr', 'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('scannbr', 0, 8))
+
         def __init__(self):
             self.exist   = False
-            self.len     = 1
             self.scannbr = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.scannbr = int(res, 2)
             count_octets += self.len
             return count_octets
         
@@ -2756,9 +2971,22 @@ class CPC:
     class DATE:
         date: int
     
+        __slots__ = ('date', 'y1', 'y2', 'y3', 'y4', 'm1', 'm2', 'd1', 'd2',
+                     'exist')
+        len = 4
+
+        FIELDS = bitfields(4,
+                           ('y1', 0, 4),
+                           ('y2', 4, 8),
+                           ('y3', 8, 12),
+                           ('y4', 12, 16),
+                           ('m1', 16, 20),
+                           ('m2', 20, 24),
+                           ('d1', 20, 24),
+                           ('d2', 20, 24))
+
         def __init__(self):
             self.exist = False
-            self.len   = 4
             self.y1    = 0
             self.y2    = 0
             self.y3    = 0
@@ -2770,17 +2998,9 @@ class CPC:
             self.date  = 0
                 
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = hexabin(info_item, 16)
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.y1    = int(res[:4],2)
-            self.y2    = int(res[4:8],2)
-            self.y3    = int(res[8:12],2)
-            self.y4    = int(res[12:16],2)
-            self.m1    = int(res[16:20],2)
-            self.m2    = int(res[20:24],2)
-            self.d1    = int(res[20:24],2)
-            self.d2    = int(res[20:24],2)
             self.date  = (f'{self.y1}{self.y2}{self.y3}{self.y4}/{self.m1}{self.m2}'
                           f'/{self.d1}{self.d2}')
             count_octets += self.len            
@@ -2794,9 +3014,12 @@ class CPC:
             return ""
     
         
+    FIELDS = bitfields(1,
+                       ('octet', 0, 8, BITS),
+                       ('fx', 7, 8, BITS))
+
     def __init__(self):
         self.exist = False
-        self.len   = 1 
         self.octet = 0
         self.pnb   = self.PNB()
         self.rpl   = self.RPL()
@@ -2805,11 +3028,9 @@ class CPC:
         self.fx    = 0
     
     def add_info (self, item, info = str, count_octets = int):
-        info_item = info[count_octets*2:count_octets*2+self.len*2]
-        res = "{0:08b}".format(int(info_item, 16))
+        info_item = info[count_octets:count_octets+self.len]
+        extract_fields(self, octetint(info_item), self.FIELDS)
         self.exist = True
-        self.octet = res
-        self.fx = res[-1]
         count_octets += self.len
         
         if self.octet[0] == '1':
@@ -2838,6 +3059,9 @@ class RE:
     #len_indicator: int
     data: 'RE.Data()'
     
+    __slots__ = ('data', 'exist', 'len_indicator')
+    len = 0
+
     @dataclass
     class Data:
         octet: int
@@ -2849,9 +3073,15 @@ class RE:
         rtc: RTC()
         cpc: CPC()
     
+        __slots__ = ('octet', 'md5', 'm5n', 'm4e', 'rpc', 'err', 'rtc', 'cpc',
+                     'exist')
+        len = 1
+
+        FIELDS = bitfields(1,
+                           ('octet', 0, 8, BITS))
+
         def __init__(self):
             self.exist = False
-            self.len   = 1 
             self.octet = 0
             self.md5   = MD5()
             self.m5n   = M5N()
@@ -2862,10 +3092,9 @@ class RE:
             self.cpc   = CPC()
         
         def add_info (self, item, info = str, count_octets = int):
-            info_item = info[count_octets*2:count_octets*2+self.len*2]
-            res = "{0:08b}".format(int(info_item, 16))
+            info_item = info[count_octets:count_octets+self.len]
+            extract_fields(self, octetint(info_item), self.FIELDS)
             self.exist = True
-            self.octet = res
             count_octets += self.len
             
             if self.octet[0] == '1':
@@ -2895,20 +3124,16 @@ class RE:
     
     def __init__(self):
         self.exist           = False
-        self.len             = 0
-        self.hex             = 0
         self.len_indicator   = 0
         self.data            = self.Data()
         
     def add_info(self, info = str, count_octets = int):
-        aux_count_octets = count_octets
         lenght = 1
-        self.len_indicator = info[count_octets*2:count_octets*2+lenght*2]
-        #aux_count = count_octets + int(self.len_indicator,16)
+        self.len_indicator = octetint(info[count_octets:count_octets+lenght])
+        #aux_count = count_octets + self.len_indicator
         count_octets += lenght
         count_octets = self.data.add_info(self, info, count_octets)
         
-        self.hex = info[aux_count_octets*2:count_octets*2]
         #if count_octets == aux_count:
         #    print("----CORRECT READ LENGTH----")
             
@@ -2922,10 +3147,15 @@ class RE:
 @dataclass
 class ItemNotUsed:
     
+    __slots__ = ('exist',)
+    len = 0
+
     def __init__(self):
         self.exist           = False
-        self.len             = 0   
-        self.hex             = 0
+        
+    def add_info(self, info = str, count_octets = int):
+        # Its length is unknown, so the rest of the record cannot be read
+        raise ValueError("Item not used (spare FRN) present on FSPEC")
         
     def __str__(self, item):
         return 'Item not used\n\n'
@@ -2964,108 +3194,124 @@ class BlockCat48:
     sp     : ItemNotUsed()
     re     : RE()
     
-    def __init__(self):
-        self.fspec   = 0
-        self.item010 = Item010()
-        self.item140 = Item140()
-        self.item020 = Item020()
-        self.item040 = Item040()
-        self.item070 = Item070()
-        self.item090 = Item090()
-        self.item130 = Item130()
-        self.item220 = Item220()
-        self.item240 = Item240()
-        self.item250 = Item250(self.item090)
-        self.item161 = Item161()
-        self.item042 = Item042()
-        self.item200 = Item200()
-        self.item170 = Item170()
-        self.item210 = Item210()
-        self.item030 = Item030()
-        self.item080 = Item080()
-        self.item100 = Item100()
-        self.item110 = Item110()
-        self.item120 = Item120()
-        self.item230 = Item230()
-        self.item260 = Item260()
-        self.item055 = Item055()
-        self.item050 = Item050()
-        self.item065 = Item065()
-        self.item060 = Item060()
-        self.sp      = ItemNotUsed()
-        self.re      = RE()
-       
+    _items = None
     
-    def add_items(self, info: str, count_octets: int, message_info):
-        nombres_atributos = list(self.__dict__.keys())
-        i = 0
-        for nombre in nombres_atributos[1:]:
-            if self.fspec[i] != '0':
-                valor_item = getattr(self, nombre)
-                if valor_item.len > 0:
-                    info_item = info[count_octets*2:count_octets*2+valor_item.len*2]
-                    valor_item.add_info(info_item)
-                    count_octets += valor_item.len
-                else:
-                    count_octets = valor_item.add_info(info, count_octets)
-                message_info.modify_count(count_octets)
-            #else:
-            #    print("_______________________________________")
-            #    print("ITEM NO INCLUIDO00: {}".format(nombre))  
-            i += 1
-            if i >= len(self.fspec):
+    def __init__(self, lazy: bool = False, items = None):
+        # Only the items present in the record are set on the block, absent
+        # ones are the empty item shared by all blocks (see install_items)
+        self.fspec   = 0
+        if items is not None:
+            # Item projection: only these items are decoded
+            self._items = frozenset(items)
+        if lazy:
+            # Fixed-length items are decoded on first access, see load_item
+            self._info    = b""
+            self._offsets = {}
+    
+
+    def add_items(self, info: bytes, count_octets: int, message_info, frns):
+        uap = self.UAP
+        items = self._items
+        offsets = self.__dict__.get('_offsets')
+        if offsets is not None:
+            self._info = info
+        for frn in frns:
+            if frn >= len(uap):
                 break
+            nombre, length = uap[frn]
+            if items is not None and nombre not in items and (length > 0 or nombre in self.SKIP):
+                # Not requested: skip it by its length, without decoding it
+                if count_octets >= len(info):
+                    raise ValueError("Truncated record: no octets left to decode")
+                if length > 0:
+                    count_octets += length
+                else:
+                    count_octets = self.SKIP[nombre](info, count_octets)
+            elif length > 0 and offsets is not None:
+                # Lazy: only keep where the item starts
+                if count_octets >= len(info):
+                    raise ValueError("Truncated record: no octets left to decode")
+                offsets[nombre] = count_octets
+                count_octets += length
+            elif length > 0:
+                getattr(self, nombre).add_info(info[count_octets:count_octets+length])
+                count_octets += length
+            else:
+                valor_item = self.__dict__.get(nombre)
+                if valor_item is None:
+                    valor_item = self.new_item(nombre)
+                    valor_item.exist = True
+                    setattr(self, nombre, valor_item)
+                count_octets = valor_item.add_info(info, count_octets)
+            if count_octets > len(info):
+                # The item (decoded or skipped) runs past the end of the record
+                raise ValueError("Truncated record: no octets left to decode")
+            message_info.modify_count(count_octets)
         return count_octets
         
     
-    def modify_exist(self, fspec):       
-        # Get item names of instance
-        nombres_atributos = list(self.__dict__.keys())
-        i = 0
-        for nombre in nombres_atributos[1:]:
-            if fspec[i] != '0':
-                valor_actual = getattr(self, nombre)
-                setattr(valor_actual, 'exist', True)
-            #else:
-            #  print("ITEM NO INCLUIDO-O: {}".format(nombre))  
-            i += 1
-            if i >= len(fspec):
+    def modify_exist(self, frns):
+        if '_offsets' in self.__dict__:
+            # Lazy blocks mark their items when they are created
+            return
+        uap = self.UAP
+        items = self._items
+        for frn in frns:
+            if frn >= len(uap):
                 break
+            nombre = uap[frn][0]
+            if items is None or nombre in items:
+                valor_item = self.new_item(nombre)
+                valor_item.exist = True
+                setattr(self, nombre, valor_item)
+
 
+    def item_names(self):
+        if self._items is None:
+            return [nombre for nombre, length in self.UAP]
+        return [nombre for nombre, length in self.UAP if nombre in self._items]
+    
+    
+    def new_item(self, nombre):
+        if nombre == 'item250':
+            return Item250(self.item090)
+        return self.ITEM_TYPES[nombre]()
+    
+
+    def load_item(self, nombre):
+        # Lazy blocks: fixed-length item decoded the first time it is read
+        count_octets = self._offsets[nombre]
+        valor_item = self.new_item(nombre)
+        valor_item.exist = True
+        valor_item.add_info(self._info[count_octets:count_octets+valor_item.len])
+        setattr(self, nombre, valor_item)
+        return valor_item
+    
 
     def check_fspec(self, line, count_octets):
-        fspec = ""
-        while True:
-            octet = line[count_octets*2:count_octets*2+2]
-            count_octets += 1
-            res = "{0:08b}".format(int(octet, 16))
-            final = res[7]
-            fspec += res[0:7]
-            if final != '1':
-                break
-        return fspec, count_octets
+        return read_fspec(line, count_octets)
     
 
-    def add_fspec(self, fspec):
+    def add_fspec(self, fspec, frns):
         self.fspec = fspec
-        self.modify_exist(fspec)
+        self.modify_exist(frns)
         
         
     def add_block(self, info, count, message_info):
-        fspec, count_octets = self.check_fspec(info, count)
-        self.add_fspec(fspec)
-        count_octets = self.add_items(info, count_octets, message_info)
+        fspec, frns, count_octets = self.check_fspec(info, count)
+        self.add_fspec(fspec, frns)
+        count_octets = self.add_items(info, count_octets, message_info, frns)
         return count_octets
         
         
     def print_info_debbug(self):     
         # Obtener los nombres de los atributos de la instancia
         str_info = ""
-        nombres_atributos = list(self.__dict__.keys())
+        nombres_atributos = self.item_names()
         # Iterar sobre los atributos en el orden de declaración
         print("Valor actual:", nombres_atributos)
         print("\n----------------------------\n")
-        for nombre in nombres_atributos[1:]:
+        for nombre in nombres_atributos:
             valor_actual = getattr(self, nombre)
             #print("Valor actual:", valor_actual)
             if valor_actual.exist: 
@@ -3081,8 +3327,7 @@ class BlockCat48:
     
     def print_info(self):     
         str_info = ""
-        nombres_atributos = list(self.__dict__.keys())
-        for nombre in nombres_atributos[1:]:
+        for nombre in self.item_names():
             valor_actual = getattr(self, nombre)
             if valor_actual.exist: 
                 str_info += str(valor_actual) + "\n"
@@ -3093,22 +3338,64 @@ class BlockCat48:
         return (self.print_info())
 
 
+# FRN-indexed decode plan and shared empty items, compiled once from the UAP
+# order of the block
+install_items(BlockCat48)
+
+# Length rules of the variable-length items, to skip them when they are not
+# requested (item projection)
+BlockCat48.SKIP = {
+    'item020': skip_fx(3),
+    'item030': skip_fx(2),
+    'item120': skip_compound((2, skip_rep(6))),
+    'item130': skip_compound((1,) * 7),
+    'item170': skip_fx(2),
+    'item250': skip_rep(8),
+    'sp':      skip_explicit,
+    're':      skip_explicit,
+}
+
+# Type of the fields decoded outside a FIELDS table (or rescaled after it),
+# by column name, for the columnar outputs (the rest come from the tables)
+BlockCat48.DTYPES = {
+    'item010.sac':                int,
+    'item010.sic':                int,
+    'item140.time_of_day':        float,
+    'item020.second_ext.adsb':    str,
+    'item130.srl.srl':            float,
+    'item130.srr.srr':            int,
+    'item130.sam.sam':            int,
+    'item130.prl.prl':            float,
+    'item240.aircraft_id':        str,
+    'item260.acasra':             str,
+    're.data.md5.ga.ga':          int,
+    're.data.m5n.octet_1.ga.ga':  int,
+    're.data.m5n.octet_2.octet':  str,
+    're.data.cpc.date.date':      str,
+}
+
+
 ##############################################################################
 @dataclass
 class AsterixMessage:
     cat: int
     leng: int
-    info: int
+    info: bytes
     count: int
     blocks: []
     
     
-    def __init__(self, cat: int, length: int, info: str, count: int):
+    __slots__ = ('cat', 'leng', 'info', 'count', 'blocks', 'lazy', 'items')
+
+    def __init__(self, cat: int, length: int, info, count: int, lazy: bool = False,
+                 items = None):
         self.cat = cat
         self.leng = length
-        self.info = info
+        self.info = to_octets(info)
         self.count = count
         self.blocks = []
+        self.lazy = lazy
+        self.items = items
         
         
     def modify_count(self, count_octets):
@@ -3116,19 +3403,27 @@ class AsterixMessage:
         
         
     def add_blocks(self):
-        # Add new BlockCat21 instance to blocks list
-        new_block = BlockCat48()
-        self.blocks.append(new_block)
+        # One BlockCat48 per record of the data block, until LEN is reached
+        info = self.info
         try:
-            i = 0
             while self.count < self.leng:
-                count_octets = self.blocks[i].add_block(self.info, self.count, self)
+                if not info[self.count]:
+                    # Empty FSPEC: filler octets after the last record
+                    break
+                new_block = BlockCat48(self.lazy, self.items)
+                count_octets = new_block.add_block(info, self.count, self)
+                self.blocks.append(new_block)
                 self.modify_count(count_octets)
-                i += 1
-        except IndexError as e:
-            print("-----------------------------")
-            print(f"Error: {e}")
-            print("-----------------------------")
+        except (IndexError, ValueError) as e:
+            # Record cut short (LEN beyond the octets of the message) or with
+            # an item that cannot be decoded
+            if not self.blocks:
+                if isinstance(e, IndexError):
+                    raise ValueError("Truncated record: no octets left to decode")
+                raise
+            # The records before it are kept
+            logging.error(f'Record {len(self.blocks)} not decoded: {self.info.hex().upper()}\n')
+            logging.error(f'Error: {e}\n')
             
         
     def __str__(self):
@@ -3140,7 +3435,7 @@ class AsterixMessage:
         return ('********************************************\n'
                 '*******   Decoded ASTERIX Message:   *******\n'
                 '********************************************\n\n'
-                f'{self.info}\n' 
+                f'{self.info.hex().upper()}\n' 
                 '********************************************\n\n'
                 + data)
     
@@ -3152,15 +3447,27 @@ class Category48:
     messages: []
     
     
+    __slots__ = ('count', 'messages')
+
     def __init__(self):
         self.count = 0
         self.messages = []
         
         
-    def add_message(self, cat: int, length: int, info: str, count: int, num_message: int):
-        new_message = AsterixMessage(cat, length, info, count)
+    def add_message(self, cat: int, length: int, info: bytes, count: int, num_message: int,
+                    lazy: bool = False, items = None, cache = None):
+        if cache is not None:
+            # Record already decoded: the cached message is shared
+            key = cache.message_key(info, lazy, items)
+            cached_message = cache.get(key)
+            if cached_message is not None:
+                self.messages.append(cached_message)
+                return
+        new_message = AsterixMessage(cat, length, info, count, lazy, items)
         self.messages.append(new_message)
         self.messages[num_message].add_blocks()
+        if cache is not None:
+            cache.put(key, new_message)
               
         
     def add_count(self):
@@ -6,16 +6,17 @@ Created on Mon Jan 22 17:01:30 2024
 @author: rodrigo
 """
 
-import math
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 import logging
 
+import numpy as np
 
-######################################################
+from .octets import bitfields, field_values, SIGNED, UNSIGNED
+from .cache import DecodeCache
+from .serialize import to_dict
 
-def hexabin(num = int, base = int):
-  return bin(int(num, base))[2:].zfill(len(num) * int(math.log2(base)))
 
+######################################################
 
 def twos_comp(val, bits):
     """compute the 2's complement of int value val"""
@@ -52,9 +53,10 @@ def calculate_cas(altitude_ft, mach_aircraft, static_pressure):
     a0 = 661.47    # Speed of sound at sea level in knots
     P0 = 101325    # Standard sea level pressure in Pa
 
-    q0 = static_pressure*( pow(1+0.2*pow(mach_aircraft,2),7/2) - 1)
+    # Also on NumPy arrays (see infer_bds_batch)
+    q0 = static_pressure*( (1+0.2*mach_aircraft**2)**(7/2) - 1)
     
-    cas = a0 * math.sqrt(5 * (pow((q0/P0+1),2/7) -1))
+    cas = a0 * np.sqrt(5 * ((q0/P0+1)**(2/7) -1))
 
     return cas
 
@@ -73,6 +75,19 @@ class BDS44():
     turbulence: int
     humidity: int
     
+    FIELDS = bitfields(7,
+                       ('fom', 0, 4),
+                       ('wind_status', 4, 5),
+                       ('wind_speed', 5, 14),
+                       ('wind_direction', 14, 23, UNSIGNED, 180/256),
+                       ('temperature', 23, 34, SIGNED, 0.25),
+                       ('pressure_status', 34, 35),
+                       ('avg_static_pressure', 35, 46),
+                       ('turbulence_status', 46, 47),
+                       ('turbulence', 47, 49),
+                       ('humidity_status', 49, 50),
+                       ('humidity', 50, 56, UNSIGNED, 100/64))
+    
     
     def __init__(self):
         self.exist        = False
@@ -94,28 +109,24 @@ class BDS44():
     def add_info(self, bds_data: str):
         
         #print("\n---BDS44---")
-        res = hexabin(bds_data, 16)
+        raw = field_values(int(bds_data, 16), self.FIELDS)
         
         #Figure of merit
-        self.fom = res[:4]
-        self.fom = int(self.fom, 2)
+        self.fom = raw['fom']
         #print("fom |{}|".format(self.fom))
         if not (0 <= self.fom < 5):
         #    print("BDS error: fom |{}|".format(self.fom))
             return False
         
         #Wind
-        self.wind_status = res[4:5]
-        self.wind_status = int(self.wind_status, 2)
+        self.wind_status = raw['wind_status']
         #print("wind_status |{}|".format(self.wind_status))
         if not (self.wind_status == 0 or self.wind_status == 1):
         #    print("BDS error: wind_status |{}|".format(self.wind_status))
             return False
-        self.wind_speed = res[5:14]
-        self.wind_speed = int(self.wind_speed, 2)*1
+        self.wind_speed = raw['wind_speed']
         
-        self.wind_direction = res[14:23]
-        self.wind_direction = int(self.wind_direction, 2)*(180/256)
+        self.wind_direction = raw['wind_direction']
         
         if self.wind_status == 0 and (self.wind_speed != 0 or self.wind_direction != 0):
         #    print("BDS error: status error\n")
@@ -134,22 +145,19 @@ class BDS44():
             self.wind_direction = None
         
         #Temperature
-        self.temperature = res[23:34]
-        self.temperature = twos_comp(int(self.temperature, 2), len(self.temperature))*0.25
+        self.temperature = raw['temperature']
         #print("temperature |{}|".format(self.temperature))
         if not (-128 <= self.temperature <= 128):
         #    print("BDS error: temperature |{}|".format(self.temperature))
             return False
         
         #Pressure
-        self.pressure_status = res[34:35]
-        self.pressure_status = int(self.pressure_status, 2)
+        self.pressure_status = raw['pressure_status']
         #print("pressure_status |{}|".format(self.pressure_status))
         if not (self.pressure_status == 0 or self.pressure_status == 1):
         #    print("BDS error: wind_status |{}|".format(self.pressure_status))
             return False
-        self.avg_static_pressure = res[35:46]
-        self.avg_static_pressure = int(self.avg_static_pressure, 2)*1
+        self.avg_static_pressure = raw['avg_static_pressure']
         if self.pressure_status == 0 and self.avg_static_pressure != 0:
         #    print("BDS error: status error\n")
             return False
@@ -162,14 +170,12 @@ class BDS44():
             self.avg_static_pressure = None
         
         #Turbulence
-        self.turbulence_status = res[46:47]
-        self.turbulence_status = int(self.turbulence_status, 2)
+        self.turbulence_status = raw['turbulence_status']
         #print("turbulence_status |{}|".format(self.turbulence_status))
         if not (self.turbulence_status == 0 or self.turbulence_status == 1):
         #    print("BDS error: turbulence_status |{}|".format(self.turbulence_status))
             return False
-        self.turbulence = res[47:49]
-        self.turbulence = int(self.turbulence, 2)*1
+        self.turbulence = raw['turbulence']
         if self.turbulence_status == 0 and self.turbulence != 0:
         #    print("BDS error: status error\n")
             return False
@@ -182,14 +188,12 @@ class BDS44():
             self.turbulence = None
         
         #Turbulence
-        self.humidity_status = res[49:50]
-        self.humidity_status = int(self.humidity_status, 2)
+        self.humidity_status = raw['humidity_status']
         #print("humidity_status |{}|".format(self.humidity_status))
         if not (self.humidity_status == 0 or self.humidity_status == 1):
         #    print("BDS error: humidity_status |{}|".format(self.humidity_status))
             return False
-        self.humidity = res[50:56]
-        self.humidity = int(self.humidity, 2)*(100/64)
+        self.humidity = raw['humidity']
         if self.humidity_status == 0 and self.humidity != 0:
         #    print("BDS error: status error\n")
             return False
@@ -235,6 +239,18 @@ class BDS50:
     ground_speed: int
     true_airspeed: int
     
+    FIELDS = bitfields(7,
+                       ('roll_angle_status', 0, 1),
+                       ('roll_angle', 1, 11, SIGNED, 45/256),
+                       ('true_track_angle_status', 11, 12),
+                       ('true_track_angle', 12, 23, SIGNED, 90/512),
+                       ('ground_speed_status', 23, 24),
+                       ('ground_speed', 24, 34, UNSIGNED, 2),
+                       ('track_angle_rate_status', 34, 35),
+                       ('track_angle_rate', 35, 45, SIGNED, 8/256),
+                       ('true_airspeed_status', 45, 46),
+                       ('true_airspeed', 46, 56, UNSIGNED, 2))
+    
     
     def __init__(self):
         self.exist        = False
@@ -255,17 +271,15 @@ class BDS50:
     def add_info(self, bds_data: str):
         
         #print("\n---BDS50---")
-        res = hexabin(bds_data, 16)
+        raw = field_values(int(bds_data, 16), self.FIELDS)
         
         #Roll Angle
-        self.roll_angle_status = res[:1]
-        self.roll_angle_status = int(self.roll_angle_status, 2)
+        self.roll_angle_status = raw['roll_angle_status']
         #print("roll_angle_status |{}|".format(self.roll_angle_status))
         if not (self.roll_angle_status == 0 or self.roll_angle_status == 1):
         #    print("BDS error: roll_angle_status |{}|".format(self.roll_angle_status))
             return False
-        self.roll_angle = res[1:11]
-        self.roll_angle = twos_comp(int(self.roll_angle, 2), len(self.roll_angle))*(45/256)
+        self.roll_angle = raw['roll_angle']
         if self.roll_angle_status == 0 and self.roll_angle != 0:
         #    print("BDS error: status error\n")
             return False
@@ -278,14 +292,12 @@ class BDS50:
             self.roll_angle = None
         
         #True Track Angle
-        self.true_track_angle_status = res[11:12]
-        self.true_track_angle_status = int(self.true_track_angle_status, 2)
+        self.true_track_angle_status = raw['true_track_angle_status']
         #print("rue_track_angle_status |{}|".format(self.true_track_angle_status))
         if not (self.true_track_angle_status == 0 or self.true_track_angle_status == 1):
         #    print("BDS error: true_track_angle_status |{}|".format(self.true_track_angle_status))
             return False
-        self.true_track_angle = res[12:23]
-        self.true_track_angle = twos_comp(int(self.true_track_angle, 2), len(self.true_track_angle))*(90/512)
+        self.true_track_angle = raw['true_track_angle']
         if self.true_track_angle_status == 0 and self.true_track_angle != 0:
         #    print("BDS error: status error\n")
             return False
@@ -298,14 +310,12 @@ class BDS50:
             self.true_track_angle = None
          
         #Ground Speed    
-        self.ground_speed_status = res[23:24]
-        self.ground_speed_status = int(self.ground_speed_status, 2)
+        self.ground_speed_status = raw['ground_speed_status']
         #print("ground_speed_status |{}|".format(self.ground_speed_status))
         if not (self.ground_speed_status == 0 or self.ground_speed_status == 1):
         #    print("BDS error: ground_speed_status |{}|".format(self.ground_speed_status))
             return False
-        self.ground_speed = res[24:34]
-        self.ground_speed = int(self.ground_speed, 2)*2
+        self.ground_speed = raw['ground_speed']
         if self.ground_speed_status == 0 and self.ground_speed != 0:
         #    print("BDS error: status error\n")
             return False
@@ -318,14 +328,12 @@ class BDS50:
             self.ground_speed = None
         
         #Track Angle Rate
-        self.track_angle_rate_status = res[34:35]
-        self.track_angle_rate_status = int(self.track_angle_rate_status, 2)
+        self.track_angle_rate_status = raw['track_angle_rate_status']
         #print("track_angle_rate_status |{}|".format(self.track_angle_rate_status))
         if not (self.track_angle_rate_status == 0 or self.track_angle_rate_status == 1):
         #    print("BDS error: track_angle_rate_status |{}|".format(self.track_angle_rate_status))
             return False
-        self.track_angle_rate = res[35:45]
-        self.track_angle_rate = twos_comp(int(self.track_angle_rate, 2), len(self.track_angle_rate))*(8/256)
+        self.track_angle_rate = raw['track_angle_rate']
         if self.track_angle_rate_status == 0 and self.track_angle_rate != 0:
         #    print("BDS error: status error\n")
             return False
@@ -338,14 +346,12 @@ class BDS50:
             self.track_angle_rate = None
         
         #True Airspeed
-        self.true_airspeed_status = res[45:46]
-        self.true_airspeed_status = int(self.true_airspeed_status, 2) 
+        self.true_airspeed_status = raw['true_airspeed_status']
         #print("true_airspeed_status |{}|".format(self.true_airspeed_status))
         if not (self.true_airspeed_status == 0 or self.true_airspeed_status == 1):
         #    print("BDS error: true_airspeed_status |{}|".format(self.true_airspeed_status))
             return False
-        self.true_airspeed = res[46:]
-        self.true_airspeed = int(self.true_airspeed, 2)*2
+        self.true_airspeed = raw['true_airspeed']
         if self.true_airspeed_status == 0 and self.true_airspeed != 0:
         #    print("BDS error: status error\n")
             return False
@@ -388,6 +394,18 @@ class BDS60:
     barometric_vertical_rate: int
     inertial_vertical_rate: int
     
+    FIELDS = bitfields(7,
+                       ('magnetic_heading_status', 0, 1),
+                       ('magnetic_heading', 1, 12, SIGNED, 90/512),
+                       ('indicated_airspeed_status', 12, 13),
+                       ('indicated_airspeed', 13, 23),
+                       ('mach_number_status', 23, 24),
+                       ('mach_number', 24, 34, UNSIGNED, 0.004),
+                       ('barometric_vertical_rate_status', 34, 35),
+                       ('barometric_vertical_rate', 35, 45, SIGNED, 32),
+                       ('inertial_vertical_rate_status', 45, 46),
+                       ('inertial_vertical_rate', 46, 56, SIGNED, 32))
+    
     
     def __init__(self):
         self.exist        = False
@@ -408,17 +426,15 @@ class BDS60:
     def add_info(self, bds_data: str):
         
         #print("\n---BDS60---")
-        res = hexabin(bds_data, 16)
+        raw = field_values(int(bds_data, 16), self.FIELDS)
         
         #Magnetic Heading
-        self.magnetic_heading_status = res[:1]
-        self.magnetic_heading_status = int(self.magnetic_heading_status, 2)
+        self.magnetic_heading_status = raw['magnetic_heading_status']
         #print("magnetic_heading_status |{}|".format(self.magnetic_heading_status))
         if not (self.magnetic_heading_status == 0 or self.magnetic_heading_status == 1):
         #    print("BDS error: magnetic_heading_status |{}|".format(self.magnetic_heading_status))
             return False
-        self.magnetic_heading = res[1:12]
-        self.magnetic_heading = twos_comp(int(self.magnetic_heading, 2), len(self.magnetic_heading))*(90/512)
+        self.magnetic_heading = raw['magnetic_heading']
         if self.magnetic_heading_status == 0 and self.magnetic_heading != 0:
         #        print("BDS error: status error\n")
                 return False
@@ -431,14 +447,12 @@ class BDS60:
             self.magnetic_heading = None
         
         #Indicated Airspeed
-        self.indicated_airspeed_status = res[12:13]
-        self.indicated_airspeed_status = int(self.indicated_airspeed_status, 2)
+        self.indicated_airspeed_status = raw['indicated_airspeed_status']
         #print("indicated_airspeed_status |{}|".format(self.indicated_airspeed_status))
         if not (self.indicated_airspeed_status == 0 or self.indicated_airspeed_status == 1):
         #    print("BDS error: indicated_airspeed_status |{}|".format(self.indicated_airspeed_status))
             return False
-        self.indicated_airspeed = res[13:23]
-        self.indicated_airspeed = int(self.indicated_airspeed, 2)*1
+        self.indicated_airspeed = raw['indicated_airspeed']
         if self.indicated_airspeed_status == 0 and self.indicated_airspeed != 0:
         #    print("BDS error: status error\n")
             return False
@@ -451,14 +465,12 @@ class BDS60:
             self.indicated_airspeed = None
          
         #Mach Number     
-        self.mach_number_status = res[23:24]
-        self.mach_number_status = int(self.mach_number_status, 2)
+        self.mach_number_status = raw['mach_number_status']
         #print("mach_number_status |{}|".format(self.mach_number_status))
         if not (self.mach_number_status == 0 or self.mach_number_status == 1):
         #    print("BDS error: mach_number_status |{}|".format(self.mach_number_status))
             return False
-        self.mach_number = res[24:34]
-        self.mach_number = int(self.mach_number, 2)*0.004
+        self.mach_number = raw['mach_number']
         if self.mach_number_status == 0 and self.mach_number != 0:
         #    print("BDS error: status error\n")
             return False
@@ -471,14 +483,12 @@ class BDS60:
             self.mach_number = None
         
         #Barometric Vertical Rate
-        self.barometric_vertical_rate_status = res[34:35]
-        self.barometric_vertical_rate_status = int(self.barometric_vertical_rate_status, 2)
+        self.barometric_vertical_rate_status = raw['barometric_vertical_rate_status']
         #print("barometric_vertical_rate_status |{}|".format(self.barometric_vertical_rate_status))
         if not (self.barometric_vertical_rate_status == 0 or self.barometric_vertical_rate_status == 1):
         #    print("BDS error: barometric_vertical_rate_status |{}|".format(self.barometric_vertical_rate_status))
             return False
-        self.barometric_vertical_rate = res[35:45]
-        self.barometric_vertical_rate = twos_comp(int(self.barometric_vertical_rate, 2), len(self.barometric_vertical_rate))*32
+        self.barometric_vertical_rate = raw['barometric_vertical_rate']
         if self.barometric_vertical_rate_status == 0 and self.barometric_vertical_rate != 0:
         #    print("BDS error: status error\n")
             return False
@@ -491,14 +501,12 @@ class BDS60:
             self.barometric_vertical_rate = None
              
         #Inertial Vertical Rate
-        self.inertial_vertical_rate_status = res[45:46]
-        self.inertial_vertical_rate_status = int(self.inertial_vertical_rate_status, 2) 
+        self.inertial_vertical_rate_status = raw['inertial_vertical_rate_status']
         #print("inertial_vertical_rate_status |{}|".format(self.inertial_vertical_rate_status))
         if not (self.inertial_vertical_rate_status == 0 or self.inertial_vertical_rate_status == 1):
         #    print("BDS error: inertial_vertical_rate_status |{}|".format(self.inertial_vertical_rate_status))
             return False
-        self.inertial_vertical_rate = res[46:]
-        self.inertial_vertical_rate = twos_comp(int(self.inertial_vertical_rate, 2), len(self.inertial_vertical_rate))*32
+        self.inertial_vertical_rate = raw['inertial_vertical_rate']
         if self.inertial_vertical_rate_status == 0 and self.inertial_vertical_rate != 0:
         #    print("BDS error: status error\n")
             return False
@@ -587,12 +595,12 @@ class ModeS:
             self.bds_type.append("BDS60")
             self.exist = True
               
-        print("\nBDS: {}".format(self.bds_type))
+        #print("\nBDS: {}".format(self.bds_type))
         if self.bds50.exist and self.bds60.exist and not self.bds44.exist:
             #self.bds44 = 0
             self.diff_50_60(altitude)
             self.exist = True
-            print("\nBDS (diff): {}".format(self.bds_type))
+            #print("\nBDS (diff): {}".format(self.bds_type))
         
         if not self.bds_type:
             self.bds44 = 0
@@ -637,9 +645,269 @@ class ModeS:
             return "  None\n"
             
         
+######################################################
+# Decoded registers, shared by the Item250 of every category. The same MB
+# field repeats on consecutive scans of a target, so a register is decoded
+# once per (MB field, BDS code) while it stays in the cache.
+
+BDS_CACHE = DecodeCache(maxsize=16384)
+
+
+def decode_modes(mb: int, bds_type: str):
+    """
+    Decode a Mode-S register, through the register cache (BDS_CACHE).
+
+    Parameters
+    ----------
+    mb : int
+        56-bit MB field.
+    bds_type : str
+        BDS code of the register (e.g. "BDS50"); registers other than
+        BDS44/50/60 are not decoded.
+
+    Returns
+    -------
+    bdsdata : ModeS object
+        Decoded register. It is shared by every register with the same MB
+        field and BDS code, so it must not be modified.
+    """
+    key = (mb, bds_type)
+    bdsdata = BDS_CACHE.get(key)
+    if bdsdata is None:
+        bdsdata = ModeS()
+        bdsdata.add_info(format(mb, '014X'), bds_type)
+        BDS_CACHE.put(key, bdsdata)
+    return bdsdata
+
+
+######################################################
+# Batch decoding of MB fields (NumPy). The checks of BDSXX.add_info are
+# applied to whole arrays: (status field or None, ((field, min, max), ...)).
+# A register is valid if every check passes; fields behind a status bit are
+# NaN when the status is 0, as they are None on the objects.
+
+BATCH_CHECKS = {
+    'BDS44': (BDS44, ((None, (('fom', 0, 4),)),
+                      ('wind_status', (('wind_speed', 0, 511),
+                                       ('wind_direction', 0, 360))),
+                      (None, (('temperature', -128, 128),)),
+                      ('pressure_status', (('avg_static_pressure', 0, 2048),)),
+                      ('turbulence_status', (('turbulence', 0, 2048),)),
+                      ('humidity_status', (('humidity', 0, 100),)))),
+    'BDS50': (BDS50, (('roll_angle_status', (('roll_angle', -90, 90),)),
+                      ('true_track_angle_status', (('true_track_angle', -180, 180),)),
+                      ('ground_speed_status', (('ground_speed', 0, 2046),)),
+                      ('track_angle_rate_status', (('track_angle_rate', -16, 16),)),
+                      ('true_airspeed_status', (('true_airspeed', 0, 2046),)))),
+    'BDS60': (BDS60, (('magnetic_heading_status', (('magnetic_heading', -180, 180),)),
+                      ('indicated_airspeed_status', (('indicated_airspeed', 0, 1023),)),
+                      ('mach_number_status', (('mach_number', 0, 4.092),)),
+                      ('barometric_vertical_rate_status',
+                       (('barometric_vertical_rate', -16384, 16384),)),
+                      ('inertial_vertical_rate_status',
+                       (('inertial_vertical_rate', -16384, 16384),)))),
+}
+
+
+def batch_dtype(bds_type: str):
+    """
+    Structured dtype returned by decode_bds_batch for a register: status
+    fields uint8, fields behind a status float64, the rest int64 (float64 if
+    the scale is not an integer) and 'valid' (bool).
+    """
+    bds_class, checks = BATCH_CHECKS[bds_type]
+    gated = {nombre for status, limits in checks if status
+             for nombre, low, high in limits}
+    dtype = []
+    for nombre, shift, mask, sign, kind, fmt, scale in bds_class.FIELDS:
+        if nombre.endswith('_status'):
+            dtype.append((nombre, np.uint8))
+        elif nombre in gated or isinstance(scale, float):
+            dtype.append((nombre, np.float64))
+        else:
+            dtype.append((nombre, np.int64))
+    dtype.append(('valid', np.bool_))
+    return np.dtype(dtype)
+
+
+def decode_bds_batch(mb, bds_type: str):
+    """
+    Decode an array of MB fields as one register type (vectorized
+    BDSXX.add_info).
+
+    Parameters
+    ----------
+    mb : numpy.ndarray
+        56-bit MB fields (uint64).
+    bds_type : str
+        "BDS44", "BDS50" or "BDS60".
+
+    Returns
+    -------
+    registers : numpy.ndarray
+        Structured array (see batch_dtype), one element per MB field. 'valid'
+        is False where BDSXX.add_info would reject the register.
+    """
+    bds_class, checks = BATCH_CHECKS[bds_type]
+    mb = np.asarray(mb, dtype=np.uint64)
+    registers = np.zeros(mb.shape, dtype=batch_dtype(bds_type))
+    for nombre, shift, mask, sign, kind, fmt, scale in bds_class.FIELDS:
+        valor = ((mb >> np.uint64(shift)) & np.uint64(mask)).astype(np.int64)
+        if kind is SIGNED:
+            valor = np.where(valor & sign, valor - (sign << 1), valor)
+        if scale is not None:
+            valor = valor * scale
+        registers[nombre] = valor
+
+    valid = np.ones(mb.shape, dtype=bool)
+    for status, limits in checks:
+        for nombre, low, high in limits:
+            valor = registers[nombre]
+            in_range = (valor >= low) & (valor <= high)
+            if status is None:
+                valid &= in_range
+            else:
+                available = registers[status] == 1
+                # Status 0: the field must be 0 and is not available
+                valid &= np.where(available, in_range, valor == 0)
+                registers[nombre] = np.where(available, valor, np.nan)
+    registers['valid'] = valid
+    return registers
+
+
+def infer_bds_batch(mb, altitude = None):
+    """
+    Infer the register type of MB fields without BDS code (vectorized
+    ModeS.detect_BDS).
+
+    Every MB field is decoded as BDS44, BDS50 and BDS60 (decode_bds_batch)
+    and each valid decoding is a hypothesis. Where only BDS50 and BDS60 are
+    valid, the ambiguity is resolved as diff_50_60 does: BDS50 is discarded
+    if ground speed and true airspeed differ by 100 kt or more, and BDS60 if
+    the CAS derived from its Mach number at the altitude of the aircraft
+    differs by 100 kt or more from its IAS.
+
+    Parameters
+    ----------
+    mb : numpy.ndarray
+        56-bit MB fields (uint64).
+    altitude : numpy.ndarray (optional)
+        Altitude of the aircraft in ft for each MB field (e.g. CAT48 Item090
+        flight level * 100, see bds_registers); NaN or None is taken as 0 ft.
+        Default = None (0 ft)
+
+    Returns
+    -------
+    hypotheses : numpy.ndarray
+        Structured array, one element per MB field: 'bds44', 'bds50' and
+        'bds60' (bool, hypotheses left), 'candidates' (number of them) and
+        'bds_type' ("BDS44", "BDS50" or "BDS60" if only one is left, "None"
+        otherwise).
+    dict
+        Decoded registers by BDS type (structured arrays of decode_bds_batch).
+    """
+    mb = np.asarray(mb, dtype=np.uint64)
+    if altitude is None:
+        altitude = np.zeros(mb.shape)
+    altitude = np.nan_to_num(np.asarray(altitude, dtype=np.float64), nan=0.0)
+    registers = {bds_type: decode_bds_batch(mb, bds_type) for bds_type in BATCH_CHECKS}
+    bds44 = registers['BDS44']['valid']
+    bds50 = registers['BDS50']['valid']
+    bds60 = registers['BDS60']['valid']
+
+    # BDS50 or BDS60: NaN differences (status 0) do not discard
+    ambiguous = bds50 & bds60 & ~bds44
+    bds50_fields = registers['BDS50']
+    speed_diff_50 = np.abs(bds50_fields['ground_speed'] - bds50_fields['true_airspeed'])
+    bds60_fields = registers['BDS60']
+    with np.errstate(invalid='ignore'):
+        cas_calculated = calculate_cas(altitude, bds60_fields['mach_number'],
+                                       calculate_static_p(altitude))
+    speed_diff_60 = np.abs(cas_calculated - bds60_fields['indicated_airspeed'])
+    bds50 = bds50 & ~(ambiguous & (speed_diff_50 >= 100))
+    bds60 = bds60 & ~(ambiguous & (speed_diff_60 >= 100))
+
+    hypotheses = np.zeros(mb.shape, dtype=[('bds44', np.bool_), ('bds50', np.bool_),
+                                           ('bds60', np.bool_), ('candidates', np.uint8),
+                                           ('bds_type', 'U5')])
+    hypotheses['bds44'] = bds44
+    hypotheses['bds50'] = bds50
+    hypotheses['bds60'] = bds60
+    candidates = bds44.astype(np.uint8) + bds50 + bds60
+    hypotheses['candidates'] = candidates
+    bds_type = np.full(mb.shape, "None", dtype='U5')
+    for nombre, hypothesis in (("BDS44", bds44), ("BDS50", bds50), ("BDS60", bds60)):
+        bds_type[hypothesis & (candidates == 1)] = nombre
+    hypotheses['bds_type'] = bds_type
+    return hypotheses, registers
+
+
+def bds_registers(messages_asterix48):
+    """
+    MB fields of all the BDS registers (Item250) of decoded CAT48 messages.
+
+    Returns
+    -------
+    registers : numpy.ndarray
+        Structured array, one element per register: 'mb' (uint64),
+        'bds_type' (BDS code of the register, e.g. "BDS50", "BDS00" if it has
+        none) and 'altitude' (ft, from Item090; NaN if absent).
+    """
+    mb, codes, altitudes = [], [], []
+    for message in messages_asterix48.messages:
+        for block in message.blocks:
+            if not block.item250.exist:
+                continue
+            item090 = block.item090
+            altitude = item090.fl * 100 if item090.exist else np.nan
+            for register in block.item250.blocks:
+                mb.append(int(register.bdsdatahex, 16))
+                codes.append(register.bds_type)
+                altitudes.append(altitude)
+    registers = np.zeros(len(mb), dtype=[('mb', np.uint64), ('bds_type', 'U8'),
+                                         ('altitude', np.float64)])
+    registers['mb'] = mb
+    registers['bds_type'] = codes
+    registers['altitude'] = altitudes
+    return registers
+
+
 ######################################################
 # DUDA: de donde sale "Temp2" de BDS44
 #
+# Lineas decodificadas a la vez por print_in_file
+PRINT_CHUNK_LINES = 65536
+
+
+def write_bds_lines(file2, lineas, bds_type, columnas):
+    """
+    Decode a chunk of BDS txt lines of one register type at once and write
+    the valid ones to file2 (the rest to the error log).
+    """
+    # Todos los registros del bloque decodificados a la vez
+    mb = np.array([int(elementos[1], 16) for linea, elementos in lineas],
+                  dtype=np.uint64)
+    registers = decode_bds_batch(mb, bds_type)
+    valores_columnas = [(registers[nombre].tolist(), entero)
+                        for nombre, entero in columnas]
+
+    for i, valid in enumerate(registers['valid'].tolist()):
+        linea, elementos = lineas[i]
+        if valid:
+            valores = [elementos[3]]
+            for valor, entero in valores_columnas:
+                valor = valor[i]
+                if valor != valor:      # NaN: status 0
+                    valor = None
+                elif entero:
+                    valor = int(valor)
+                valores.append(str(valor))
+            valores.append(elementos[0])
+            file2.write('\t'.join(valores) + "\n")
+        else:
+            logging.error(f'Message BDS not decoded: {linea}')
+
+
 def print_in_file(archivo_entrada, archivo_salida, bds_type):
     
     headers_dict = {
@@ -648,58 +916,36 @@ def print_in_file(archivo_entrada, archivo_salida, bds_type):
         'bds60': "ICAO\tMagneticHeading\tIndicatedAirspeed\tMach\tVerticalRate(Baro)\tVerticalRate(INS)\tTimestamp\n"
     }
     header = headers_dict.get(bds_type.lower(), "Header no encontrado")
-    data_dict = {}
     
     try:
         with open(archivo_entrada, 'r') as file1, open(archivo_salida, 'w') as file2:
            
             file2.write(header)
-            # Leer línea por línea
+            columnas = None
+            if bds_type in BATCH_CHECKS:
+                # Columnas de to_dict() del registro, sin "fom" (enteras si
+                # no tienen escala o es entera)
+                bds_class = BATCH_CHECKS[bds_type][0]
+                escaladas = {entry[0] for entry in bds_class.FIELDS
+                             if isinstance(entry[6], float)}
+                columnas = [(field.name, field.name not in escaladas)
+                            for field in fields(bds_class) if field.name != "fom"]
+            
+            # Lineas del tipo BDS pedido: [Time, BDS, BDS_Type, Address],
+            # decodificadas por bloques de PRINT_CHUNK_LINES
+            lineas = []
             for linea in file1:
-                # Parsear la línea usando espacio como delimitador
-                # [Time, BDS, BDS_Type, Address]
                 elementos = linea.split()
-                
-                # Hacer algo con los elementos, por ejemplo, imprimirlos
-                print("{} | {}".format(elementos[2],bds_type))
-                
-                if elementos[2] == bds_type:
-                    
-                    print("ME SIRVE:\n")
-                    bds_data = ModeS()
-                    bds_data.add_info(elementos[1], bds_type)
-                    #print(bds_type)
-                    
-                    print(f"Data: |{bds_data.exist}|{elementos[1]}\n")
-                    tipo_de_variable = type(bds_data)
-
-                    # Imprimir el tipo de la variable
-                    print("El tipo de la variable es:", tipo_de_variable)
-
-                    #Write BDS elements
-                    #data_dict = asdict(bds_data.bds60)
-                    
-                    if bds_data.exist:
-                        
-                        #Write OACI element
-                        file2.write(elementos[3] +"\t")
-                        data_dict = asdict(getattr(bds_data, bds_type.lower()))
-                        for clave, val in data_dict.items():
-                            if clave == "fom": 
-                                continue
-                            print(val)
-                            #if val == 0:
-                            #    break
-                            file2.write(str(val) + "\t")
-                        data_dict = {}
-                        
-                        #Write Timestamp element
-                        file2.write(elementos[0] + "\n")
-                        #if val == 0:
-                        #    break
-                        #print(data_dict)
-                    else:
+                if len(elementos) > 3 and elementos[2] == bds_type:
+                    if columnas is None:
                         logging.error(f'Message BDS not decoded: {linea}')
+                        continue
+                    lineas.append((linea, elementos))
+                    if len(lineas) == PRINT_CHUNK_LINES:
+                        write_bds_lines(file2, lineas, bds_type, columnas)
+                        lineas = []
+            if lineas:
+                write_bds_lines(file2, lineas, bds_type, columnas)
     except FileNotFoundError:
         print("Uno de los archivos no fue encontrado.")
     except Exception as e:
@@ -726,7 +972,7 @@ def bds_to_file (file, messages_asterix48):
                
                     for item in atributos_a_guardar:
                         if datos_a_guardar[item].exist:
-                            data_dict = asdict(datos_a_guardar[item])
+                            data_dict = to_dict(datos_a_guardar[item])
                             #print(f"DICT: |{data_dict}|\n")
                             for valor in data_dict.values():
                                 
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Columnar output of decoded records.
+
+Every item is flattened to one column per field, named with the path of the
+field in the item (e.g. ``item130.latitude``, ``item040.primary.atp``). The
+values of each record are written straight into NumPy buffers, preallocated
+and doubled when they are full, so the decoded blocks are not kept.
+
+The dtype of a column is fixed by the item classes, not by the values read:
+the kind and scale of the field in the FIELDS table of its class (object for
+flags and octal codes, float64 for fields with a float scale, int64 for the
+rest), or the type declared in the DTYPES of the block for the fields decoded
+outside a table. ICAO addresses are stored as uint32. The fields of an absent
+item or extension (exist False) are missing, not their placeholder 0.
+Repetitive fields (lists of blocks, e.g. item250 BDS registers) have no column.
+
+RowLayout flattens records the same way into rows of Python values (text
+output, e.g. CSV), with repetitive fields as one JSON column.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+
+import numpy as np
+import pandas as pd
+
+from .octets import BITS, OCTAL
+from .serialize import convert
+
+
+######################################################
+
+# Fields with a 24-bit ICAO address (hex text in the items), stored as uint32
+ADDRESS_FIELDS = frozenset(('item080.target_addr', 'item220.aircraft_addr'))
+
+INITIAL_ROWS = 1024
+
+# Type declared in DTYPES -> column dtype
+TYPE_DTYPES = {int: np.int64, float: np.float64, str: object}
+
+
+def leaf_paths(item, path=(), lists=False):
+    """
+    Paths (tuples of attribute names) of the fields of an item, sub-items
+    included, in declaration order. Repetitive fields (lists) are left out,
+    unless lists is True.
+    """
+    paths = []
+    for field in fields(item):
+        value = getattr(item, field.name, None)
+        if is_dataclass(value):
+            paths.extend(leaf_paths(value, path + (field.name,), lists))
+        elif lists or not isinstance(value, list):
+            paths.append(path + (field.name,))
+    return paths
+
+
+def field_dtype(name, owner, dtypes):
+    """
+    dtype of the column of a field: declared in dtypes (DTYPES of the block,
+    by column name), else from the FIELDS table of the class of the field
+    (owner), else object.
+    """
+    if name in ADDRESS_FIELDS:
+        return np.uint32
+    if name in dtypes:
+        return TYPE_DTYPES[dtypes[name]]
+    field = name.rsplit('.', 1)[-1]
+    for entry in getattr(owner, 'FIELDS', ()):
+        if entry[0] == field:
+            kind, scale = entry[4], entry[6]
+            if kind is BITS or kind is OCTAL:
+                return object
+            return np.float64 if isinstance(scale, float) else np.int64
+    return object
+
+
+def address_to_int(value):
+    return int(value, 16) if isinstance(value, str) else value
+
+
+class RecordCursor:
+    """
+    Stand-in for the AsterixMessage of a block, only keeps the position of
+    the next octet to decode.
+    """
+    __slots__ = ('count',)
+
+    def __init__(self, count_octets=0):
+        self.count = count_octets
+
+    def modify_count(self, count_octets):
+        self.count = count_octets
+
+
+######################################################
+
+class Column:
+    """
+    Growable buffer of one field: values plus a mask of the rows that have
+    a value.
+    """
+    __slots__ = ('name', 'data', 'valid', 'dtype')
+
+    def __init__(self, name, capacity, dtype):
+        self.name = name
+        self.valid = np.zeros(capacity, dtype=bool)
+        self.dtype = dtype
+        self.data = self._empty(capacity)
+
+    def _empty(self, capacity):
+        if self.dtype == np.float64:
+            return np.full(capacity, np.nan)
+        if self.dtype == object:
+            return np.full(capacity, None, dtype=object)
+        return np.zeros(capacity, dtype=self.dtype)
+
+    def grow(self, capacity):
+        valid = np.zeros(capacity, dtype=bool)
+        valid[:len(self.valid)] = self.valid
+        self.valid = valid
+        data = self._empty(capacity)
+        data[:len(self.data)] = self.data
+        self.data = data
+
+    def set(self, row, value):
+        if value is None:
+            return
+        if self.dtype is object and value.__class__ is not str:
+            # Flag left with its placeholder 0 (validity bit not set)
+            return
+        self.data[row] = value
+        self.valid[row] = True
+
+    def values(self, rows):
+        """
+        NumPy array of the first rows. Integer columns with missing rows are
+        returned as masked arrays.
+        """
+        data = self.data[:rows]
+        valid = self.valid[:rows]
+        if data.dtype.kind in 'iu' and not valid.all():
+            return np.ma.MaskedArray(data, mask=~valid)
+        return data
+
+    def series_values(self, rows):
+        """
+        Same as values, but integer columns with missing rows are pandas
+        nullable arrays (Int64, UInt32).
+        """
+        data = self.data[:rows]
+        valid = self.valid[:rows]
+        if data.dtype.kind in 'iu' and not valid.all():
+            return pd.arrays.IntegerArray(data, ~valid)
+        return data
+
+
+class ColumnTable:
+    """
+    Column buffers of the selected items of a category, one row per record.
+
+    Parameters
+    ----------
+    block_class : BlockCat21 or BlockCat48
+        Block of the category.
+    items : list (optional)
+        Names of the items to put in columns. Default = None (all)
+    """
+
+    def __init__(self, block_class, items=None):
+        self.rows = 0
+        self.capacity = INITIAL_ROWS
+        self.columns = []
+        # Per item: (name, [(column, path, converter)])
+        self.plan = []
+        dtypes = getattr(block_class, 'DTYPES', {})
+        for nombre, length in block_class.UAP:
+            if items is not None and nombre not in items:
+                continue
+            absent = getattr(block_class, nombre).absent
+            leaves = []
+            for path in leaf_paths(absent):
+                name = '.'.join((nombre,) + path)
+                owner = absent
+                for attr in path[:-1]:
+                    owner = getattr(owner, attr)
+                column = Column(name, self.capacity,
+                                field_dtype(name, type(owner), dtypes))
+                converter = address_to_int if name in ADDRESS_FIELDS else None
+                self.columns.append(column)
+                leaves.append((column, path, converter))
+            if leaves:
+                self.plan.append((nombre, leaves))
+
+    def add_block(self, block):
+        """
+        Write the items of a decoded block as a new row.
+        """
+        row = self.rows
+        if row == self.capacity:
+            self.capacity *= 2
+            for column in self.columns:
+                column.grow(self.capacity)
+        present = block.__dict__
+        for nombre, leaves in self.plan:
+            valor_item = present.get(nombre)
+            if valor_item is None:
+                # Lazy blocks: item decoded now if present
+                offsets = present.get('_offsets')
+                if not offsets or nombre not in offsets:
+                    continue
+                valor_item = block.load_item(nombre)
+            if not valor_item.exist:
+                continue
+            for column, path, converter in leaves:
+                value = valor_item
+                for attr in path:
+                    value = getattr(value, attr, None)
+                    if getattr(value, 'exist', True) is False:
+                        # Extension or sub-field not present
+                        value = None
+                        break
+                if converter is not None:
+                    value = converter(value)
+                column.set(row, value)
+        self.rows += 1
+
+    def to_arrays(self):
+        """
+        Dictionary column name -> NumPy array.
+        """
+        return {column.name: column.values(self.rows) for column in self.columns}
+
+    def to_dataframe(self):
+        """
+        pandas DataFrame with one column per field.
+        """
+        return pd.DataFrame({column.name: column.series_values(self.rows)
+                             for column in self.columns})
+
+
+
+class RowLayout:
+    """
+    Flat rows of the selected items of a category: one value per item field
+    (ColumnTable columns, with the values as decoded, e.g. ICAO addresses as
+    hex text) and one column per repetitive field with its blocks as JSON.
+
+    Parameters
+    ----------
+    block_class : BlockCat21 or BlockCat48
+        Block of the category.
+    items : list (optional)
+        Names of the items to put in columns. Default = None (all)
+    """
+
+    def __init__(self, block_class, items=None):
+        self.header = []
+        # Per item: (name, paths of its fields)
+        self.plan = []
+        for nombre, length in block_class.UAP:
+            if items is not None and nombre not in items:
+                continue
+            absent = getattr(block_class, nombre).absent
+            paths = leaf_paths(absent, lists=True)
+            self.header.extend('.'.join((nombre,) + path) for path in paths)
+            if paths:
+                self.plan.append((nombre, paths))
+
+    def row(self, block):
+        """
+        Values of a decoded block, None for the fields of absent items.
+        """
+        present = block.__dict__
+        offsets = present.get('_offsets')
+        valores = []
+        for nombre, paths in self.plan:
+            valor_item = present.get(nombre)
+            if valor_item is None:
+                # Lazy blocks: item decoded now if present
+                if not offsets or nombre not in offsets:
+                    valores.extend([None] * len(paths))
+                    continue
+                valor_item = block.load_item(nombre)
+            for path in paths:
+                value = valor_item
+                for attr in path:
+                    value = getattr(value, attr, None)
+                if value.__class__ is list:
+                    value = json.dumps(convert(value), separators=(',', ':'))
+                valores.append(value)
+        return valores
+
+
+######################################################
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent record index of ASTERIX recordings.
+
+The index of a recording (binary .ast or hexadecimal messages, one per line)
+is a sidecar NumPy file next to it (<recording>.idx.npz) with, per record,
+where it is in the file and the items needed to select it: category,
+SAC/SIC (item010), time of day and target address. Only these items are
+decoded to build it (item projection); queries then decode only the records
+that match.
+
+The index keeps the size and modification time of the recording and is
+rebuilt when they change.
+"""
+
+import logging
+import mmap
+import os
+
+import numpy as np
+
+from . import classcategory21
+from . import classcategory48
+from .columns import RecordCursor
+from .scanner import BLOCK_CLASSES, iter_data_blocks
+
+
+######################################################
+
+MESSAGE_CLASSES = {21: classcategory21.AsterixMessage,
+                   48: classcategory48.AsterixMessage}
+
+# Time of day: first item present of the list (CAT21 position time, then
+# time of reception of the position)
+TIME_FIELDS = {21: (('item071', 'time_app_pos'), ('item073', 'time_rec_pos')),
+               48: (('item140', 'time_of_day'),)}
+
+ADDRESS_FIELDS = {21: ('item080', 'target_addr'),
+                  48: ('item220', 'aircraft_addr')}
+
+INDEX_ITEMS = {cat: ['item010', ADDRESS_FIELDS[cat][0]] +
+               [nombre for nombre, field in TIME_FIELDS[cat]]
+               for cat in TIME_FIELDS}
+
+FIELDS = ('block', 'position', 'length', 'cat', 'sac', 'sic', 'time', 'icao')
+
+
+def index_path(filename):
+    return f'{filename}.idx.npz'
+
+
+def source_stamp(filename):
+    stat = os.stat(filename)
+    return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+
+def to_icao(value):
+    """
+    24-bit address as int, from an int or a hex string (e.g. '3C6586').
+    """
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+class RecordIndex:
+    """
+    Index of the records of a recording (see open_indexed).
+
+    Attributes
+    ----------
+    filename : str
+        Recording.
+    binary : bool
+        True for binary .ast files, False for hexadecimal files.
+    block, position, length : numpy.ndarray
+        Offset of the data block in the file (of its line on hex files),
+        octet of the record in the data block and octets of the record.
+    cat, sac, sic : numpy.ndarray
+        Category and SAC/SIC (-1 if item010 is absent).
+    time : numpy.ndarray
+        Time of day in seconds (NaN if absent).
+    icao : numpy.ndarray
+        Target address (-1 if absent).
+    """
+
+    def __init__(self, filename, binary, arrays):
+        self.filename = filename
+        self.binary = binary
+        for field in FIELDS:
+            setattr(self, field, arrays[field])
+
+    def __len__(self):
+        return len(self.cat)
+
+    ##########################################
+
+    @classmethod
+    def build(cls, filename, binary, categories=(21, 48)):
+        """
+        Index the records of a recording, decoding only the items of the
+        index. Data blocks that cannot be decoded are written to the log and
+        their remaining records are left out, and lines of hexadecimal files
+        that cannot be read are skipped (see iter_data_blocks).
+        """
+        values = {field: [] for field in FIELDS}
+        cursor = RecordCursor()
+        for info, start, block_offset in iter_data_blocks(filename, binary):
+            cat = info[start]
+            if cat not in categories or cat not in BLOCK_CLASSES:
+                continue
+            block_class = BLOCK_CLASSES[cat]
+            items = INDEX_ITEMS[cat]
+            end = start + int.from_bytes(info[start+1:start+3], 'big')
+            count_octets = start + 3
+            try:
+                # A zero FSPEC octet is filler after the last record
+                while count_octets < end and info[count_octets]:
+                    block = block_class(items = items)
+                    first = count_octets
+                    count_octets = block.add_block(info, count_octets, cursor)
+                    if count_octets > end:
+                        raise ValueError("Record beyond LEN")
+
+                    present = block.__dict__
+                    values['block'].append(block_offset)
+                    values['position'].append(first - start)
+                    values['length'].append(count_octets - first)
+                    values['cat'].append(cat)
+                    item010 = present.get('item010')
+                    values['sac'].append(item010.sac if item010 else -1)
+                    values['sic'].append(item010.sic if item010 else -1)
+                    time = np.nan
+                    for nombre, field in TIME_FIELDS[cat]:
+                        if nombre in present:
+                            time = getattr(present[nombre], field)
+                            break
+                    values['time'].append(time)
+                    nombre, field = ADDRESS_FIELDS[cat]
+                    values['icao'].append(to_icao(getattr(present[nombre], field))
+                                          if nombre in present else -1)
+            except (IndexError, ValueError) as e:
+                logging.error(f'Data block not indexed at octet {block_offset}: {e}\n')
+
+        arrays = {'block':    np.array(values['block'], dtype=np.int64),
+                  'position': np.array(values['position'], dtype=np.uint16),
+                  'length':   np.array(values['length'], dtype=np.uint16),
+                  'cat':      np.array(values['cat'], dtype=np.uint8),
+                  'sac':      np.array(values['sac'], dtype=np.int16),
+                  'sic':      np.array(values['sic'], dtype=np.int16),
+                  'time':     np.array(values['time'], dtype=np.float64),
+                  'icao':     np.array(values['icao'], dtype=np.int64)}
+        return cls(filename, binary, arrays)
+
+    def save(self):
+        """
+        Write the index next to the recording (<recording>.idx.npz).
+        """
+        np.savez(index_path(self.filename), binary=self.binary,
+                 stamp=source_stamp(self.filename),
+                 **{field: getattr(self, field) for field in FIELDS})
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Read the index of a recording. Returns None if there is no index or
+        the recording changed after it was built.
+        """
+        path = index_path(filename)
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            if not np.array_equal(data['stamp'], source_stamp(filename)):
+                return None
+            arrays = {field: data[field] for field in FIELDS}
+            binary = bool(data['binary'])
+        return cls(filename, binary, arrays)
+
+    ##########################################
+
+    def select(self, time_range=None, icao=None, cat=None, sac_sic=None):
+        """
+        Numbers of the records that match all the conditions given.
+
+        Parameters
+        ----------
+        time_range : tuple (optional)
+            (start, end) time of day in seconds, both included.
+        icao : int, str or list (optional)
+            Target address(es), as int or hex string (e.g. '3C6586').
+        cat : int (optional)
+            Category.
+        sac_sic : tuple (optional)
+            (SAC, SIC) of the data source.
+
+        Returns
+        -------
+        records : numpy.ndarray
+            Record numbers, in file order.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if time_range is not None:
+            start, end = time_range
+            mask &= (self.time >= start) & (self.time <= end)
+        if icao is not None:
+            if isinstance(icao, (str, int)):
+                icao = [icao]
+            mask &= np.isin(self.icao, [to_icao(address) for address in icao])
+        if cat is not None:
+            mask &= self.cat == cat
+        if sac_sic is not None:
+            mask &= (self.sac == sac_sic[0]) & (self.sic == sac_sic[1])
+        return np.flatnonzero(mask)
+
+    def decode(self, records, lazy=False, items=None):
+        """
+        Decode records by number, reading only their data blocks.
+
+        Yields
+        ------
+        message_asterix : AsterixMessage object
+            One message per record, with a single block.
+        """
+        with open(self.filename, 'rb') as file1:
+            data = None
+            if self.binary and os.fstat(file1.fileno()).st_size > 0:
+                data = mmap.mmap(file1.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                last_offset = None
+                info = None
+                for record in records:
+                    block_offset = int(self.block[record])
+                    if block_offset != last_offset:
+                        if data is not None:
+                            length = int.from_bytes(data[block_offset+1:block_offset+3], 'big')
+                            info = data[block_offset:block_offset+length]
+                        else:
+                            file1.seek(block_offset)
+                            info = bytes.fromhex(file1.readline().strip().decode())
+                        last_offset = block_offset
+                    cat = int(self.cat[record])
+                    position = int(self.position[record])
+                    # LEN set to the end of the record: only this one is decoded
+                    message_asterix = MESSAGE_CLASSES[cat](
+                        cat, position + int(self.length[record]), info, position,
+                        lazy, items)
+                    try:
+                        message_asterix.add_blocks()
+                    except (ValueError, TypeError) as e:
+                        logging.error(f'Record {record} decoded with error\n')
+                        logging.error(f'Error: {e}\n')
+                    else:
+                        yield message_asterix
+            finally:
+                if data is not None:
+                    data.close()
+
+    def query(self, time_range=None, icao=None, cat=None, sac_sic=None,
+              lazy=False, items=None):
+        """
+        Decode the records that match the conditions (see select).
+
+        Returns
+        -------
+        messages : list
+            AsterixMessage objects, one per record, in file order.
+        """
+        records = self.select(time_range, icao, cat, sac_sic)
+        return list(self.decode(records, lazy, items))
+
+
+######################################################
@@ -8,12 +8,17 @@ Created on Mon Feb 19 20:27:47 2024
 
 
 import math
+import os
+import tempfile
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from fastmeteo import Grid
 from tqdm import tqdm
 import warnings
 
+from .classmodes import decode_bds_batch
+
 
 
 # Constants of the standard atmospheric model
@@ -200,6 +205,156 @@ def time_format(time):
 
 
 
+##############################################################################
+# BDS meteo data of a whole dataframe (merge_data output) at once: same
+# formulas as the functions above, as NumPy column operations
+
+def calculate_bds_meteo(df):
+    """
+    Temperature and wind (u, v) derived from BDS50/BDS60 data of every row.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Merged CAT21 + BDS50 + BDS60 data (see merge_data).
+
+    Returns
+    -------
+    df_meteo : pandas.DataFrame
+        Columns 'timestamp' (ERA5 format, see time_format), 'latitude', 
+        'longitude', 'altitude' (ft), 'temperature_BDS' (K), 'wind_u_BDS' and
+        'wind_v_BDS' (m/s), one row per row of df.
+    """
+    mach = df['Mach'].to_numpy(dtype=np.float64)
+    v_tas = df['TrueAirspeed'].to_numpy(dtype=np.float64)
+    heading = df['MagneticHeading'].to_numpy(dtype=np.float64)
+    v_gs = df['GroundSpeed'].to_numpy(dtype=np.float64)
+    track_angle = df['TrackAngle'].to_numpy(dtype=np.float64)
+    altitude_ft = df['geom_height'].to_numpy(dtype=np.float64)
+    v_ias = df['IndicatedAirspeed'].to_numpy(dtype=np.float64)
+    
+    # Both branches are computed, the one of each row is kept (mach < 0.3)
+    low_speed = mach < 0.3
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # calculate_temperature
+        v_tas_m = v_tas * 0.514444
+        v_ias_m = v_ias * 0.514444
+        pressure = calculate_static_p(altitude_ft)
+        temperature = np.where(low_speed,
+                               (v_tas_m**2 * pressure) / (v_ias_m**2 * ρ0 *  R),
+                               (v_tas_m**2 * T0) / (mach**2 * a0**2))
+        
+        # calculate_v_tas
+        ρ = calculate_ρ(pressure, temperature)
+        v_tas_model = np.where(low_speed,
+                               v_ias_m * np.sqrt(ρ0 / ρ),
+                               mach * a0 * np.sqrt(temperature / T0)) / 0.514444
+    
+    # calculate_wind_vector
+    track_angle_rad = np.radians(track_angle)
+    heading_rad = np.radians(heading)
+    wind_x = (v_gs * np.cos(track_angle_rad)) - (v_tas_model * np.cos(heading_rad))
+    wind_y = (v_gs * np.sin(track_angle_rad)) - (v_tas_model * np.sin(heading_rad))
+    wind_direction = np.degrees(np.arctan2(wind_y, wind_x))
+    wind_speed = np.sqrt(wind_x**2 + wind_y**2)
+    
+    # polar_to_cartesian, converted to m/s (ERA5 format)
+    wind_direction_rad = np.radians(wind_direction)
+    wind_speed_u = wind_speed * np.sin(wind_direction_rad) * 0.5144444444
+    wind_speed_v = wind_speed * np.cos(wind_direction_rad) * 0.5144444444
+    
+    # time_format: whole seconds of the time of day (timedelta rounds to us)
+    time_us = np.round(df['time_rec_pos'].to_numpy(dtype=np.float64) * 1e6)
+    seconds = (time_us // 1000000).astype(np.int64) % 86400
+    timestamp = (np.char.mod("2019-12-20T%02d:", seconds // 3600) +
+                 np.char.mod("%02d:", seconds // 60 % 60) +
+                 np.char.mod("%02d\n", seconds % 60))
+    
+    return pd.DataFrame({"timestamp": timestamp,
+                         "latitude": df['latitude'].to_numpy(),
+                         "longitude": df['longitude'].to_numpy(),
+                         "altitude": altitude_ft,
+                         "temperature_BDS": temperature,
+                         "wind_u_BDS": wind_speed_u,
+                         "wind_v_BDS": wind_speed_v})
+
+
+
+##############################################################################
+# Data of the meteo workflow taken from decoded messages (in memory), with
+# the columns of the text files of dump_items_txt and dump_bds_cat_txt
+
+CAT21_ITEMS = ["item073", "item080", "item131", "item140"]
+CAT48_ITEMS = ["item140", "item220", "item250"]
+
+BDS_COLUMNS = {
+    'BDS50': (('roll_angle', 'RollAngle'), ('true_track_angle', 'TrackAngle'),
+              ('track_angle_rate', 'TrackRate'), ('ground_speed', 'GroundSpeed'),
+              ('true_airspeed', 'TrueAirspeed')),
+    'BDS60': (('magnetic_heading', 'MagneticHeading'), 
+              ('indicated_airspeed', 'IndicatedAirspeed'), ('mach_number', 'Mach'),
+              ('barometric_vertical_rate', 'VerticalRate(Baro)'),
+              ('inertial_vertical_rate', 'VerticalRate(INS)')),
+}
+
+
+def cat21_frame(messages_asterix21):
+    """
+    CAT21 items needed by merge_frames (time_rec_pos, target_addr, 
+    geom_height, latitude, longitude) of every record; NaN/None if absent.
+    """
+    columnas = {'time_rec_pos': [], 'target_addr': [], 'geom_height': [],
+                'latitude': [], 'longitude': []}
+    for message in messages_asterix21.messages:
+        for block in message.blocks:
+            item073, item080 = block.item073, block.item080
+            item131, item140 = block.item131, block.item140
+            columnas['time_rec_pos'].append(item073.time_rec_pos if item073.exist else np.nan)
+            columnas['target_addr'].append(item080.target_addr if item080.exist else None)
+            columnas['geom_height'].append(item140.geom_height if item140.exist else np.nan)
+            columnas['latitude'].append(item131.latitude if item131.exist else np.nan)
+            columnas['longitude'].append(item131.longitude if item131.exist else np.nan)
+    return pd.DataFrame(columnas)
+
+
+def bds_frames(messages_asterix48):
+    """
+    BDS50 and BDS60 registers (Item250) of decoded CAT48 messages, decoded
+    in batch (see classmodes.decode_bds_batch). Only valid registers, NaN
+    where the status bit is 0.
+
+    Returns
+    -------
+    df_bds50, df_bds60 : pandas.DataFrame
+        Columns ICAO, the register fields and Timestamp (time of day, s).
+    """
+    registros = {'BDS50': ([], [], []), 'BDS60': ([], [], [])}
+    for message in messages_asterix48.messages:
+        for block in message.blocks:
+            if not block.item250.exist:
+                continue
+            time = block.item140.time_of_day if block.item140.exist else np.nan
+            icao = block.item220.aircraft_addr if block.item220.exist else None
+            for register in block.item250.blocks:
+                if register.bds_type in registros:
+                    mb, icaos, times = registros[register.bds_type]
+                    mb.append(int(register.bdsdatahex, 16))
+                    icaos.append(icao)
+                    times.append(time)
+    
+    frames = []
+    for bds_type, (mb, icaos, times) in registros.items():
+        registers = decode_bds_batch(np.array(mb, dtype=np.uint64), bds_type)
+        valid = registers['valid']
+        columnas = {'ICAO': np.array(icaos, dtype=object)[valid]}
+        for nombre, columna in BDS_COLUMNS[bds_type]:
+            columnas[columna] = registers[nombre][valid]
+        columnas['Timestamp'] = np.array(times, dtype=np.float64)[valid]
+        frames.append(pd.DataFrame(columnas))
+    return frames[0], frames[1]
+
+
+
 ##############################################################################
 
 ###############################################
@@ -209,13 +364,26 @@ def time_format(time):
 
 def merge_data(fileCAT21: str, fileBDS50: str, fileBDS60: str, output_file: str, max_dev: float):
     
-    column1 = 'time_rec_pos'
-    column2 = 'Timestamp'
-    column3 = 'Timestamp'
-    
     df1 = pd.read_csv(fileCAT21, delimiter='\t', engine='python')
     df2 = pd.read_csv(fileBDS50, delimiter='\t', engine='python')
+    df3 = pd.read_csv(fileBDS60, delimiter='\t', engine='python')
+    
+    df_filtered_2 = merge_frames(df1, df2, df3, max_dev)
+    
+    # Save merge
+    df_filtered_2.to_csv(output_file, sep='\t', index=False)
+
+
+def merge_frames(df1, df2, df3, max_dev: float):
+    """
+    Merge CAT21 items (df1) with BDS50 (df2) and BDS60 (df3) data (see 
+    merge_data), on the ICAO address and the nearest previous time within 
+    max_dev seconds.
+    """
     
+    column1 = 'time_rec_pos'
+    column2 = 'Timestamp'
+    column3 = 'Timestamp'
     
     # Drop all rows with Nan merge column
     df1 = df1.dropna(subset=[column1])
@@ -228,8 +396,8 @@ def merge_data(fileCAT21: str, fileBDS50: str, fileBDS60: str, output_file: str,
     df1 = df1.rename(columns={'target_addr': 'ICAO'})
     #df2 = df2.rename(columns={'ICAO': 'nombre'})
     
-    df1 = df1.sort_values('time_column')
-    df2 = df2.sort_values('time_column')
+    df1 = df1.sort_values('time_column', kind='stable')
+    df2 = df2.sort_values('time_column', kind='stable')
     
     df_merge = pd.merge_asof(df1, df2, on='time_column', by='ICAO', tolerance=pd.Timedelta(seconds=max_dev))
     
@@ -238,15 +406,13 @@ def merge_data(fileCAT21: str, fileBDS50: str, fileBDS60: str, output_file: str,
     
     
     
-    df3 = pd.read_csv(fileBDS60, delimiter='\t', engine='python')
-    
     # Drop all rows with Nan merge column
     df3 = df3.dropna(subset=[column3])
     # Supongamos que tus dataframes son df1 y df2
     df3['time_column'] = pd.to_datetime(df3['Timestamp'], unit='s')
     
     #df3 = df3.rename(columns={'ICAO': 'nombre'})
-    df3 = df3.sort_values('time_column')
+    df3 = df3.sort_values('time_column', kind='stable')
     
     df_merge_2 = pd.merge_asof(df_filtered, df3, on='time_column', by='ICAO', tolerance=pd.Timedelta(seconds=max_dev))
     
@@ -265,10 +431,198 @@ def merge_data(fileCAT21: str, fileBDS50: str, fileBDS60: str, output_file: str,
         df_filtered_2 = df_filtered_2.dropna(subset=[column])
     
     # Drop "time_column" column
-    df_filtered_2.drop(columns=['time_column'], inplace=True)
+    df_filtered_2 = df_filtered_2.drop(columns=['time_column'])
     
-    # Save merge
-    df_filtered_2.to_csv(output_file, sep='\t', index=False)
+    return df_filtered_2
+
+
+
+#####
+# Out-of-core version of merge_data: same output, bounded memory. Files are
+# read by chunks and split by time in buckets (temporary files); every bucket
+# of CAT21 data is merged with the BDS buckets that cover its time span plus
+# the max. deviation before it (merge_asof only looks backwards).
+
+def csv_dtypes(filename, chunksize):
+    """
+    dtypes of the columns of a TSV file read whole (first pass by chunks):
+    int64/float64/bool if every chunk agrees (int and float -> float64),
+    otherwise str.
+    """
+    dtypes = {}
+    for chunk in pd.read_csv(filename, delimiter='\t', chunksize=chunksize,
+                             engine='python'):
+        for column, dtype in chunk.dtypes.items():
+            kind = dtype.kind if dtype.kind in 'ifb' else 'O'
+            previous = dtypes.get(column, kind)
+            if previous != kind:
+                kind = 'f' if {previous, kind} == {'i', 'f'} else 'O'
+            dtypes[column] = kind
+    return {column: {'i': np.int64, 'f': np.float64, 'b': bool}.get(kind, str)
+            for column, kind in dtypes.items()}
+
+
+def split_buckets(filename, time_column, folder, name, bucket_seconds, chunksize,
+                  rename=None):
+    """
+    Split a TSV file in time buckets (pickled DataFrame pieces on folder).
+    Rows without time are dropped, as in merge_data.
+
+    Returns
+    -------
+    buckets : dict
+        Bucket number -> list of pieces (file names), in file order.
+    template : pandas.DataFrame
+        Columns of the rows, without rows.
+    """
+    dtypes = csv_dtypes(filename, chunksize)
+    buckets = {}
+    template = None
+    reader = pd.read_csv(filename, delimiter='\t', chunksize=chunksize,
+                         engine='python',
+                         dtype={column: str for column, dtype in dtypes.items()
+                                if dtype is str})
+    for num_chunk, chunk in enumerate(reader):
+        # Same dtypes on every chunk (e.g. int columns with NaN on others)
+        for column, dtype in dtypes.items():
+            if dtype is not str and chunk[column].dtype != dtype:
+                chunk[column] = chunk[column].astype(dtype)
+        chunk = chunk.dropna(subset=[time_column])
+        chunk['time_column'] = pd.to_datetime(chunk[time_column], unit='s')
+        if rename:
+            chunk = chunk.rename(columns=rename)
+        if template is None:
+            template = chunk.iloc[0:0]
+        numbers = np.floor(chunk[time_column].to_numpy(dtype=np.float64) / bucket_seconds)
+        for number, piece in chunk.groupby(numbers.astype(np.int64), sort=False):
+            piece_file = os.path.join(folder, f'{name}_{number}_{num_chunk}.pkl')
+            piece.to_pickle(piece_file)
+            buckets.setdefault(number, []).append(piece_file)
+    if template is None:
+        template = pd.read_csv(filename, delimiter='\t', engine='python', nrows=0)
+        template['time_column'] = pd.to_datetime(template[time_column], unit='s')
+        if rename:
+            template = template.rename(columns=rename)
+    return buckets, template
+
+
+def load_buckets(buckets, numbers, template):
+    """
+    Rows of the buckets given, sorted by time (stable: file order on ties).
+    """
+    pieces = [pd.read_pickle(piece_file) for number in numbers
+              for piece_file in buckets.get(number, [])]
+    if not pieces:
+        return template
+    return pd.concat(pieces).sort_values('time_column', kind='stable')
+
+
+def merge_right_columns(left, right):
+    """
+    Names of the columns of right on merge_asof(left, right) (suffix _y if
+    left has them too).
+    """
+    return [f'{column}_y' if column in left.columns else column
+            for column in right.columns if column not in ('time_column', 'ICAO')]
+
+
+def as_unmatched(df, columns):
+    """
+    dtypes of the columns of the right file after a merge_asof with unmatched
+    rows: int -> float64, bool -> object.
+    """
+    for column in columns:
+        if df[column].dtype.kind == 'i':
+            df[column] = df[column].astype(np.float64)
+        elif df[column].dtype.kind == 'b':
+            df[column] = df[column].astype(object)
+    return df
+
+
+def merge_buckets(left_buckets, left_template, right_buckets, right_template,
+                  folder, name, bucket_seconds, max_dev, subset):
+    """
+    merge_asof of every left bucket with the right rows of its time span and
+    the max. deviation before it. Keeps the rows with subset not NaN.
+
+    Returns
+    -------
+    merged : dict
+        Bucket number -> pieces of merged rows (one).
+    template : pandas.DataFrame
+        Columns of the merged rows, without rows.
+    unmatched : bool
+        True if some left row had no right row (merge_data would then have
+        turned int columns of the right file into float).
+    """
+    tolerance = pd.Timedelta(seconds=max_dev)
+    template = pd.merge_asof(left_template, right_template, on='time_column',
+                             by='ICAO', tolerance=tolerance)
+    merged, unmatched = {}, False
+    for number in sorted(left_buckets):
+        left = load_buckets(left_buckets, [number], left_template)
+        first = math.floor((number * bucket_seconds - max_dev) / bucket_seconds)
+        right = load_buckets(right_buckets, range(first, number + 1), right_template)
+        df_merge = pd.merge_asof(left, right, on='time_column', by='ICAO',
+                                 tolerance=tolerance)
+        unmatched |= bool(df_merge[subset].isna().any())
+        df_merge = df_merge.dropna(subset=[subset])
+        if len(df_merge):
+            piece_file = os.path.join(folder, f'{name}_{number}.pkl')
+            df_merge.to_pickle(piece_file)
+            merged[number] = [piece_file]
+    return merged, template, unmatched
+
+
+def merge_data_chunked(fileCAT21: str, fileBDS50: str, fileBDS60: str, output_file: str,
+                       max_dev: float, chunksize: int = 200000, bucket_seconds: float = 900):
+    
+    with tempfile.TemporaryDirectory() as folder:
+        buckets_21, template_21 = split_buckets(fileCAT21, 'time_rec_pos', folder, 'cat21',
+                                                bucket_seconds, chunksize,
+                                                rename={'target_addr': 'ICAO'})
+        buckets_50, template_50 = split_buckets(fileBDS50, 'Timestamp', folder, 'bds50',
+                                                bucket_seconds, chunksize)
+        buckets_60, template_60 = split_buckets(fileBDS60, 'Timestamp', folder, 'bds60',
+                                                bucket_seconds, chunksize)
+        
+        merged_50, template_merge, unmatched = merge_buckets(
+            buckets_21, template_21, buckets_50, template_50, folder, 'merge50',
+            bucket_seconds, max_dev, 'Timestamp')
+        if unmatched:
+            columns = merge_right_columns(template_21, template_50)
+            for pieces in merged_50.values():
+                as_unmatched(pd.read_pickle(pieces[0]), columns).to_pickle(pieces[0])
+            template_merge = as_unmatched(template_merge, columns)
+        
+        merged_60, template_merge_2, unmatched = merge_buckets(
+            merged_50, template_merge, buckets_60, template_60, folder, 'merge60',
+            bucket_seconds, max_dev, 'Timestamp_y')
+        columns = merge_right_columns(template_merge, template_60) if unmatched else []
+        
+        column_list = ['geom_height', 'GroundSpeed', 'TrueAirspeed', 'IndicatedAirspeed', 
+                       'Mach', 'TrackAngle', 'GroundSpeed', 'MagneticHeading']
+        header = True
+        for number in sorted(merged_60) or [None]:
+            if number is None:
+                # No rows: header only
+                df_filtered_2 = template_merge_2
+            else:
+                df_filtered_2 = as_unmatched(pd.read_pickle(merged_60[number][0]), columns)
+            
+            # Only rows with "Roll Angle < 5" (data noise increase a lot with values > 5)
+            df_filtered_2 = df_filtered_2[abs(df_filtered_2['RollAngle']) <= 5]
+            
+            # Drop all rows in which needed info is Nan
+            df_filtered_2 = df_filtered_2.dropna(subset=column_list)
+            
+            # Drop "time_column" column
+            df_filtered_2 = df_filtered_2.drop(columns=['time_column'])
+            
+            # Save merge (by buckets, in time order)
+            df_filtered_2.to_csv(output_file, sep='\t', index=False,
+                                 mode='w' if header else 'a', header=header)
+            header = False
 
 
 
@@ -353,6 +707,20 @@ def calculate_meteo(input_file: str, output_file: str, local_meteo_grid: str):
     
     df = pd.read_csv(input_file, delimiter='\t')
     
+    df_meteo = meteo_frame(df, local_meteo_grid)
+    
+    # Save dataframe on txt
+    df_meteo.to_csv(output_file, sep='\t', index=False)
+    
+    print("Data calculated successfully!")
+
+
+def meteo_frame(df, local_meteo_grid: str):
+    """
+    BDS and ERA5 meteorological data of merged CAT21 + BDS50 + BDS60 data
+    (see calculate_meteo), as a DataFrame.
+    """
+    
     #print(df.head())
     # Ignore "DeprecationWarning: parsing timezone aware datetimes is deprecated" warning
     # It comes from mmg.interpolate(flight_1) call (fastmeteo package)
@@ -361,88 +729,21 @@ def calculate_meteo(input_file: str, output_file: str, local_meteo_grid: str):
     # Define the location for local store
     mmg = Grid(local_store=local_meteo_grid)
     
-    info_pre = ['timestamp', 'latitude', 'longitude', 'altitude', 
-                'temperature_BDS', 'wind_u_BDS', 'wind_v_BDS']
-    
-    info = ['Timestamp', 'Latitude', 'Longitude', 'Altitude', 
-            'Temperature_BDS', 'Wind_u_BDS', 'Wind_v_BDS', 
-            'Temperature_ERA5', 'Wind_u_ERA5', 'Wind_v_ERA5']
-    
-    lst = []
-    num_rows = len(df)
-    #for msg in range(num_rows):
     print("Calculating BDS meteorological data...")
-    for msg in tqdm(range(num_rows), desc="Progress", 
-                    unit=" messages"):
-    
-        #print(df.iloc[msg])
-        mach = df.loc[msg, 'Mach']
-        v_tas = df.loc[msg, 'TrueAirspeed']
-        heading = df.loc[msg, 'MagneticHeading']
-        v_gs = df.loc[msg, 'GroundSpeed']
-        track_angle = df.loc[msg, 'TrackAngle']
-        altitude_ft = df.loc[msg, 'geom_height']
-        v_ias = df.loc[msg, 'IndicatedAirspeed']
-        
-        temperature = calculate_temperature(mach, v_tas, altitude_ft, v_ias)
-        
-        v_tas_model = calculate_v_tas(mach, altitude_ft, v_ias, temperature)
-        wind_speed, wind_direction = calculate_wind_vector(v_tas_model, heading, v_gs, track_angle)
-        
-        # Meteorological Vw is opposite of aeronautical Vw (we shift the direction of the wind vector by 180 ° to obtain the wind direction)
-        #if wind_direction <= 180:
-        #    wind_direction += 180
-        #else:
-        #    wind_direction -= 180
-        
-        wind_speed_u, wind_speed_v = polar_to_cartesian(wind_speed, wind_direction) #knots
-        
-        # Convert to m/s (ERA5 format)
-        wind_speed_u, wind_speed_v = wind_speed_u * 0.5144444444, wind_speed_v * 0.5144444444 
-        
-        #print(f"\nBDS:   Temperature = {temperature} | Wind_speed_u = {wind_speed_u} | Wind_speed_v = {wind_speed_v}")
-        
-        time_era5 = time_format(df.loc[msg, 'time_rec_pos'])
-        latitude = df.loc[msg, 'latitude']
-        longitude = df.loc[msg, 'longitude']
-        
-        new_data = {
-            "timestamp": time_era5,
-            "latitude": latitude,
-            "longitude": longitude,
-            "altitude": altitude_ft,
-            "temperature_BDS": temperature,
-            "wind_u_BDS" : wind_speed_u,
-            "wind_v_BDS" : wind_speed_v
-        }
-        lst.append(new_data)
-   
-    df_meteo = pd.DataFrame(lst, columns=info_pre)
+    df_meteo = calculate_bds_meteo(df)
     
     
     print("Getting ERA5 meteorological data...")
     flight_new_1 = mmg.interpolate(df_meteo)
     
-    lst_2 = []
-    num_rows = len(flight_new_1)
-    for msg in tqdm(range(num_rows), desc="Progress", 
-                    unit=" messages"):
-        
-        new_data = {
-            'Timestamp': flight_new_1.loc[msg, 'timestamp'],
-            'Latitude': flight_new_1.loc[msg, 'latitude'],
-            'Longitude': flight_new_1.loc[msg, 'longitude'],
-            'Altitude': flight_new_1.loc[msg, 'altitude'],
-            'Temperature_BDS': flight_new_1.loc[msg, 'temperature_BDS'],
-            'Wind_u_BDS': flight_new_1.loc[msg, 'wind_u_BDS'],
-            'Wind_v_BDS': flight_new_1.loc[msg, 'wind_v_BDS'],
-            'Temperature_ERA5': flight_new_1.loc[msg, 'temperature'],
-            'Wind_u_ERA5': flight_new_1.loc[msg, 'u_component_of_wind'],
-            'Wind_v_ERA5': flight_new_1.loc[msg, 'v_component_of_wind']
-        }
-        lst_2.append(new_data)
-    
-    df_meteo = pd.DataFrame(lst_2, columns=info)
+    df_meteo = flight_new_1[['timestamp', 'latitude', 'longitude', 'altitude',
+                             'temperature_BDS', 'wind_u_BDS', 'wind_v_BDS', 
+                             'temperature', 'u_component_of_wind', 
+                             'v_component_of_wind']]
+    df_meteo.columns = ['Timestamp', 'Latitude', 'Longitude', 'Altitude', 
+                        'Temperature_BDS', 'Wind_u_BDS', 'Wind_v_BDS', 
+                        'Temperature_ERA5', 'Wind_u_ERA5', 'Wind_v_ERA5']
+    df_meteo = df_meteo.reset_index(drop=True)
     
     # Convert 'Timestamp' column to datetime format
     df_meteo['Timestamp'] = pd.to_datetime(df_meteo['Timestamp'])
@@ -450,10 +751,7 @@ def calculate_meteo(input_file: str, output_file: str, local_meteo_grid: str):
     # Drop nan rows
     df_meteo = df_meteo.dropna()
     
-    # Save dataframe on txt
-    df_meteo.to_csv(output_file, sep='\t', index=False)
-    
-    print("Data calculated successfully!")
+    return df_meteo
     
     
     
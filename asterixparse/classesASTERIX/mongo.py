@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MongoDB output of decoded records.
+
+One document per record (block), item name -> item fields (None if the item
+is absent), as dump_to_mongodb always wrote them. Documents are sent by
+batches with unordered insert_many, so a failed document does not stop the
+rest of its batch. Only transient errors are retried: connection errors
+(AutoReconnect) and write errors with a retryable code (primary stepping
+down, shutdown, network timeout...). Other write errors (e.g. document
+validation) are permanent: the documents are counted as failed and logged
+without sending them again.
+
+pymongo assigns the _id of every document before sending it, so a document
+sent again after being inserted (e.g. the connection was lost after the
+write) fails as a duplicate key and is not inserted twice.
+"""
+
+import logging
+import time
+
+from pymongo import MongoClient
+from pymongo.errors import AutoReconnect, BulkWriteError, OperationFailure
+
+from .serialize import to_dict
+
+
+######################################################
+
+DUPLICATE_KEY = 11000
+
+# Server error codes of transient failures, worth sending the documents again
+RETRYABLE_CODES = frozenset((
+    6,      # HostUnreachable
+    7,      # HostNotFound
+    89,     # NetworkTimeout
+    91,     # ShutdownInProgress
+    189,    # PrimarySteppedDown
+    262,    # ExceededTimeLimit
+    9001,   # SocketException
+    10107,  # NotWritablePrimary
+    11600,  # InterruptedAtShutdown
+    11602,  # InterruptedDueToReplStateChange
+    13435,  # NotPrimaryNoSecondaryOk
+    13436,  # NotPrimaryOrSecondary
+))
+
+
+def connect(config_file):
+    """
+    Client and collection of a MongoDB configuration file (3 lines: URI,
+    database, collection).
+    """
+    with open(config_file, 'r') as file1:
+        lines = [line.rstrip('\n') for line in file1.readlines()]
+    client = MongoClient(lines[0])
+    return client, client[lines[1]][lines[2]]
+
+
+def block_document(block):
+    document = {}
+    for nombre in block.item_names():
+        valor_item = getattr(block, nombre)
+        document[nombre] = to_dict(valor_item) if valor_item.exist else None
+    return document
+
+
+class MongoSink:
+    """
+    MongoDB collection written by batches, one document per record.
+
+    Parameters
+    ----------
+    collection : pymongo Collection
+        Collection to insert the documents into.
+    batch_size : int (optional)
+        Documents per insert_many. Default = 1000
+    retries : int (optional)
+        Times a batch (or its failed documents) is sent again after a
+        transient error. Default = 3
+    backoff : float (optional)
+        Seconds to wait before the first retry, doubled on every retry.
+        Default = 0.5
+
+    Attributes
+    ----------
+    inserted : int
+        Documents inserted.
+    duplicates : int
+        Documents already in the collection (duplicate key).
+    failed : int
+        Documents not inserted: permanent error, or transient error after all
+        the retries (written to the log).
+    """
+
+    def __init__(self, collection, batch_size=1000, retries=3, backoff=0.5):
+        self.collection = collection
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        self.batch = []
+        self.inserted = 0
+        self.duplicates = 0
+        self.failed = 0
+
+    def add_block(self, block):
+        """
+        Add a decoded block as a new document.
+        """
+        self.add_document(block_document(block))
+
+    def add_document(self, document):
+        self.batch.append(document)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Insert the documents buffered.
+        """
+        documents = self.batch
+        self.batch = []
+        errors = []
+        lost = False
+        for attempt in range(self.retries + 1):
+            if not documents:
+                return
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                result = self.collection.insert_many(documents, ordered=False)
+                self.inserted += len(result.inserted_ids)
+                return
+            except BulkWriteError as e:
+                details = e.details
+                self.inserted += details.get('nInserted', 0)
+                errors = []
+                retry = []
+                rejected = []
+                rejected_errors = []
+                for error in details.get('writeErrors', []):
+                    code = error.get('code')
+                    if code == DUPLICATE_KEY:
+                        # Inserted by an attempt whose reply was lost
+                        if lost:
+                            self.inserted += 1
+                        else:
+                            self.duplicates += 1
+                    elif code in RETRYABLE_CODES:
+                        errors.append(error.get('errmsg'))
+                        retry.append(documents[error['index']])
+                    else:
+                        # Permanent (e.g. document validation): not sent again
+                        rejected.append(documents[error['index']])
+                        rejected_errors.append(error.get('errmsg'))
+                self.fail(rejected, rejected_errors)
+                documents = retry
+            except AutoReconnect as e:
+                # Unknown outcome: the whole batch is sent again
+                errors = [str(e)]
+                lost = True
+            except OperationFailure as e:
+                if e.code not in RETRYABLE_CODES:
+                    self.fail(documents, [str(e)])
+                    return
+                errors = [str(e)]
+                lost = True
+        self.fail(documents, errors)
+
+    def fail(self, documents, errors):
+        """
+        Count and log documents not inserted.
+        """
+        if not documents:
+            return
+        self.failed += len(documents)
+        for error in errors:
+            logging.error(f'MongoDB insert error: {error}\n')
+        logging.error(f'{len(documents)} documents not inserted\n')
+
+    def close(self):
+        """
+        Insert the remaining documents.
+
+        Returns
+        -------
+        inserted : int
+            Documents inserted.
+        """
+        self.flush()
+        return self.inserted
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        return False
+
+
+######################################################
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Helpers to work on ASTERIX records as raw octets.
+
+Records can be given as an uppercase hex string (the format produced by
+``ast_to_hex``) or directly as ``bytes``/``bytearray``/``memoryview``. They
+are normalised once with ``to_octets`` and then every item decodes from the
+octets, without building hex text in between.
+"""
+
+
+######################################################
+
+def to_octets(data):
+    """
+    Normalise a record to ``bytes``.
+
+    Parameters
+    ----------
+    data : str, bytes, bytearray or memoryview
+        Record as hex text or as raw octets.
+
+    Returns
+    -------
+    bytes
+        Octets of the record.
+    """
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, (bytearray, memoryview)):
+        return bytes(data)
+    return bytes.fromhex(data.strip())
+
+
+def octetint(data):
+    """
+    Unsigned big-endian integer of a slice of octets.
+
+    Raises ValueError if the slice is empty, i.e. the record is truncated.
+    """
+    if not data:
+        raise ValueError("Truncated record: no octets left to decode")
+    return int.from_bytes(data, 'big')
+
+
+def octetbin(data):
+    """
+    Bit string ('0'/'1' characters, MSB first) of a slice of octets.
+    """
+    return bin(octetint(data))[2:].zfill(len(data) * 8)
+
+
+######################################################
+# Bit-field extraction
+#
+# Items are decoded as one unsigned integer (octetint) and every field is
+# taken from it with a shift and a mask. The field table of each item is
+# compiled once, at class definition, with bitfields().
+
+UNSIGNED = 'unsigned'   # int
+SIGNED   = 'signed'     # int, two's complement
+BITS     = 'bits'       # str of '0'/'1', e.g. flags and spare bits
+OCTAL    = 'octal'      # str with the octal digits (Mode 1/2/3A codes)
+
+
+def bitfields(size, *fields):
+    """
+    Compile the field table of an item.
+
+    Parameters
+    ----------
+    size : int
+        Length of the item (or sub-field) in octets.
+    *fields : tuple
+        (name, start, end[, kind[, scale]]). start/end are bit positions
+        counted from the MSB, as in a slice of the bit string of the item.
+        kind defaults to UNSIGNED; if scale is given, the value is
+        multiplied by it.
+
+    Returns
+    -------
+    tuple
+        Table of (name, shift, mask, sign, kind, fmt, scale).
+    """
+    nbits = size * 8
+    table = []
+    for field in fields:
+        name, start, end = field[:3]
+        kind = field[3] if len(field) > 3 else UNSIGNED
+        scale = field[4] if len(field) > 4 else None
+        width = end - start
+        fmt = f'0{width}b' if kind is BITS else 'o'
+        table.append((name, nbits - end, (1 << width) - 1, 1 << (width - 1),
+                      kind, fmt, scale))
+    return tuple(table)
+
+
+def unpack_fields(value, table):
+    """
+    Values of the fields of a table, in the same order.
+    """
+    values = []
+    for name, shift, mask, sign, kind, fmt, scale in table:
+        field = (value >> shift) & mask
+        if kind is SIGNED:
+            if field & sign:
+                field -= sign << 1
+        elif kind is not UNSIGNED:
+            field = format(field, fmt)
+        if scale is not None:
+            field = field * scale
+        values.append(field)
+    return values
+
+
+def extract_fields(obj, value, table):
+    """
+    Set on obj every field of the table, taken from value.
+    """
+    for entry, field in zip(table, unpack_fields(value, table)):
+        setattr(obj, entry[0], field)
+
+
+def field_values(value, table):
+    """
+    Dictionary name -> value of the fields of a table, taken from value.
+    """
+    return {entry[0]: field
+            for entry, field in zip(table, unpack_fields(value, table))}
+
+
+######################################################
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parquet output of decoded records (requires pyarrow).
+
+Records are flattened with the column layout of columns.ColumnTable (one
+column per item field, e.g. ``item130.latitude``) and written in row groups
+while they are decoded, so memory use is bounded by the row group size.
+
+The schema is known before the first record: the column dtypes are fixed by
+the item classes (see columns), int64 -> int64, float64 -> double, uint32
+(ICAO addresses) -> uint32 and object (text and flags) -> string. Every row
+group is written straight into the output file.
+"""
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .columns import ColumnTable
+
+
+######################################################
+
+def arrow_type(dtype):
+    if dtype == object:
+        return pa.string()
+    return pa.from_numpy_dtype(np.dtype(dtype))
+
+
+def table_schema(table):
+    """
+    pyarrow schema of the columns of a ColumnTable.
+    """
+    return pa.schema([(column.name, arrow_type(column.dtype))
+                      for column in table.columns])
+
+
+def column_array(column, rows, dtype):
+    """
+    Arrow array of the first rows of a column buffer (missing rows are null).
+    """
+    data = column.data[:rows]
+    valid = column.valid[:rows]
+    if column.dtype == object:
+        return pa.array(data, type=dtype, from_pandas=True)
+    return pa.array(data, type=dtype, mask=~valid)
+
+
+class ParquetSink:
+    """
+    Parquet file written in row groups, one row per record.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the Parquet file.
+    block_class : BlockCat21 or BlockCat48
+        Block of the category.
+    items : list (optional)
+        Names of the items to write. Default = None (all)
+    row_group_size : int (optional)
+        Records per row group. Default = 65536
+    compression : str (optional)
+        Parquet compression codec. Default = 'snappy'
+    """
+
+    def __init__(self, filename, block_class, items=None, row_group_size=65536,
+                 compression='snappy'):
+        self.filename = filename
+        self.block_class = block_class
+        self.items = items
+        self.row_group_size = row_group_size
+        self.table = ColumnTable(block_class, items)
+        self.schema = table_schema(self.table)
+        self.writer = pq.ParquetWriter(filename, self.schema,
+                                       compression=compression)
+        self.rows = 0
+
+    def add_block(self, block):
+        """
+        Write the items of a decoded block as a new row.
+        """
+        self.table.add_block(block)
+        if self.table.rows >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the rows buffered as a row group.
+        """
+        rows = self.table.rows
+        if not rows:
+            return
+        arrays = [column_array(column, rows, field.type)
+                  for column, field in zip(self.table.columns, self.schema)]
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema),
+                                row_group_size=self.row_group_size)
+        self.rows += rows
+        self.table = ColumnTable(self.block_class, self.items)
+
+    def close(self):
+        """
+        Write the remaining rows and close the Parquet file.
+
+        Returns
+        -------
+        rows : int
+            Records written.
+        """
+        try:
+            self.flush()
+        finally:
+            self.writer.close()
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.writer.close()
+        return False
+
+
+######################################################
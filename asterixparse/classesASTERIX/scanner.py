@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Header-only scan of ASTERIX recordings.
+
+Records are walked with the CAT octet, the LEN field and the FSPEC only: the
+length of every record is found with the skip plan of its FSPEC (see
+uap.skip_plan), compiled once per category and FSPEC, and no item is ever
+created.
+
+FSPECs are stored left-aligned in 64 bits (first FSPEC octet in the most
+significant octet), so the presence bit of an item does not depend on the
+length of the FSPEC (see fspec_mask).
+"""
+
+import logging
+import mmap
+import os
+from array import array
+
+import numpy as np
+
+from . import classcategory21
+from . import classcategory48
+from .uap import read_fspec, skip_plan
+
+
+######################################################
+
+BLOCK_CLASSES = {21: classcategory21.BlockCat21,
+                 48: classcategory48.BlockCat48}
+
+
+def fspec_mask(cat, items):
+    """
+    Mask of the presence bits of items in a left-aligned FSPEC.
+
+    Parameters
+    ----------
+    cat : int
+        Category.
+    items : list
+        Item names (e.g. ['item130', 'item080']).
+
+    Returns
+    -------
+    mask : int
+        Bits of the items; a record holds one of them if fspec & mask != 0.
+
+    """
+    names = [nombre for nombre, length in BLOCK_CLASSES[cat].UAP]
+    mask = 0
+    for nombre in items:
+        frn = names.index(nombre)
+        # 7 data bits per FSPEC octet, the 8th is FX
+        mask |= 1 << (63 - (frn // 7 * 8 + frn % 7))
+    return mask
+
+
+def iter_data_blocks(filename, binary):
+    """
+    Data blocks of a recording, in file order.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file.
+    binary : bool
+        True for binary .ast files (memory-mapped), False for hexadecimal
+        messages, one per line. Lines that are not hexadecimal are written to
+        the log and skipped.
+
+    Yields
+    ------
+    info : mmap or bytes
+        Octets holding the data block (the whole file on binary files).
+    start : int
+        Position of the CAT octet of the data block in info.
+    block_offset : int
+        Offset of the data block in the file (of its line on hex files).
+    """
+    if binary:
+        with open(filename, 'rb') as file1:
+            if os.fstat(file1.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file1.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                size = len(data)
+                offset = 0
+                while offset + 3 <= size:
+                    length = int.from_bytes(data[offset+1:offset+3], 'big')
+                    if length < 3 or offset + length > size:
+                        logging.error(f'Corrupted or truncated message at octet {offset}\n')
+                        break
+                    yield data, offset, offset
+                    offset += length
+    else:
+        with open(filename, 'rb') as file1:
+            offset = 0
+            for line in file1:
+                info = line.strip()
+                if len(info) >= 6:
+                    try:
+                        data = bytes.fromhex(info.decode())
+                    except ValueError as e:
+                        # Not hexadecimal: the line is skipped
+                        logging.error(f'Message not read at octet {offset}: {e}\n')
+                    else:
+                        yield data, 0, offset
+                offset += len(line)
+
+
+class RecordScan:
+    """
+    Records found by the scan, in file order.
+
+    Parameters
+    ----------
+    categories : list
+        Categories to scan; data blocks of other categories are skipped.
+    """
+
+    def __init__(self, categories=(21, 48)):
+        self.categories = frozenset(cat for cat in categories if cat in BLOCK_CLASSES)
+        self.block    = array('q')   # offset of the data block (or line) in the file
+        self.position = array('H')   # octet of the record in its data block
+        self.length   = array('H')   # octets of the record
+        self.cat      = array('B')
+        self.fspec    = array('Q')   # left-aligned
+        self.errors   = 0
+        self.plans    = {cat: {} for cat in BLOCK_CLASSES}
+
+    def add_data_block(self, info, start=0, block_offset=0):
+        """
+        Scan the records of the data block that starts at octet start of info.
+
+        Parameters
+        ----------
+        info : bytes, mmap
+            Octets holding the data block.
+        start : int (optional)
+            Position of the CAT octet in info. Default = 0
+        block_offset : int (optional)
+            Offset of the data block (or of its line) in the file. Default = 0
+        """
+        cat = info[start]
+        if cat not in self.categories:
+            return
+        end = start + int.from_bytes(info[start+1:start+3], 'big')
+        block_class = BLOCK_CLASSES[cat]
+        plans = self.plans[cat]
+        count_octets = start + 3
+        try:
+            # A zero FSPEC octet is filler after the last record
+            while count_octets < end and info[count_octets]:
+                first = count_octets
+                while info[count_octets] & 0x01:
+                    count_octets += 1
+                count_octets += 1
+                size = count_octets - first
+                fspec = int.from_bytes(info[first:count_octets], 'big')
+                plan = plans.get(fspec)
+                if plan is None:
+                    plan = skip_plan(block_class, read_fspec(info, first)[1])
+                    plans[fspec] = plan
+                for step in plan:
+                    if step.__class__ is int:
+                        count_octets += step
+                    else:
+                        count_octets = step(info, count_octets)
+                if count_octets > end:
+                    raise IndexError("record beyond LEN")
+
+                self.block.append(block_offset)
+                self.position.append(first - start)
+                self.length.append(count_octets - first)
+                self.cat.append(cat)
+                self.fspec.append(fspec << (64 - 8 * size) if size <= 8 else 0)
+        except (IndexError, ValueError) as e:
+            self.errors += 1
+            logging.error(f'Data block not scanned at octet {block_offset}: {e}\n')
+
+    def __len__(self):
+        return len(self.cat)
+
+    def to_arrays(self):
+        """
+        Dictionary field -> NumPy array ('block', 'position', 'length', 'cat',
+        'fspec'), one element per record.
+        """
+        return {'block':    np.frombuffer(self.block, dtype=np.int64),
+                'position': np.frombuffer(self.position, dtype=np.uint16),
+                'length':   np.frombuffer(self.length, dtype=np.uint16),
+                'cat':      np.frombuffer(self.cat, dtype=np.uint8),
+                'fspec':    np.frombuffer(self.fspec, dtype=np.uint64)}
+
+
+######################################################
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dictionaries and rows of decoded items.
+
+Same result as dataclasses.asdict, without its cost on every item: the
+serializer of each item class (nested classes included, e.g.
+Item020.FirstExt or Item250.BDS) is generated once, as a function that
+reads its fields by name, and cached. Field values (int, float, str) are
+returned as they are, not deep-copied; sub-items and repetitive fields
+(lists of blocks) are converted to new dicts and lists, as asdict does.
+"""
+
+import copy
+from dataclasses import fields, is_dataclass
+
+
+######################################################
+
+# Values returned as they are (immutable)
+SCALARS = frozenset((int, float, str, bool, bytes, type(None)))
+
+DICT_SERIALIZERS = {}
+ROW_SERIALIZERS = {}
+
+
+def convert(value):
+    cls = value.__class__
+    if cls in SCALARS:
+        return value
+    if is_dataclass(cls):
+        serializer = DICT_SERIALIZERS.get(cls)
+        if serializer is None:
+            serializer = compile_serializer(cls, DICT_SERIALIZERS)
+        return serializer(value)
+    if cls is list or cls is tuple:
+        return cls(convert(elemento) for elemento in value)
+    if cls is dict:
+        return {convert(key): convert(elemento) for key, elemento in value.items()}
+    return copy.deepcopy(value)
+
+
+def compile_serializer(cls, cache):
+    """
+    Generate the to_dict (cache DICT_SERIALIZERS) or to_row (cache
+    ROW_SERIALIZERS) function of a dataclass and cache it.
+    """
+    values = [(field.name, f'convert(item.{field.name})') for field in fields(cls)]
+    if cache is DICT_SERIALIZERS:
+        body = '{' + ', '.join(f'{name!r}: {value}' for name, value in values) + '}'
+    else:
+        body = '(' + ''.join(f'{value}, ' for name, value in values) + ')'
+    namespace = {'convert': convert}
+    exec(f'def serializer(item):\n    return {body}\n', namespace)
+    serializer = namespace['serializer']
+    serializer.__qualname__ = f'{cls.__qualname__}.{"to_dict" if cache is DICT_SERIALIZERS else "to_row"}'
+    cache[cls] = serializer
+    return serializer
+
+
+def to_dict(item):
+    """
+    Dictionary field -> value of an item (same as dataclasses.asdict).
+    """
+    serializer = DICT_SERIALIZERS.get(item.__class__)
+    if serializer is None:
+        serializer = compile_serializer(item.__class__, DICT_SERIALIZERS)
+    return serializer(item)
+
+
+def to_row(item):
+    """
+    Tuple with the values of to_dict(item), in field order.
+    """
+    serializer = ROW_SERIALIZERS.get(item.__class__)
+    if serializer is None:
+        serializer = compile_serializer(item.__class__, ROW_SERIALIZERS)
+    return serializer(item)
+
+
+######################################################
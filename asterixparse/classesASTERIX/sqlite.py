@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite output of decoded records.
+
+Records are flattened with the column layout of columns.ColumnTable (one
+column per item field, e.g. ``item130.latitude``) into one table per
+category (``cat21``, ``cat48``), one row per record. Rows are inserted in
+batches with executemany, one transaction per batch, on a WAL database.
+
+Declared column types come from the column dtypes, fixed by the item
+field tables (see columns): REAL for float64, INTEGER for int64 and ICAO
+addresses (uint32), TEXT for text and flags. The table is created with
+them before the first record. Indexes on the time of day, SAC/SIC and target address are created when the
+sink is closed, after the rows are loaded.
+"""
+
+import sqlite3
+
+import numpy as np
+
+from .columns import ColumnTable
+from .index import ADDRESS_FIELDS as INDEX_ADDRESS, TIME_FIELDS
+from .scanner import BLOCK_CLASSES
+
+
+######################################################
+
+PRAGMAS = ('PRAGMA journal_mode=WAL',
+           'PRAGMA synchronous=NORMAL',
+           'PRAGMA temp_store=MEMORY',
+           'PRAGMA cache_size=-65536')    # KiB
+
+
+def quote(name):
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def column_type(column):
+    if column.dtype == np.float64:
+        return 'REAL'
+    if column.dtype == object:
+        return 'TEXT'
+    return 'INTEGER'
+
+
+def column_values(column, rows):
+    """
+    Python values of the first rows of a column buffer (None if missing).
+    """
+    data = column.data[:rows].tolist()
+    valid = column.valid[:rows].tolist()
+    return [value if ok else None for value, ok in zip(data, valid)]
+
+
+def index_columns(cat):
+    """
+    Columns indexed on the table of a category: (index name, columns).
+    """
+    indexes = [(f'{nombre}_{field}', (f'{nombre}.{field}',))
+               for nombre, field in TIME_FIELDS[cat]]
+    indexes.append(('sac_sic', ('item010.sac', 'item010.sic')))
+    nombre, field = INDEX_ADDRESS[cat]
+    indexes.append((f'{nombre}_{field}', (f'{nombre}.{field}',)))
+    return indexes
+
+
+class SQLiteSink:
+    """
+    SQLite table of a category written in batches, one row per record.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the SQLite database (created if it does not exist; rows are
+        added to the table of the category if it exists).
+    cat : int
+        Category (table ``cat<cat>``).
+    items : list (optional)
+        Names of the items to write. Default = None (all)
+    batch_size : int (optional)
+        Records per executemany and transaction. Default = 10000
+    """
+
+    def __init__(self, filename, cat, items=None, batch_size=10000):
+        self.cat = cat
+        self.block_class = BLOCK_CLASSES[cat]
+        self.items = items
+        self.batch_size = batch_size
+        self.table_name = f'cat{cat}'
+        self.table = ColumnTable(self.block_class, items)
+        self.names = [column.name for column in self.table.columns]
+        self.rows = 0
+        self.connection = sqlite3.connect(filename, isolation_level=None)
+        for pragma in PRAGMAS:
+            self.connection.execute(pragma)
+        self.create_table()
+
+    def create_table(self):
+        """
+        Create the table of the category (or add the missing columns to it).
+        """
+        types = {column.name: column_type(column) for column in self.table.columns}
+        cursor = self.connection.cursor()
+        table = quote(self.table_name)
+        cursor.execute('BEGIN')
+        cursor.execute('CREATE TABLE IF NOT EXISTS {} ({})'.format(
+            table, ', '.join(f'{quote(name)} {types[name]}' for name in self.names)))
+        existing = {fila[1] for fila in cursor.execute(f'PRAGMA table_info({table})')}
+        for name in self.names:
+            if name not in existing:
+                cursor.execute(f'ALTER TABLE {table} ADD COLUMN {quote(name)} {types[name]}')
+        cursor.execute('COMMIT')
+        self.insert = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            table, ', '.join(quote(name) for name in self.names),
+            ', '.join('?' * len(self.names)))
+
+    def add_block(self, block):
+        """
+        Write the items of a decoded block as a new row.
+        """
+        self.table.add_block(block)
+        if self.table.rows >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Insert the rows buffered in one transaction.
+        """
+        rows = self.table.rows
+        if not rows:
+            return
+        values = [column_values(column, rows) for column in self.table.columns]
+        cursor = self.connection.cursor()
+        cursor.execute('BEGIN')
+        try:
+            cursor.executemany(self.insert, zip(*values))
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+        cursor.execute('COMMIT')
+        self.rows += rows
+        self.table = ColumnTable(self.block_class, self.items)
+
+    def create_indexes(self):
+        table = quote(self.table_name)
+        cursor = self.connection.cursor()
+        cursor.execute('BEGIN')
+        for name, indexed in index_columns(self.cat):
+            if all(column in self.names for column in indexed):
+                cursor.execute('CREATE INDEX IF NOT EXISTS {} ON {} ({})'.format(
+                    quote(f'{self.table_name}_{name}'), table,
+                    ', '.join(quote(column) for column in indexed)))
+        cursor.execute('COMMIT')
+
+    def close(self):
+        """
+        Insert the remaining rows, create the indexes and close the database.
+
+        Returns
+        -------
+        rows : int
+            Records written.
+        """
+        try:
+            self.flush()
+            self.create_indexes()
+            self.connection.execute('PRAGMA optimize')
+        finally:
+            self.connection.close()
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.connection.close()
+        return False
+
+
+######################################################
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+User Application Profile (UAP) decode plans.
+
+The UAP of a category is compiled once into a static table indexed by FRN
+(Field Reference Number, 0-based here): for every FRN, the attribute of the
+block that holds the item and its fixed length in octets (0 when the item has
+a variable length and decodes itself). The FSPEC of every record is read as
+integers and only its set bits are visited.
+
+Only the items present in a record are created; absent items are one empty
+instance per item, shared by all the blocks. Items that are not decoded (item
+projection) are skipped with the length rules below, without building or
+decoding them.
+"""
+
+from dataclasses import fields
+
+
+######################################################
+
+# Set data bits (FX excluded) of every possible FSPEC octet, as offsets 0-6
+# from the MSB.
+FSPEC_BITS = tuple(tuple(k for k in range(7) if octet & (0x80 >> k))
+                   for octet in range(256))
+
+
+class ItemSlot:
+    """
+    Class attribute of a block for one item of its UAP.
+
+    Items present in a record are set on the block and hide it. Otherwise it
+    returns the item decoded on first access (lazy blocks) or the empty item
+    shared by all the blocks of the category (absent item).
+    """
+    __slots__ = ('name', 'absent')
+
+    def __init__(self, name, absent):
+        self.name = name
+        self.absent = absent
+
+    def __get__(self, block, owner=None):
+        if block is None:
+            return self
+        offsets = block.__dict__.get('_offsets')
+        if offsets and self.name in offsets:
+            return block.load_item(self.name)
+        return self.absent
+
+
+def install_items(block_class):
+    """
+    Compile the decode plan of a category block and install its items.
+
+    Sets on the class ``UAP``, a tuple with the (attribute, length) of every
+    FRN in UAP order, ``ITEM_TYPES``, attribute -> item class, and one
+    ItemSlot per item.
+
+    Parameters
+    ----------
+    block_class : BlockCat21 or BlockCat48
+        Block dataclass, with its items declared in UAP order after ``fspec``.
+        The annotation of each item is an empty instance of it, which is
+        shared as the absent item.
+    """
+    uap = []
+    types = {}
+    for field in fields(block_class)[1:]:
+        absent = field.type
+        uap.append((field.name, absent.len))
+        types[field.name] = type(absent)
+        setattr(block_class, field.name, ItemSlot(field.name, absent))
+    block_class.UAP = tuple(uap)
+    block_class.ITEM_TYPES = types
+
+
+def read_fspec(info, count_octets):
+    """
+    Read the FSPEC of a record.
+
+    Parameters
+    ----------
+    info : bytes
+        Octets of the ASTERIX message.
+    count_octets : int
+        Position of the first FSPEC octet.
+
+    Returns
+    -------
+    fspec : int
+        FSPEC octets (FX bits included) as an unsigned integer.
+    frns : list
+        FRNs (0-based) present in the record, in ascending order.
+    count_octets : int
+        Position of the first octet after the FSPEC.
+    """
+    start = count_octets
+    frns = []
+    base = 0
+    while True:
+        octet = info[count_octets]
+        count_octets += 1
+        for k in FSPEC_BITS[octet]:
+            frns.append(base + k)
+        if not octet & 0x01:
+            break
+        base += 7
+    fspec = int.from_bytes(info[start:count_octets], 'big')
+    return fspec, frns, count_octets
+
+
+def skip_plan(block_class, frns):
+    """
+    Steps to skip a whole record with the FRNs given, without decoding it:
+    the lengths of consecutive fixed-length items added up (int) and the
+    length rule of every variable-length item.
+
+    Raises ValueError if an item of unknown length (spare FRN) is present.
+    """
+    uap = block_class.UAP
+    steps = []
+    fixed = 0
+    for frn in frns:
+        if frn >= len(uap):
+            break
+        nombre, length = uap[frn]
+        if length > 0:
+            fixed += length
+            continue
+        rule = block_class.SKIP.get(nombre)
+        if rule is None:
+            raise ValueError(f"Item of unknown length present on FSPEC: {nombre}")
+        if fixed:
+            steps.append(fixed)
+            fixed = 0
+        steps.append(rule)
+    if fixed:
+        steps.append(fixed)
+    return tuple(steps)
+
+
+######################################################
+# Length rules, to skip an item without decoding it. Each rule takes the
+# message octets and the position of the item and returns the position of
+# the next item.
+
+def skip_fx(octets):
+    """
+    Item extended with FX bits: octets until one with FX = 0, at most octets
+    (primary and extensions decoded by the item class, as it stops there).
+    """
+    def skip(info, count_octets):
+        end = count_octets + octets - 1
+        while count_octets < end and info[count_octets] & 0x01:
+            count_octets += 1
+        return count_octets + 1
+    return skip
+
+
+def skip_rep(size):
+    """
+    Repetitive item: REP octet followed by REP blocks of size octets.
+    """
+    def skip(info, count_octets):
+        return count_octets + 1 + info[count_octets] * size
+    return skip
+
+
+def skip_explicit(info, count_octets):
+    """
+    Explicit length item (RE/SP): first octet is the length, itself included.
+    """
+    return count_octets + info[count_octets]
+
+
+def skip_compound(*octets):
+    """
+    Compound item: presence octet(s) followed by the subfields present.
+
+    Parameters
+    ----------
+    *octets : tuple
+        For every presence octet, the length (int) or length rule of the
+        subfield of each bit, from the MSB. The next presence octet is only
+        read if the FX bit is set and it is declared here.
+    """
+    def skip(info, count_octets):
+        presence = []
+        for sizes in octets:
+            octet = info[count_octets]
+            count_octets += 1
+            presence.append((octet, sizes))
+            if not octet & 0x01:
+                break
+        for octet, sizes in presence:
+            for k in FSPEC_BITS[octet]:
+                if k >= len(sizes):
+                    break
+                size = sizes[k]
+                if isinstance(size, int):
+                    count_octets += size
+                else:
+                    count_octets = size(info, count_octets)
+        return count_octets
+    return skip
+
+
+######################################################
@@ -66,6 +66,55 @@ prefix = 'ADSB_HEX_part'
 ast.split_file(input_file, prefix, number_lines, path)
 
 
+#%%###
+# Decode .ast file (binary) message by message, without converting it to
+# hexadecimal. Constant memory use, suitable for large recordings
+
+import asterixparse as ast
+
+
+sample_filename = 'ADSB_HEX.ast'
+categories = [21]
+
+for message_asterix in ast.iter_ast_file(sample_filename, categories):
+    print(message_asterix)
+
+
+#%%###
+# Header-only scan (CAT, LEN and FSPEC): offsets, categories and FSPEC of 
+# every record, without decoding any item (.ast or hex files)
+
+import asterixparse as ast
+
+
+sample_filename = 'ADSB_HEX.ast'
+
+records = ast.scan_file(sample_filename)
+print(f"{len(records['cat'])} records")
+
+# Records of CAT21 with position (item130)
+mask = ast.fspec_mask(21, ['item130'])
+with_position = (records['cat'] == 21) & (records['fspec'] & mask != 0)
+print(f"{with_position.sum()} with item130")
+
+
+#%%###
+# Indexed recording: a sidecar index (<file>.idx.npz, built on first use) 
+# keeps offset, category, SAC/SIC, time of day and target address of every
+# record, so only the records that match a query are decoded (.ast or hex)
+
+import asterixparse as ast
+
+
+sample_filename = 'ADSB_HEX.ast'
+
+recording = ast.open_indexed(sample_filename)
+messages = recording.query(time_range=(36000, 39600), icao='3C6586')
+
+for message_asterix in messages:
+    print(message_asterix)
+
+
 
 #%%###########################################################################
 # Decode one message 
@@ -84,6 +133,23 @@ message = ('150063F71B7B6BD3A70414D70101000D95011CFAA6FDAE330E7D5334FED7199A342'
 message_asterix = ast.decode_message(message)
 
 
+#%%###
+# Raw octets (bytes, bytearray or memoryview) are decoded directly, without
+# converting them to hexadecimal text first
+
+message_asterix = ast.decode_message(bytes.fromhex(message))
+
+
+#%%###
+# Lazy decoding: the FSPEC is parsed and each item is decoded the first time 
+# it is read. Faster when only a few items of every record are needed
+# (also available on decode_file and iter_ast_file)
+
+message_asterix = ast.decode_message(message, lazy=True)
+block = message_asterix.blocks[0]
+print(block.item130.latitude, block.item130.longitude)
+
+
 
 #%%###########################################################################
 # Decoded into variable object type Category21 or Category48 (more categories will 
@@ -102,6 +168,47 @@ category = 21
 messages_asterix = ast.decode_file(input_file, category)
 
 
+#%%###
+# Item projection: only the items listed are decoded, the rest are skipped by
+# their length (also available on decode_message, iter_ast_file and the 
+# file to JSON/csv functions)
+
+items = ["item073", "item130", "item145", "item170"]
+
+messages_asterix = ast.decode_file(input_file, category, items=items)
+
+
+#%%###
+# Parallel decoding: the file is split at line boundaries and decoded by 
+# several processes; messages keep the order of the file
+
+messages_asterix = ast.decode_file(input_file, category, workers=8)
+
+
+#%%###
+# Decode cache: repeated messages (e.g. merged multi-sensor feeds) are decoded
+# once; cached messages are shared, do not modify them
+
+cache = ast.DecodeCache(maxsize=65536)
+messages_asterix = ast.decode_file(input_file, category, cache=cache)
+
+print(cache.stats())
+
+
+#%%###
+# Memory used by the decoded messages
+
+import tracemalloc
+
+
+tracemalloc.start()
+messages_asterix = ast.decode_file(input_file, category)
+memory, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+
+print(f"{memory/2**20:.1f} MiB, {memory/messages_asterix.count:.0f} bytes/message")
+
+
 #%%###
 # From file directly decoded to JSON
 #
@@ -152,6 +259,83 @@ output_file = 'ADSB_21.csv'
 ast.var_to_csv(output_file, messages_asterix)
 
 
+#%%###
+# From file directly decoded to columns (pandas DataFrame or NumPy arrays),
+# one column per item field, e.g. 'item130.latitude' (float64), 
+# 'item080.target_addr' (uint32)
+#
+
+##############################################################
+###  [3.5] Decode ASTERIX messages list (file) to columns  ###
+##############################################################
+
+import asterixparse as ast
+
+
+input_file = 'ADSB_HEX.txt'
+category = 21
+items = ["item071", "item073", "item080", "item130", "item145"]
+
+df = ast.decode_file_columnar(input_file, category, items)
+arrays = ast.decode_file_columnar(input_file, category, items, dataframe=False)
+
+
+#%%###
+# From file directly decoded to Parquet (requires pyarrow), same columns, 
+# written by row groups while decoding
+#
+
+##############################################################
+###  [3.6] Decode ASTERIX messages list (file) to Parquet  ###
+##############################################################
+
+import asterixparse as ast
+
+
+input_file = 'ADSB_HEX.txt'
+output_file = 'ADSB_21.parquet'
+category = 21
+
+ast.decode_file_to_parquet(input_file, output_file, category)
+
+
+#%%###
+# From file directly decoded to SQLite (table "cat21"), inserted by batches
+# while decoding
+#
+
+#############################################################
+###  [3.7] Decode ASTERIX messages list (file) to SQLite  ###
+#############################################################
+
+import asterixparse as ast
+
+
+input_file = 'ADSB_HEX.txt'
+output_file = 'ADSB_21.db'
+category = 21
+
+ast.decode_file_to_sqlite(input_file, output_file, category)
+
+
+#%%###
+# From file directly decoded to MongoDB (requires mongod server, settings on
+# "mongodb.conf"), inserted by batches while decoding
+#
+
+##############################################################
+###  [3.8] Decode ASTERIX messages list (file) to MongoDB  ###
+##############################################################
+
+import asterixparse as ast
+
+
+input_file = 'ADSB_HEX.txt'
+category = 21
+
+ast.decode_file_to_mongodb(input_file, category, batch_size=1000)
+
+
 
 #%%###########################################################################
 # Dump object messages (transformed to dict) to JSON file 
@@ -169,6 +353,20 @@ ast.dump_all_to_json(output_file, messages_asterix)
 #asterixparse.dump_all_to_json_bk(file1, messages_asterix)
 
 
+#%%###
+# Read JSON file (NDJSON) record by record
+#
+
+import asterixparse as ast
+
+
+input_file = 'ADSB_21.json'
+
+for record in ast.iter_ndjson(input_file):
+    print(record['item130'])
+    break
+
+
 
 #%%###########################################################################
 # Dump object messages (transformed to dict) to reloadable JSON file 
@@ -247,6 +445,23 @@ ast.dump_to_sqlite(output_file, messages_asterix)
 
 
 
+#%%###
+# Dump to Parquet (requires pyarrow), one column per item field
+#
+
+##############################
+##### [8.1] Parquet  #########
+##############################
+
+import asterixparse as ast
+
+
+output_file = 'ADSB_21.parquet'
+
+ast.dump_to_parquet(output_file, messages_asterix)
+
+
+
 #%%###########################################################################
 # Save one message (all its blocks) into human format on a variable  
    
@@ -263,6 +478,19 @@ info_message = ast.message_str(messages_asterix.messages[0]) #First message of t
 print(info_message)
 
 
+#%%###
+# One item as dict / tuple of values (same as dataclasses.asdict, faster)
+#
+
+import asterixparse as ast
+
+
+block = messages_asterix.messages[0].blocks[0]
+
+item_dict = ast.to_dict(block.item130)
+item_row = ast.to_row(block.item130)
+
+
 
 #%%###########################################################################
 # Dump choosen items of message into txt file (CAT21)
@@ -278,6 +506,9 @@ output_file = 'ADSB_HEX_items.txt'
 items_to_save = ["item080", "item131", "item140", "item073",
                  "item170", "item020"]  
 
+# Only the items to save need to be decoded
+messages_asterix = ast.decode_file('ADSB_HEX.txt', 21, items=items_to_save)
+
 ast.dump_items_txt(output_file, messages_asterix, items_to_save)
     
 
@@ -306,6 +537,10 @@ import asterixparse as ast
 
 output_file = 'MODO_S_HEX_items.txt'
 
+# Only the items dumped need to be decoded
+messages_asterix = ast.decode_file('MODO_S_HEX.txt', 48, 
+                                   items=["item140", "item220", "item240", "item250"])
+
 ast.dump_bds_txt(output_file, messages_asterix)
 
 
@@ -351,6 +586,31 @@ input_file = 'MODO_S_HEX_items_BDS50.txt'
 data = pd.read_csv(input_file, delimiter='\t', engine='python')
 
 
+#%%###
+# Batch decoding: array of MB fields (uint64) decoded at once into a 
+# structured array ('valid' marks the registers of the type given)
+
+import numpy as np
+
+
+data = pd.read_csv('MODO_S_HEX_items.txt', delimiter='\t', engine='python')
+mb = np.array([int(valor, 16) for valor in data['BDS']], dtype=np.uint64)
+
+registers = ast.classmodes.decode_bds_batch(mb, 'BDS50')
+print(registers[registers['valid']][['roll_angle', 'ground_speed', 'true_airspeed']])
+
+
+#%%###
+# Register type inference (Comm-B data without BDS code): BDS44/50/60 
+# hypotheses of every register at once, altitude from Item090
+
+messages_asterix = ast.decode_file('MODO_S_HEX.txt', 48, items=["item090", "item250"])
+
+registers = ast.classmodes.bds_registers(messages_asterix)
+hypotheses, decoded = ast.classmodes.infer_bds_batch(registers['mb'], registers['altitude'])
+print(np.unique(hypotheses['bds_type'], return_counts=True))
+
+
 
 #%%###########################################################################
 # Merge on csv file CAT21 items with BDS50 and BDS60 decoded data, given a 
@@ -373,6 +633,13 @@ max_dev = 5
 ast.merge_data(fileCAT21, fileBDS50, fileBDS60, output_file, max_dev)
 
 
+#%%###
+# Out-of-core merge (files larger than RAM): read by chunks of rows, split by
+# time and merged bucket by bucket; same output file
+
+ast.merge_data(fileCAT21, fileBDS50, fileBDS60, output_file, max_dev, chunksize=200000)
+
+
 
 #%%###########################################################################
 # Calculate dataframe with ASTERIX and ERA5 meteo data (temperature and 
@@ -392,3 +659,21 @@ local_meteo_grid = 'gridinfo/meteo/era5-zarr'
 ast.calculate_meteo(input_file, output_file, local_meteo_grid)
 
 
+
+#%%###########################################################################
+# Calculate meteo data from CAT21 and CAT48 messages in memory: same as 
+# [10] -> [11] -> [12] -> [13] -> [14] without intermediate text files
+
+#######################################
+#####  [15] Meteo pipeline         #####
+#######################################
+
+import asterixparse as ast
+
+
+cat21_file = 'ADSB_HEX.txt'
+cat48_file = 'MODO_S_HEX.txt'
+output_file = 'meteo_info.csv'
+local_meteo_grid = 'gridinfo/meteo/era5-zarr'
+
+ast.meteo_pipeline(cat21_file, cat48_file, output_file, local_meteo_grid, max_dev=5)
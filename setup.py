@@ -139,4 +139,6 @@ setup(
         'pymongo>=3.12.0', 
         'tqdm>=4.65.0', 
         'fastmeteo>=0.1.1'],
+    extras_require={
+        'parquet': ['pyarrow>=10.0.0']},
 )
\ No newline at end of file
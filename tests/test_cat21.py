@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CAT021 items decoded from known octets (fields fixed against the specification)
+and truncated records.
+"""
+
+import pytest
+
+from asterixparse.classesASTERIX import classcategory21
+
+
+def test_item150_ias_scale():
+    # IM = 0: IAS in 2^-14 NM/s
+    item = classcategory21.Item150()
+    item.add_info(bytes.fromhex('0400'))
+    assert item.im == 0
+    assert item.airspeed == pytest.approx(1024 * 2**-14)
+
+
+def test_item150_mach_scale():
+    # IM = 1: Mach in 0.001
+    item = classcategory21.Item150()
+    item.add_info(bytes.fromhex('83E8'))
+    assert item.im == 1
+    assert item.airspeed == pytest.approx(1.0)
+
+
+def test_item271_length_width():
+    # FX of the primary subfield, then L+W = 1100
+    item = classcategory21.Item271()
+    assert item.add_info(bytes.fromhex('01C0'), 0) == 2
+    assert item.first_ext.exist
+    assert item.first_ext.l_w == 12
+
+
+def test_item260_fields():
+    value = ((0b00011 << 51) | (0b010 << 48) | (0x2005 << 34) | (0b1001 << 30)
+             | (0b1 << 29) | (0b0 << 28) | (0b10 << 26) | 0x123456)
+    item = classcategory21.Item260()
+    item.add_info(value.to_bytes(7, 'big'))
+    assert item.len == 7
+    assert item.typ == '00011'
+    assert item.styp == '010'
+    assert item.ara == '10000000000101'
+    assert item.rac == '1001'
+    assert item.rat == '1'
+    assert item.mte == '0'
+    assert item.tti == '10'
+    assert int(item.tid, 2) == 0x123456
+
+
+def test_item110_tis():
+    # TIS present, NAV = 0, NVB = 1
+    item = classcategory21.Item110()
+    assert item.add_info(bytes.fromhex('8040'), 0) == 2
+    assert item.tis.exist
+    assert item.tis.nav == '0'
+    assert item.tis.nvb == '1'
+
+
+def test_re_gao_longitudinal():
+    # GAO: lateral 000, longitudinal 00011 (2 m per unit)
+    item = classcategory21.RE()
+    assert item.add_info(bytes.fromhex('031003'), 0) == 3
+    assert item.data.gao.lateral == 0
+    assert item.data.gao.longitudinal == 6
+
+
+@pytest.mark.parametrize('hex_item, length, hgt', [('040800C8', 4, None),
+                                                   ('050800C914', 5, 28.125)])
+def test_re_sgv_ground_speed(hex_item, length, hgt):
+    # GSS = 100 (0.125 kt per unit), without and with the first extension
+    item = classcategory21.RE()
+    assert item.add_info(bytes.fromhex(hex_item), 0) == length
+    assert item.data.sgv.primary.gss == pytest.approx(12.5)
+    assert item.data.sgv.first_ext.exist == (hgt is not None)
+    if hgt is not None:
+        assert item.data.sgv.first_ext.hgt == pytest.approx(hgt)
+
+
+def test_re_mes_mode_codes():
+    # MES with EM1 = 1234 and Mode 2 = 7070
+    item = classcategory21.RE()
+    assert item.add_info(bytes.fromhex('0701' '24' '029C' '0E38'), 0) == 7
+    assert item.data.mes.em1.em1 == '1234'
+    assert item.data.mes.m2.em2 == '7070'
+
+
+MESSAGE = bytes.fromhex(
+    '150066EDB7FFE759E704F539834FA5E1C8427F53F93DFB878AEF1A66C7CFE894B23E65'
+    'E5B93031221FB1DF4D468534919FBB73A0C2E16FA1517ECE582C1C5CADFA9C145C6531'
+    '412A236F6F1510B8B2B7433B402F18B29F131CC0C1C057950707A872BD85EE34')
+
+
+def decode_truncated(octets, lazy=False, items=None):
+    # Record cut to octets, LEN set to match
+    info = MESSAGE[:1] + octets.to_bytes(2, 'big') + MESSAGE[3:octets]
+    message_asterix = classcategory21.AsterixMessage(21, octets, info, 3, lazy, items)
+    try:
+        message_asterix.add_blocks()
+    except ValueError as e:
+        assert str(e).startswith('Truncated record')
+        return None
+    return len(message_asterix.blocks)
+
+
+@pytest.mark.parametrize('octets', range(4, len(MESSAGE)))
+def test_truncated_record_same_with_items(octets):
+    expected = decode_truncated(octets)
+    assert decode_truncated(octets, items=['item010']) == expected
+    assert decode_truncated(octets, lazy=True) == expected
+
+
+def test_truncated_last_item_skipped():
+    # Last item one octet short, not decoded with items=
+    assert decode_truncated(len(MESSAGE) - 1, items=['item010']) is None
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CAT048 items decoded from known octets (fields fixed against the specification),
+truncated records and data blocks with several records.
+"""
+
+import logging
+
+import pytest
+
+from asterixparse.classesASTERIX import classcategory48
+
+
+@pytest.mark.parametrize('hex_item, x, y', [('4000FF00', 128.0, -2.0),
+                                            ('80000001', -256.0, 1/128),
+                                            ('7FFF0100', 32767/128, 2.0)])
+def test_item042_signed_position(hex_item, x, y):
+    # 16-bit two's complement, 1/128 NM
+    item = classcategory48.Item042()
+    item.add_info(bytes.fromhex(hex_item))
+    assert item.x == pytest.approx(x)
+    assert item.y == pytest.approx(y)
+
+
+MESSAGE = bytes.fromhex(
+    '30004E7BB7EFDAF98421D82F12E2C4D7FFB64F8FEC0CD530C04102CC9E8A20240EE2C2'
+    '723B0D1CAECC42DA90D59E4E7AB6279C5C05EE4E1EBB9FD6D580D228099BD3B92DADAF'
+    'BAB45A52EFA20200')
+
+
+def decode_truncated(octets, lazy=False, items=None):
+    # Record cut to octets, LEN set to match
+    info = MESSAGE[:1] + octets.to_bytes(2, 'big') + MESSAGE[3:octets]
+    message_asterix = classcategory48.AsterixMessage(48, octets, info, 3, lazy, items)
+    try:
+        message_asterix.add_blocks()
+    except ValueError as e:
+        assert str(e).startswith('Truncated record')
+        return None
+    return len(message_asterix.blocks)
+
+
+@pytest.mark.parametrize('octets', range(4, len(MESSAGE)))
+def test_truncated_record_same_with_items(octets):
+    expected = decode_truncated(octets)
+    assert decode_truncated(octets, items=['item010']) == expected
+    assert decode_truncated(octets, lazy=True) == expected
+
+
+def test_truncated_last_item_skipped():
+    # Last item one octet short, not decoded with items=
+    assert decode_truncated(len(MESSAGE) - 1, items=['item010']) is None
+
+
+RECORDS = [MESSAGE[3:],
+           bytes.fromhex('FF4FD132436CFC3F9F9D9E01A5B14B82C494D6EA5AE4D17873E445B2AD7CB965'
+                         'EC45FB11590481718A6488BD94681A84CF9AD82C2C06180021BA3D')]
+
+
+def data_block(*records):
+    body = b''.join(records)
+    return bytes([48]) + (3 + len(body)).to_bytes(2, 'big') + body
+
+
+def decode_data_block(info):
+    message_asterix = classcategory48.AsterixMessage(48, len(info), info, 3)
+    message_asterix.add_blocks()
+    return message_asterix.blocks
+
+
+def test_data_block_records():
+    blocks = decode_data_block(data_block(RECORDS[0], RECORDS[1], RECORDS[0]))
+    assert len(blocks) == 3
+    assert [block.item010.sic for block in blocks] == [0, 108, 0]
+    assert blocks[1].item140.time_of_day != blocks[0].item140.time_of_day
+
+
+def test_data_block_filler():
+    # Zero FSPEC octets after the last record
+    blocks = decode_data_block(data_block(RECORDS[0], RECORDS[1], b'\x00\x00\x00'))
+    assert [block.item010.sic for block in blocks] == [0, 108]
+
+
+def test_data_block_bad_record(caplog):
+    # Second record with the spare FRN set: the first one is kept
+    info = data_block(RECORDS[0], bytes.fromhex('01010104') + RECORDS[1], RECORDS[1])
+    with caplog.at_level(logging.ERROR):
+        blocks = decode_data_block(info)
+    assert [block.item010.sic for block in blocks] == [0]
+    assert 'Record 1 not decoded' in caplog.text
+    assert 'Item not used' in caplog.text
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+decode_file_to_csv / var_to_csv rows against the to_row values of the items.
+"""
+
+import csv
+import json
+from dataclasses import fields
+
+import pytest
+
+import asterixparse as ast
+
+
+MESSAGES = {
+    21: ['150066EDB7FFE759E704F539834FA5E1C8427F53F93DFB878AEF1A66C7CFE894B23E65'
+         'E5B93031221FB1DF4D468534919FBB73A0C2E16FA1517ECE582C1C5CADFA9C145C6531'
+         '412A236F6F1510B8B2B7433B402F18B29F131CC0C1C057950707A872BD85EE34',
+         '15006C37FF579D7D962298422D767110B18B6846997A7E746F775A036907317CEF4E67'
+         '31947EE13768F1E3F44AC8BC732F29F15A66E82062F91FB9F2944B71E3F0E0EFDC13E2'
+         '2243D508935220930333EC257B693CE547CE681DAD55110317285D49CBE12456EAB916'
+         '83DDFC'],
+    48: ['30004E7BB7EFDAF98421D82F12E2C4D7FFB64F8FEC0CD530C04102CC9E8A20240EE2C2'
+         '723B0D1CAECC42DA90D59E4E7AB6279C5C05EE4E1EBB9FD6D580D228099BD3B92DADAF'
+         'BAB45A52EFA20200',
+         '30003EFF4FD132436CFC3F9F9D9E01A5B14B82C494D6EA5AE4D17873E445B2AD7CB965'
+         'EC45FB11590481718A6488BD94681A84CF9AD82C2C06180021BA3D'],
+}
+
+
+def flatten(nombre, valor_item, row):
+    # 'item.field' -> CSV text of the to_row values (sub-items by field)
+    for field, value in zip(fields(valor_item), ast.to_row(valor_item)):
+        name = f'{nombre}.{field.name}'
+        if isinstance(value, dict):
+            flatten(name, getattr(valor_item, field.name), row)
+        elif isinstance(value, list):
+            row[name] = json.dumps(value, separators=(',', ':'))
+        else:
+            row[name] = '' if value is None else str(value)
+
+
+def expected_rows(cat):
+    rows = []
+    for message in MESSAGES[cat]:
+        for block in ast.decode_message(message, verbose=False).blocks:
+            row = {}
+            for nombre in block.item_names():
+                valor_item = getattr(block, nombre)
+                if valor_item.exist:
+                    flatten(nombre, valor_item, row)
+            rows.append(row)
+    return rows
+
+
+def check_rows(csv_file, cat):
+    with open(csv_file, newline='') as file1:
+        rows = list(csv.DictReader(file1))
+    expected = expected_rows(cat)
+    assert len(rows) == len(expected)
+    for row, valores in zip(rows, expected):
+        assert set(valores) <= set(row)
+        assert {name: row[name] for name in valores} == valores
+        # Fields of absent items are empty
+        assert not any(row[name] for name in row if name not in valores)
+
+
+@pytest.mark.parametrize('cat', [21, 48])
+def test_decode_file_to_csv_matches_to_row(tmp_path, cat):
+    input_file = tmp_path / 'messages.txt'
+    input_file.write_text('\n'.join(MESSAGES[cat]) + '\n')
+    output_file = str(tmp_path / 'messages.csv')
+    ast.decode_file_to_csv(str(input_file), output_file)
+    check_rows(output_file, cat)
+
+
+@pytest.mark.parametrize('cat', [21, 48])
+def test_var_to_csv_matches_to_row(tmp_path, cat):
+    input_file = tmp_path / 'messages.txt'
+    input_file.write_text('\n'.join(MESSAGES[cat]) + '\n')
+    output_file = str(tmp_path / 'messages.csv')
+    ast.var_to_csv(output_file, ast.decode_file(str(input_file), cat))
+    check_rows(output_file, cat)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+open_indexed / RecordIndex queries on hexadecimal files with malformed lines.
+"""
+
+import logging
+import os
+
+import pytest
+
+import asterixparse as ast
+
+
+LINES = ['150066EDB7FFE759E704F539834FA5E1C8427F53F93DFB878AEF1A66C7CFE894B23E65'
+         'E5B93031221FB1DF4D468534919FBB73A0C2E16FA1517ECE582C1C5CADFA9C145C6531'
+         '412A236F6F1510B8B2B7433B402F18B29F131CC0C1C057950707A872BD85EE34',
+         '30004E7BB7EFDAF98421D82F12E2C4D7FFB64F8FEC0CD530C04102CC9E8A20240EE2C2'
+         '723B0D1CAECC42DA90D59E4E7AB6279C5C05EE4E1EBB9FD6D580D228099BD3B92DADAF'
+         'BAB45A52EFA20200',
+         '30003EFF4FD132436CFC3F9F9D9E01A5B14B82C494D6EA5AE4D17873E445B2AD7CB965'
+         'EC45FB11590481718A6488BD94681A84CF9AD82C2C06180021BA3D']
+
+BAD_LINE = 'ZZZZ not hex'
+
+
+@pytest.fixture
+def recording(tmp_path, caplog):
+    filename = tmp_path / 'bad.txt'
+    filename.write_text(''.join(line + '\n' for line in
+                                LINES[:1] + [BAD_LINE] + LINES[1:]))
+    with caplog.at_level(logging.ERROR):
+        recording = ast.open_indexed(str(filename))
+    assert 'Message not read' in caplog.text
+    return recording
+
+
+def decoded(line):
+    return ast.decode_message(line, verbose=False).blocks[0]
+
+
+def test_index_skips_malformed_line(recording):
+    assert recording is not None
+    assert os.path.exists(ast.index.index_path(recording.filename))
+    assert list(recording.cat) == [21, 48, 48]
+    offset = len(LINES[0]) + 1 + len(BAD_LINE) + 1
+    assert list(recording.block) == [0, offset, offset + len(LINES[1]) + 1]
+    reloaded = ast.index.RecordIndex.load(recording.filename)
+    assert list(reloaded.block) == list(recording.block)
+
+
+def test_query_time_range(recording):
+    messages = recording.query(time_range=(127000, 130000))
+    assert [message.cat for message in messages] == [48, 48]
+    for message, line in zip(messages, LINES[1:]):
+        assert message.blocks[0].item140.time_of_day == decoded(line).item140.time_of_day
+
+
+def test_query_aircraft(recording):
+    messages = recording.query(icao='3E65E5')
+    assert len(messages) == 1
+    assert messages[0].blocks[0].item080.target_addr == decoded(LINES[0]).item080.target_addr
+
+
+def test_query_data_source(recording):
+    messages = recording.query(cat=48, sac_sic=(67, 108))
+    assert len(messages) == 1
+    assert messages[0].blocks[0].item140.time_of_day == decoded(LINES[2]).item140.time_of_day
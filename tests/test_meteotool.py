@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+calculate_bds_meteo (vectorized) against the scalar formulas of meteotool.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("fastmeteo")
+
+from asterixparse.classesASTERIX import meteotool
+
+
+def merged_frame(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    # Last rows: times of day that round up to the next second/hour/day
+    time_rec_pos = np.r_[rng.uniform(0, 86399.99, n - 3),
+                         59.9999996, 3599.9999996, 86399.9999996]
+    return pd.DataFrame({
+        'Mach': rng.uniform(0.1, 0.9, n).round(3),
+        'TrueAirspeed': rng.integers(100, 600, n).astype(float),
+        'MagneticHeading': rng.uniform(-180, 180, n),
+        'GroundSpeed': rng.integers(100, 600, n).astype(float),
+        'TrackAngle': rng.uniform(-180, 180, n),
+        'geom_height': rng.uniform(0, 40000, n),
+        'IndicatedAirspeed': rng.integers(100, 400, n).astype(float),
+        'time_rec_pos': time_rec_pos,
+        'latitude': rng.uniform(40, 42, n),
+        'longitude': rng.uniform(-4, -2, n)})
+
+
+def scalar_meteo(df):
+    filas = []
+    for fila in df.itertuples(index=False):
+        temperature = meteotool.calculate_temperature(
+            fila.Mach, fila.TrueAirspeed, fila.geom_height, fila.IndicatedAirspeed)
+        v_tas = meteotool.calculate_v_tas(
+            fila.Mach, fila.geom_height, fila.IndicatedAirspeed, temperature)
+        wind_speed, wind_direction = meteotool.calculate_wind_vector(
+            v_tas, fila.MagneticHeading, fila.GroundSpeed, fila.TrackAngle)
+        u, v = meteotool.polar_to_cartesian(wind_speed, wind_direction)
+        filas.append((meteotool.time_format(fila.time_rec_pos), temperature,
+                      u * 0.5144444444, v * 0.5144444444))
+    return pd.DataFrame(filas, columns=['timestamp', 'temperature_BDS',
+                                        'wind_u_BDS', 'wind_v_BDS'])
+
+
+def test_calculate_bds_meteo_matches_scalar_formulas():
+    df = merged_frame()
+    assert (df['Mach'] < 0.3).any() and (df['Mach'] >= 0.3).any()
+
+    vectorized = meteotool.calculate_bds_meteo(df)
+    scalar = scalar_meteo(df)
+
+    assert len(vectorized) == len(df)
+    assert vectorized['timestamp'].tolist() == scalar['timestamp'].tolist()
+    assert vectorized['timestamp'].tolist()[-3:] == ["2019-12-20T00:01:00\n",
+                                                     "2019-12-20T01:00:00\n",
+                                                     "2019-12-20T00:00:00\n"]
+    for column in ['temperature_BDS', 'wind_u_BDS', 'wind_v_BDS']:
+        np.testing.assert_allclose(vectorized[column], scalar[column],
+                                   rtol=1e-9, atol=1e-9)
+    np.testing.assert_array_equal(vectorized['altitude'], df['geom_height'])
+    np.testing.assert_array_equal(vectorized['latitude'], df['latitude'])
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MongoSink batching, duplicate handling and retries, on a fake collection.
+"""
+
+import pytest
+
+pytest.importorskip("pymongo")
+
+from bson import ObjectId
+from pymongo.errors import AutoReconnect, BulkWriteError, OperationFailure
+
+from asterixparse.classesASTERIX.mongo import DUPLICATE_KEY, MongoSink
+
+
+class FakeCollection:
+    """
+    insert_many(ordered=False) on a dict by _id. Every call takes the next
+    scripted failure, if any:
+    - 'lost': documents inserted, then AutoReconnect (reply lost)
+    - 'down': AutoReconnect before inserting
+    - int: OperationFailure with that code before inserting
+    - dict index -> code: write errors for those documents of the call
+    """
+
+    def __init__(self, failures=()):
+        self.failures = list(failures)
+        self.documents = {}
+        self.calls = []
+
+    def insert_many(self, documents, ordered=True):
+        assert ordered is False
+        for document in documents:
+            # pymongo sets _id on the documents before sending them
+            document.setdefault('_id', ObjectId())
+        self.calls.append(len(documents))
+        failure = self.failures.pop(0) if self.failures else None
+        if failure == 'down':
+            raise AutoReconnect('connection refused')
+        if isinstance(failure, int):
+            raise OperationFailure('operation failed', code=failure)
+        codes = failure if isinstance(failure, dict) else {}
+        inserted = []
+        errors = []
+        for index, document in enumerate(documents):
+            if index in codes:
+                errors.append({'index': index, 'code': codes[index],
+                               'errmsg': f'error {codes[index]}'})
+            elif document['_id'] in self.documents:
+                errors.append({'index': index, 'code': DUPLICATE_KEY,
+                               'errmsg': 'E11000 duplicate key error'})
+            else:
+                self.documents[document['_id']] = document
+                inserted.append(document['_id'])
+        if failure == 'lost':
+            raise AutoReconnect('connection closed')
+        if errors:
+            raise BulkWriteError({'nInserted': len(inserted), 'writeErrors': errors})
+        return type('InsertManyResult', (), {'inserted_ids': inserted})()
+
+
+def documents(n):
+    return [{'item010': {'sac': 20, 'sic': i}} for i in range(n)]
+
+
+def test_documents_are_sent_in_batches():
+    collection = FakeCollection()
+    with MongoSink(collection, batch_size=3, backoff=0) as sink:
+        for document in documents(7):
+            sink.add_document(document)
+    assert collection.calls == [3, 3, 1]
+    assert sink.inserted == 7 and sink.duplicates == 0 and sink.failed == 0
+    assert len(collection.documents) == 7
+
+
+def test_existing_documents_are_counted_as_duplicates():
+    collection = FakeCollection()
+    batch = documents(4)
+    with MongoSink(collection, batch_size=10, backoff=0) as sink:
+        sink.add_document(batch[0])
+    with MongoSink(collection, batch_size=10, backoff=0) as sink:
+        for document in batch:
+            sink.add_document(document)
+    assert sink.inserted == 3 and sink.duplicates == 1 and sink.failed == 0
+    assert len(collection.documents) == 4
+
+
+def test_lost_reply_is_retried_without_inserting_twice():
+    collection = FakeCollection(['lost'])
+    with MongoSink(collection, batch_size=10, backoff=0) as sink:
+        for document in documents(5):
+            sink.add_document(document)
+    assert collection.calls == [5, 5]
+    assert sink.inserted == 5 and sink.duplicates == 0 and sink.failed == 0
+    assert len(collection.documents) == 5
+
+
+def test_connection_error_is_retried():
+    collection = FakeCollection(['down', 'down'])
+    with MongoSink(collection, batch_size=10, backoff=0) as sink:
+        for document in documents(5):
+            sink.add_document(document)
+    assert collection.calls == [5, 5, 5]
+    assert sink.inserted == 5 and sink.failed == 0
+
+
+def test_transient_write_error_retries_only_failed_documents():
+    # 91: ShutdownInProgress
+    collection = FakeCollection([{1: 91, 3: 91}])
+    with MongoSink(collection, batch_size=10, backoff=0) as sink:
+        for document in documents(5):
+            sink.add_document(document)
+    assert collection.calls == [5, 2]
+    assert sink.inserted == 5 and sink.failed == 0
+
+
+def test_permanent_errors_are_not_retried():
+    # 121: DocumentValidationFailure
+    collection = FakeCollection([{2: 121}, 121])
+    with MongoSink(collection, batch_size=5, backoff=0) as sink:
+        for document in documents(10):
+            sink.add_document(document)
+    assert collection.calls == [5, 5]
+    assert sink.inserted == 4 and sink.failed == 6
+
+
+def test_transient_errors_fail_after_the_retries():
+    collection = FakeCollection(['down'] * 3)
+    with MongoSink(collection, batch_size=10, retries=2, backoff=0) as sink:
+        for document in documents(5):
+            sink.add_document(document)
+    assert collection.calls == [5, 5, 5]
+    assert sink.inserted == 0 and sink.failed == 5
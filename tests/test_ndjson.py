@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+NDJSON output (decode_file_to_json, dump_all_to_json) read back with iter_ndjson.
+"""
+
+import json
+from dataclasses import asdict
+
+import asterixparse as ast
+
+
+MESSAGES = [
+    '150066EDB7FFE759E704F539834FA5E1C8427F53F93DFB878AEF1A66C7CFE894B23E65'
+    'E5B93031221FB1DF4D468534919FBB73A0C2E16FA1517ECE582C1C5CADFA9C145C6531'
+    '412A236F6F1510B8B2B7433B402F18B29F131CC0C1C057950707A872BD85EE34',
+    '15006C37FF579D7D962298422D767110B18B6846997A7E746F775A036907317CEF4E67'
+    '31947EE13768F1E3F44AC8BC732F29F15A66E82062F91FB9F2944B71E3F0E0EFDC13E2'
+    '2243D508935220930333EC257B693CE547CE681DAD55110317285D49CBE12456EAB916'
+    '83DDFC',
+]
+
+
+def expected_records():
+    records = []
+    for message in MESSAGES:
+        for block in ast.decode_message(message, verbose=False).blocks:
+            record = {}
+            for nombre in block.item_names():
+                valor_item = getattr(block, nombre)
+                record[nombre] = asdict(valor_item) if valor_item.exist else None
+            # Same types as read back (tuples -> lists...)
+            records.append(json.loads(json.dumps(record)))
+    return records
+
+
+def write_hex(tmp_path):
+    input_file = tmp_path / 'messages.txt'
+    input_file.write_text('\n'.join(MESSAGES) + '\n')
+    return str(input_file)
+
+
+def test_decode_file_to_json_round_trip(tmp_path):
+    output_file = str(tmp_path / 'messages.json')
+    ast.decode_file_to_json(write_hex(tmp_path), output_file)
+
+    with open(output_file, encoding='utf-8') as file1:
+        lines = file1.read().splitlines()
+    records = expected_records()
+    assert len(lines) == len(records)
+    assert [json.loads(line) for line in lines] == records
+    assert list(ast.iter_ndjson(output_file)) == records
+
+
+def test_append_adds_records(tmp_path):
+    input_file = write_hex(tmp_path)
+    output_file = str(tmp_path / 'messages.json')
+    ast.decode_file_to_json(input_file, output_file)
+    ast.decode_file_to_json(input_file, output_file, append=True)
+    assert list(ast.iter_ndjson(output_file)) == expected_records() * 2
+
+
+def test_dump_all_to_json_matches_decode_file_to_json(tmp_path):
+    input_file = write_hex(tmp_path)
+    decoded = str(tmp_path / 'decoded.json')
+    dumped = str(tmp_path / 'dumped.json')
+    ast.decode_file_to_json(input_file, decoded)
+    ast.dump_all_to_json(dumped, ast.decode_file(input_file, 21))
+    with open(decoded, 'rb') as file1, open(dumped, 'rb') as file2:
+        assert file1.read() == file2.read()
+
+
+def test_iter_ndjson_reads_json_arrays(tmp_path):
+    records = expected_records()
+    output_file = tmp_path / 'old.json'
+    output_file.write_text(json.dumps(records, indent=8))
+    assert list(ast.iter_ndjson(str(output_file))) == records
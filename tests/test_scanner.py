@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+scan_file on hexadecimal files with malformed lines.
+"""
+
+import logging
+
+import numpy as np
+
+import asterixparse as ast
+
+
+LINES = ['150066EDB7FFE759E704F539834FA5E1C8427F53F93DFB878AEF1A66C7CFE894B23E65'
+         'E5B93031221FB1DF4D468534919FBB73A0C2E16FA1517ECE582C1C5CADFA9C145C6531'
+         '412A236F6F1510B8B2B7433B402F18B29F131CC0C1C057950707A872BD85EE34',
+         '30004E7BB7EFDAF98421D82F12E2C4D7FFB64F8FEC0CD530C04102CC9E8A20240EE2C2'
+         '723B0D1CAECC42DA90D59E4E7AB6279C5C05EE4E1EBB9FD6D580D228099BD3B92DADAF'
+         'BAB45A52EFA20200',
+         '30003EFF4FD132436CFC3F9F9D9E01A5B14B82C494D6EA5AE4D17873E445B2AD7CB965'
+         'EC45FB11590481718A6488BD94681A84CF9AD82C2C06180021BA3D']
+
+BAD_LINE = 'ZZZZ not hex'
+
+
+def write_lines(path, lines):
+    path.write_text(''.join(line + '\n' for line in lines))
+    return str(path)
+
+
+def line_offsets(lines):
+    return np.cumsum([0] + [len(line) + 1 for line in lines[:-1]])
+
+
+def test_scan_file_skips_malformed_line(tmp_path, caplog):
+    lines = LINES[:1] + [BAD_LINE] + LINES[1:]
+    with caplog.at_level(logging.ERROR):
+        records = ast.scan_file(write_lines(tmp_path / 'bad.txt', lines))
+    expected = ast.scan_file(write_lines(tmp_path / 'good.txt', LINES))
+
+    assert records is not None
+    assert len(records['cat']) == len(LINES)
+    assert list(records['cat']) == [21, 48, 48]
+    for field in ('position', 'length', 'cat', 'fspec'):
+        assert np.array_equal(records[field], expected[field]), field
+    offsets = line_offsets(lines)
+    assert list(records['block']) == [offsets[0], offsets[2], offsets[3]]
+    assert 'Message not read' in caplog.text
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+to_dict / to_row against dataclasses.asdict on decoded CAT21 and CAT48 records.
+"""
+
+from dataclasses import asdict
+
+import pytest
+
+import asterixparse as ast
+
+
+MESSAGES = {
+    21: ['150066EDB7FFE759E704F539834FA5E1C8427F53F93DFB878AEF1A66C7CFE894B23E65'
+         'E5B93031221FB1DF4D468534919FBB73A0C2E16FA1517ECE582C1C5CADFA9C145C6531'
+         '412A236F6F1510B8B2B7433B402F18B29F131CC0C1C057950707A872BD85EE34',
+         '15006C37FF579D7D962298422D767110B18B6846997A7E746F775A036907317CEF4E67'
+         '31947EE13768F1E3F44AC8BC732F29F15A66E82062F91FB9F2944B71E3F0E0EFDC13E2'
+         '2243D508935220930333EC257B693CE547CE681DAD55110317285D49CBE12456EAB916'
+         '83DDFC'],
+    48: ['30004E7BB7EFDAF98421D82F12E2C4D7FFB64F8FEC0CD530C04102CC9E8A20240EE2C2'
+         '723B0D1CAECC42DA90D59E4E7AB6279C5C05EE4E1EBB9FD6D580D228099BD3B92DADAF'
+         'BAB45A52EFA20200',
+         '30003EFF4FD132436CFC3F9F9D9E01A5B14B82C494D6EA5AE4D17873E445B2AD7CB965'
+         'EC45FB11590481718A6488BD94681A84CF9AD82C2C06180021BA3D'],
+}
+
+
+def present_items(message):
+    message_asterix = ast.decode_message(message, verbose=False)
+    assert message_asterix.blocks
+    for block in message_asterix.blocks:
+        for nombre, length in type(block).UAP:
+            valor_item = getattr(block, nombre)
+            if valor_item.exist:
+                yield nombre, valor_item
+
+
+@pytest.mark.parametrize('cat, message', [(cat, message) for cat in MESSAGES
+                                          for message in MESSAGES[cat]])
+def test_to_dict_and_to_row_match_asdict(cat, message):
+    assert int(message[:2], 16) == cat
+    nombres = []
+    for nombre, valor_item in present_items(message):
+        expected = asdict(valor_item)
+        assert ast.to_dict(valor_item) == expected, nombre
+        assert ast.to_row(valor_item) == tuple(expected.values()), nombre
+        nombres.append(nombre)
+    assert len(nombres) > 10
+
+
+@pytest.mark.parametrize('message', [MESSAGES[21][1], MESSAGES[48][0]])
+def test_to_dict_returns_new_lists(message):
+    valor_item = dict(present_items(message))['item250']
+    assert valor_item.blocks
+    valores = ast.to_dict(valor_item)
+    assert valores['blocks'] is not valor_item.blocks
+    valores['blocks'].clear()
+    assert valores != asdict(valor_item)